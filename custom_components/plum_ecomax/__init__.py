@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from contextlib import suppress
-from dataclasses import asdict, dataclass, replace
+import asyncio
+from collections.abc import Callable, Mapping
+from copy import deepcopy
+from dataclasses import asdict, dataclass, field, replace
 import logging
-from typing import Final, cast
+from operator import attrgetter
+from typing import Any, Final, cast
 
 from homeassistant.components.network import async_get_source_ip
 from homeassistant.components.network.const import IPV4_BROADCAST_ADDR
@@ -20,16 +23,20 @@ from homeassistant.const import (
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType
 from pyplumio import AsyncProtocol
+from pyplumio.devices import PhysicalDevice
 from pyplumio.filters import custom, delta
 from pyplumio.structures.alerts import ATTR_ALERTS, Alert
 
 from .connection import (
     DEFAULT_TIMEOUT,
     EcomaxConnection,
+    async_claim_connection,
     async_get_connection_handler,
     async_get_sub_devices,
+    async_is_connection_handed_off,
     async_resolve_host_name,
 )
 from .const import (
@@ -40,17 +47,27 @@ from .const import (
     CONF_CAPABILITIES,
     CONF_CONNECTION_TYPE,
     CONF_HOST,
+    CONF_MIGRATED,
     CONF_PRODUCT_ID,
     CONF_PRODUCT_TYPE,
     CONF_SOFTWARE,
     CONF_SUB_DEVICES,
+    CONF_UID,
     CONNECTION_TYPE_TCP,
     DEFAULT_CONNECTION_TYPE,
     DOMAIN,
     EVENT_PLUM_ECOMAX_ALERT,
     DeviceType,
 )
+from .custom_entities import (
+    CustomEntities,
+    CustomEntityFactory,
+    CustomEntityPlatform,
+    get_changed_custom_entities,
+)
+from .cycles import BurnerCycles, RuntimeCounters
 from .services import async_setup_services
+from .storage import MeterStore, RegdataSchemaStore
 
 PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
@@ -76,6 +93,38 @@ class PlumEcomaxData:
     """Represents and Plum ecoMAX config data."""
 
     connection: EcomaxConnection
+    custom_entities: CustomEntities = field(default_factory=CustomEntities)
+    custom_entity_platforms: dict[Platform, CustomEntityPlatform] = field(
+        default_factory=dict
+    )
+    options: dict[str, Any] = field(default_factory=dict)
+
+    async def async_setup_custom_entities(
+        self,
+        platform: Platform,
+        factory: CustomEntityFactory,
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        """Set up custom entities for the platform."""
+        custom_entity_platform = CustomEntityPlatform(factory, async_add_entities)
+        self.custom_entity_platforms[platform] = custom_entity_platform
+        await custom_entity_platform.async_setup()
+
+    async def async_reload_custom_entities(self, options: Mapping[str, Any]) -> bool:
+        """Reload changed custom entities without reconnecting.
+
+        Returns False if options other than custom entities were changed.
+        """
+        changed = get_changed_custom_entities(self.options, options)
+        if changed is None or not changed.keys() <= self.custom_entity_platforms.keys():
+            return False
+
+        self.options = deepcopy(dict(options))
+        self.custom_entities = CustomEntities.from_options(options)
+        for platform, keys in changed.items():
+            await self.custom_entity_platforms[platform].async_reload(keys)
+
+        return True
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -87,11 +136,15 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 async def async_setup_entry(hass: HomeAssistant, entry: PlumEcomaxConfigEntry) -> bool:
     """Set up the Plum ecoMAX from a config entry."""
     connection_type = entry.data.get(CONF_CONNECTION_TYPE, DEFAULT_CONNECTION_TYPE)
-    handler = await async_get_connection_handler(connection_type, entry.data)
+    handler = async_claim_connection(hass, entry.data[CONF_UID])
+    connect = handler is None
+    if handler is None:
+        handler = await async_get_connection_handler(connection_type, entry.data)
+
     connection = EcomaxConnection(hass, entry, connection=handler)
 
     try:
-        await connection.async_setup()
+        await connection.async_setup(connect=connect)
     except TimeoutError as e:
         await connection.async_close()
         raise ConfigEntryNotReady(
@@ -100,7 +153,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: PlumEcomaxConfigEntry) -
             translation_placeholders={"connection": connection.name},
         ) from e
 
-    entry.runtime_data = PlumEcomaxData(connection)
+    entry.runtime_data = PlumEcomaxData(
+        connection,
+        CustomEntities.from_options(entry.options),
+        options=deepcopy(dict(entry.options)),
+    )
 
     async def _async_update_network_info() -> None:
         """Update network info on the controller screen."""
@@ -136,9 +193,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: PlumEcomaxConfigEntry) -
 
     async_setup_events(hass, connection)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
     return True
 
 
+async def async_update_options(
+    hass: HomeAssistant, entry: PlumEcomaxConfigEntry
+) -> None:
+    """Handle options update."""
+    if not await entry.runtime_data.async_reload_custom_entities(entry.options):
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+
+
 @callback
 def async_setup_events(hass: HomeAssistant, connection: EcomaxConnection) -> bool:
     """Set up the ecoMAX events."""
@@ -165,8 +231,11 @@ def async_setup_events(hass: HomeAssistant, connection: EcomaxConnection) -> boo
 
             hass.bus.async_fire(EVENT_PLUM_ECOMAX_ALERT, event_data)
 
-    connection.device.subscribe(
-        ATTR_ALERTS, custom(delta(_async_dispatch_alert_events), bool)
+    connection.subscriptions.subscribe(
+        connection,
+        connection.device,
+        ATTR_ALERTS,
+        custom(delta(_async_dispatch_alert_events), bool),
     )
     return True
 
@@ -174,53 +243,131 @@ def async_setup_events(hass: HomeAssistant, connection: EcomaxConnection) -> boo
 async def async_unload_entry(hass: HomeAssistant, entry: PlumEcomaxConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        await entry.runtime_data.connection.close()
+        connection = entry.runtime_data.connection
+        connection.subscriptions.release_all(connection)
+        if async_is_connection_handed_off(hass, connection.handler):
+            await connection.cycles.async_stop()
+            await connection.runtimes.async_stop()
+        else:
+            await connection.async_close()
 
     return unload_ok
 
 
-async def async_migrate_entry(
-    hass: HomeAssistant, entry: PlumEcomaxConfigEntry
-) -> bool:
-    """Migrate old entry."""
-    _LOGGER.debug("Migrating from version %s", entry.version)
+async def async_remove_entry(hass: HomeAssistant, entry: PlumEcomaxConfigEntry) -> None:
+    """Remove persistent data of a config entry."""
+    await BurnerCycles(hass, entry.entry_id).async_remove()
+    await RuntimeCounters(hass, entry.entry_id).async_remove()
+    await MeterStore(hass, entry.entry_id).async_remove()
+    await RegdataSchemaStore(hass, entry.entry_id).async_remove()
+
+
+@dataclass(frozen=True, slots=True)
+class MigratedField:
+    """Represents a config entry field that is fetched during migration."""
+
+    version: int
+    key: str
+    source: str
+    convert: Callable[[Any], Any]
+
 
+MIGRATED_FIELDS: Final[tuple[MigratedField, ...]] = (
+    # Product type was added in version 3.
+    MigratedField(3, CONF_PRODUCT_TYPE, ATTR_PRODUCT, attrgetter("type")),
+    # Capabilities key was renamed to sub_devices in version 5.
+    MigratedField(5, CONF_SUB_DEVICES, CONF_SUB_DEVICES, list),
+    # Product id was added in version 7.
+    MigratedField(7, CONF_PRODUCT_ID, ATTR_PRODUCT, attrgetter("id")),
+    # Software versions were added in version 8.
+    MigratedField(8, CONF_SOFTWARE, ATTR_MODULES, asdict),
+)
+
+
+async def _async_read_migration_source(device: PhysicalDevice, source: str) -> Any:
+    """Read the migration source from the device."""
+    if source == CONF_SUB_DEVICES:
+        return await async_get_sub_devices(device)
+
+    return await device.get(source, timeout=DEFAULT_TIMEOUT)
+
+
+async def _async_fetch_migrated_fields(
+    hass: HomeAssistant, entry: PlumEcomaxConfigEntry, fields: list[MigratedField]
+) -> dict[str, Any]:
+    """Fetch the migrated fields from the device.
+
+    Each source is read once and all sources are read concurrently.
+    Fields whose source has failed to respond in time are left out.
+    """
     connection_type = entry.data.get(CONF_CONNECTION_TYPE, DEFAULT_CONNECTION_TYPE)
     handler = await async_get_connection_handler(connection_type, entry.data)
     connection = EcomaxConnection(hass, entry, connection=handler)
     await connection.connect()
-    data = dict(entry.data)
-
     try:
         device = await connection.get(DeviceType.ECOMAX, timeout=DEFAULT_TIMEOUT)
+        sources = list(
+            dict.fromkeys(migrated_field.source for migrated_field in fields)
+        )
+        results = await asyncio.gather(
+            *(_async_read_migration_source(device, source) for source in sources),
+            return_exceptions=True,
+        )
+    except TimeoutError:
+        return {}
+    finally:
+        await connection.close()
 
-        if entry.version < 3:
-            # Product type was added in version 3.
-            product = await device.get(ATTR_PRODUCT, timeout=DEFAULT_TIMEOUT)
-            data[CONF_PRODUCT_TYPE] = product.type
+    values = dict(zip(sources, results, strict=True))
+    fetched: dict[str, Any] = {}
+    for migrated_field in fields:
+        value = values[migrated_field.source]
+        if isinstance(value, TimeoutError):
+            _LOGGER.debug("Timed out while fetching '%s'", migrated_field.source)
+            continue
 
-        if entry.version < 5:
-            # Capabilities key was renamed to sub_devices in version 5.
-            with suppress(KeyError):
-                del data[CONF_CAPABILITIES]
+        if isinstance(value, BaseException):
+            raise value
 
-            data[CONF_SUB_DEVICES] = await async_get_sub_devices(device)
+        fetched[migrated_field.key] = migrated_field.convert(value)
 
-        if entry.version < 7:
-            # Product id was added in version 7.
-            product = await device.get(ATTR_PRODUCT, timeout=DEFAULT_TIMEOUT)
-            data[CONF_PRODUCT_ID] = product.id
+    return fetched
 
-        if entry.version < 8:
-            # Software versions were added in version 8.
-            modules = await device.get(ATTR_MODULES, timeout=DEFAULT_TIMEOUT)
-            data[CONF_SOFTWARE] = asdict(modules)
 
-        hass.config_entries.async_update_entry(entry, data=data, version=8)
-        await connection.close()
-        _LOGGER.info("Migration to version %s successful", entry.version)
-    except TimeoutError:
-        _LOGGER.error("Migration failed, device has failed to respond in time")
-        return False
+async def async_migrate_entry(
+    hass: HomeAssistant, entry: PlumEcomaxConfigEntry
+) -> bool:
+    """Migrate old entry.
 
+    Fields fetched by the failed migration are stored along with their
+    keys, so the retried migration only fetches missing fields.
+    """
+    _LOGGER.debug("Migrating from version %s", entry.version)
+
+    data = dict(entry.data)
+    migrated: list[str] = data.pop(CONF_MIGRATED, [])
+    if entry.version < 5:
+        # Capabilities key was renamed to sub_devices in version 5.
+        data.pop(CONF_CAPABILITIES, None)
+
+    if fields := [
+        migrated_field
+        for migrated_field in MIGRATED_FIELDS
+        if entry.version < migrated_field.version and migrated_field.key not in migrated
+    ]:
+        fetched = await _async_fetch_migrated_fields(hass, entry, fields)
+        data.update(fetched)
+        if len(fetched) < len(fields):
+            data[CONF_MIGRATED] = [*migrated, *fetched]
+            hass.config_entries.async_update_entry(entry, data=data)
+            _LOGGER.error(
+                "Migration failed, device has failed to respond in time. "
+                "Fetched %d of %d values, remaining will be fetched on retry",
+                len(fetched),
+                len(fields),
+            )
+            return False
+
+    hass.config_entries.async_update_entry(entry, data=data, version=8)
+    _LOGGER.info("Migration to version %s successful", entry.version)
     return True
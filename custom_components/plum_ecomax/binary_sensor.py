@@ -132,7 +132,7 @@ class EcomaxBinarySensor(EcomaxEntity, BinarySensorEntity):
     async def async_update(self, value: Any) -> None:
         """Update entity state."""
         self._attr_is_on = self.entity_description.value_fn(value)
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed()
 
 
 @callback
@@ -251,13 +251,6 @@ class RegdataBinarySensorEntityDescription(EcomaxBinarySensorEntityDescription):
 class RegdataBinarySensor(RegdataEntity, EcomaxBinarySensor):
     """Represents a regulator data binary sensor."""
 
-    async def async_update(self, regdata: dict[int, Any]) -> None:
-        """Update entity state."""
-        self._attr_is_on = self.entity_description.value_fn(
-            regdata.get(self._regdata_key, None)
-        )
-        self.async_write_ha_state()
-
 
 @callback
 def async_setup_custom_regdata_binary_sensors(
@@ -318,6 +311,33 @@ def async_setup_custom_thermostat_binary_sensors(
     ]
 
 
+async def async_setup_custom_binary_sensors(
+    connection: EcomaxConnection, config_entry: PlumEcomaxConfigEntry
+) -> list[EcomaxBinarySensor]:
+    """Set up the custom binary sensors."""
+    entities = async_setup_custom_ecomax_binary_sensors(connection, config_entry)
+
+    # Add custom regulator data binary sensors.
+    if (
+        regdata_entities := async_setup_custom_regdata_binary_sensors(
+            connection, config_entry
+        )
+    ) and await connection.async_setup_regdata():
+        entities += regdata_entities
+
+    # Add custom mixer/circuit binary sensors.
+    if connection.has_mixers and await connection.async_setup_mixers():
+        entities += async_setup_custom_mixer_binary_sensors(connection, config_entry)
+
+    # Add custom thermostat binary sensors.
+    if connection.has_thermostats and await connection.async_setup_thermostats():
+        entities += async_setup_custom_thermostat_binary_sensors(
+            connection, config_entry
+        )
+
+    return entities
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: PlumEcomaxConfigEntry,
@@ -329,23 +349,16 @@ async def async_setup_entry(
     connection = entry.runtime_data.connection
     entities = async_setup_ecomax_binary_sensors(connection)
 
-    # Add custom ecoMAX binary sensors.
-    entities += async_setup_custom_ecomax_binary_sensors(connection, entry)
-
-    # Add custom regulator data binary sensors.
-    if (
-        regdata_entities := async_setup_custom_regdata_binary_sensors(connection, entry)
-    ) and await connection.async_setup_regdata():
-        entities += regdata_entities
-
     # Add mixer/circuit binary sensors.
     if connection.has_mixers and await connection.async_setup_mixers():
         entities += async_setup_mixer_binary_sensors(connection)
-        entities += async_setup_custom_mixer_binary_sensors(connection, entry)
-
-    # Add thermostat binary sensors.
-    if connection.has_thermostats and await connection.async_setup_thermostats():
-        entities += async_setup_custom_thermostat_binary_sensors(connection, entry)
 
     async_add_entities(entities)
+
+    # Add custom binary sensors.
+    await entry.runtime_data.async_setup_custom_entities(
+        Platform.BINARY_SENSOR,
+        partial(async_setup_custom_binary_sensors, connection, entry),
+        async_add_entities,
+    )
     return True
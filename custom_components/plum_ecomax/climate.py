@@ -25,7 +25,10 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from pyplumio.filters import Filter, deadband, on_change, throttle
+from pyplumio.helpers.event_manager import EventCallback
 from pyplumio.parameters.thermostat import ThermostatNumber
+from pyplumio.structures.sensor_data import ATTR_THERMOSTAT_SENSORS
+from pyplumio.structures.thermostat_parameters import ATTR_THERMOSTAT_PARAMETERS
 
 from . import PlumEcomaxConfigEntry
 from .connection import EcomaxConnection
@@ -93,7 +96,8 @@ class EcomaxClimate(ThermostatEntity, ClimateEntity):
     _attr_target_temperature_name: str | None = None
     _attr_target_temperature_step = TEMPERATURE_STEP
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
-    _callbacks: dict[str, Filter]
+    _filters: dict[str, EventCallback]
+    _handlers: dict[str, Filter]
     entity_description: EcomaxClimateEntityDescription
 
     def __init__(
@@ -103,16 +107,19 @@ class EcomaxClimate(ThermostatEntity, ClimateEntity):
         index: int,
     ):
         """Initialize a new ecoMAX climate entity."""
-        self._callbacks = {
-            "mode": on_change(self.async_update_preset_mode),
-            "state": on_change(self.async_update_preset_mode),
-            "contacts": on_change(self.async_update_hvac_action),
+        self._handlers = {
+            "mode": on_change(self._async_set_preset_mode),
+            "state": on_change(self._async_set_preset_mode),
+            "contacts": on_change(self._async_set_hvac_action),
             "current_temp": throttle(
-                deadband(self.async_update, tolerance=DEFAULT_TOLERANCE),
+                deadband(
+                    self._async_set_current_temperature, tolerance=DEFAULT_TOLERANCE
+                ),
                 seconds=UPDATE_INTERVAL,
             ),
-            "target_temp": on_change(self.async_update_target_temperature),
+            "target_temp": on_change(self._async_set_target_temperature),
         }
+        self._filters = dict(self._handlers)
         self.index = index
         super().__init__(connection, description)
 
@@ -120,31 +127,43 @@ class EcomaxClimate(ThermostatEntity, ClimateEntity):
         """Set new target temperature."""
         temperature = round(kwargs[ATTR_TEMPERATURE], 1)
         target_temperature_name = cast(str, self.target_temperature_name)
-        self.device.set_nowait(target_temperature_name, temperature)
-        self._attr_target_temperature = temperature
-        self.async_write_ha_state()
+        async with self.async_write_parameter(
+            target_temperature_name, temperature, "_attr_target_temperature"
+        ):
+            self._attr_target_temperature = temperature
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
         mode = HA_TO_EM_MODE[preset_mode]
-        self.device.set_nowait(ATTR_MODE, mode)
-        self._attr_preset_mode = preset_mode
-        await self._async_update_target_temperature_attributes()
-        self.async_write_ha_state()
-
-    async def async_update(self, value: float) -> None:
-        """Update entity state."""
+        async with self.async_write_parameter(
+            ATTR_MODE,
+            mode,
+            "_attr_preset_mode",
+            "_attr_target_temperature_name",
+            "_attr_min_temp",
+            "_attr_max_temp",
+        ):
+            self._attr_preset_mode = preset_mode
+            await self._async_update_target_temperature_attributes()
+
+    async def async_update(self, _: Any = None) -> None:
+        """Update entity state from the thermostat frame."""
+        if await self._async_run_handlers(self._filters):
+            self.async_write_ha_state()
+
+    async def _async_set_current_temperature(self, value: float) -> bool:
+        """Set current temperature."""
         self._attr_current_temperature = value
-        self.async_write_ha_state()
+        return True
 
-    async def async_update_target_temperature(self, value: float) -> None:
-        """Update target temperature."""
+    async def _async_set_target_temperature(self, value: float) -> bool:
+        """Set target temperature."""
         self._attr_target_temperature = value
         await self._async_update_target_temperature_attributes(value)
-        self.async_write_ha_state()
+        return True
 
-    async def async_update_preset_mode(self, mode: ThermostatNumber | int) -> None:
-        """Update preset mode."""
+    async def _async_set_preset_mode(self, mode: ThermostatNumber | int) -> bool:
+        """Set preset mode."""
         if isinstance(mode, ThermostatNumber):
             mode = int(mode.value)
 
@@ -153,29 +172,26 @@ class EcomaxClimate(ThermostatEntity, ClimateEntity):
         except KeyError:
             # Ignore unknown preset and warn about it in the log.
             _LOGGER.error("Unknown climate preset %d.", mode)
-            return
+            return False
 
         self._attr_preset_mode = preset_mode
         await self._async_update_target_temperature_attributes()
-        self.async_write_ha_state()
+        return True
 
-    async def async_update_hvac_action(self, value: bool) -> None:
-        """Update HVAC action."""
+    async def _async_set_hvac_action(self, value: bool) -> bool:
+        """Set HVAC action."""
         self._attr_hvac_action = HVACAction.HEATING if value else HVACAction.IDLE
-        self.async_write_ha_state()
+        return True
 
     async def async_added_to_hass(self) -> None:
-        """Subscribe to thermostat events."""
-        for name, handler in self._callbacks.items():
-            if name in self.device.data:
-                await handler(self.device.data[name])
-
-            self.device.subscribe(name, handler)
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Unsubscribe from thermostat events."""
-        for name, handler in self._callbacks.items():
-            self.device.unsubscribe(name, handler)
+        """Subscribe to thermostat frames."""
+        self._filters = {
+            name: self.async_economy_filter(handler, name)
+            for name, handler in self._handlers.items()
+        }
+        await self.async_update()
+        self.async_subscribe(ATTR_THERMOSTAT_SENSORS, self.async_update)
+        self.async_subscribe(ATTR_THERMOSTAT_PARAMETERS, self.async_update)
 
     async def _async_update_target_temperature_attributes(
         self, target_temp: float | None = None
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Mapping
+from bisect import insort
+from collections.abc import Collection, Mapping
+from contextlib import suppress
 from copy import deepcopy
-from dataclasses import asdict
-from functools import cache
+from dataclasses import asdict, dataclass, field
+from functools import cache, cached_property
+from ipaddress import IPv4Network
 import logging
 from typing import Any, cast, overload
 
@@ -27,7 +30,7 @@ from homeassistant.config_entries import (
     ConfigEntry,
     ConfigFlow,
     ConfigFlowResult,
-    OptionsFlowWithReload,
+    OptionsFlow,
 )
 from homeassistant.const import (
     CONF_BASE,
@@ -39,6 +42,7 @@ from homeassistant.const import (
     UnitOfTime,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.data_entry_flow import AbortFlow
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er, selector
 import homeassistant.helpers.config_validation as cv
@@ -46,31 +50,47 @@ from pyplumio.connection import Connection
 from pyplumio.const import ProductType
 from pyplumio.devices import LogicalDevice, PhysicalDevice
 from pyplumio.exceptions import ConnectionFailedError
-from pyplumio.parameters import Number, Numeric, State, Switch, UnitOfMeasurement
+from pyplumio.parameters import (
+    Number,
+    Numeric,
+    Parameter,
+    State,
+    Switch,
+    UnitOfMeasurement,
+)
 from pyplumio.structures.product_info import ProductInfo
 from pyplumio.structures.sensor_data import ConnectedModules
 import voluptuous as vol
 
 from .connection import (
     DEFAULT_TIMEOUT,
+    SCAN_MIN_PREFIX,
     EcomaxConnection,
+    async_detect_baudrate,
     async_get_connection_handler,
+    async_get_scan_networks,
     async_get_sub_devices,
+    async_handoff_connection,
+    async_scan_hosts,
 )
 from .const import (
+    ATTR_ECONOMY,
     ATTR_ENTITIES,
     ATTR_MIXERS,
     ATTR_MODULES,
     ATTR_PRODUCT,
     ATTR_REGDATA,
     ATTR_THERMOSTATS,
+    BAUDRATE_AUTO,
     BAUDRATES,
     CONF_BAUDRATE,
     CONF_CONNECTION_TYPE,
     CONF_DEVICE,
+    CONF_ENABLED,
     CONF_HOST,
     CONF_KEY,
     CONF_MODEL,
+    CONF_NETWORK,
     CONF_PORT,
     CONF_PRODUCT_ID,
     CONF_PRODUCT_TYPE,
@@ -78,12 +98,15 @@ from .const import (
     CONF_SOURCE_DEVICE,
     CONF_STEP,
     CONF_SUB_DEVICES,
+    CONF_TOLERANCE,
     CONF_UID,
     CONF_UPDATE_INTERVAL,
     CONNECTION_TYPE_SERIAL,
     CONNECTION_TYPE_TCP,
     DEFAULT_BAUDRATE,
     DEFAULT_DEVICE,
+    DEFAULT_ECONOMY_TOLERANCE,
+    DEFAULT_ECONOMY_UPDATE_INTERVAL,
     DEFAULT_PORT,
     DOMAIN,
     LOGICAL_DEVICES,
@@ -102,11 +125,16 @@ STEP_TCP_DATA_SCHEMA = vol.Schema(
 STEP_SERIAL_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_DEVICE, default=DEFAULT_DEVICE): cv.string,
-        vol.Optional(CONF_BAUDRATE, default=DEFAULT_BAUDRATE): vol.In(BAUDRATES),
+        vol.Optional(CONF_BAUDRATE, default=DEFAULT_BAUDRATE): vol.In(
+            (BAUDRATE_AUTO, *BAUDRATES)
+        ),
     }
 )
 
 
+STEP_SCAN_DATA_SCHEMA = vol.Schema({vol.Optional(CONF_NETWORK): cv.string})
+
+
 async def validate_input(connection_type: str, data: Mapping[str, Any]) -> Connection:
     """Validate the user input allows us to connect.
 
@@ -124,6 +152,41 @@ async def validate_input(connection_type: str, data: Mapping[str, Any]) -> Conne
     return connection
 
 
+async def detect_baudrate(device: str) -> str:
+    """Detect the baudrate of the serial device."""
+    try:
+        baudrate = await async_detect_baudrate(device)
+    except ConnectionFailedError as connection_failure:
+        raise CannotConnect from connection_failure
+
+    if baudrate is None:
+        raise BaudrateNotDetected
+
+    return baudrate
+
+
+async def get_scan_networks(
+    hass: HomeAssistant, value: str | None = None
+) -> list[IPv4Network]:
+    """Return networks to scan for RS-485 to TCP converters.
+
+    Networks of the Home Assistant network adapters are used, if
+    network is not provided by the user.
+    """
+    if not value:
+        return await async_get_scan_networks(hass)
+
+    try:
+        network = IPv4Network(value, strict=False)
+    except ValueError as validation_failure:
+        raise InvalidNetwork from validation_failure
+
+    if network.prefixlen < SCAN_MIN_PREFIX:
+        raise NetworkTooLarge
+
+    return [network]
+
+
 class PlumEcomaxFlowHandler(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Plum ecoMAX integration."""
 
@@ -131,7 +194,7 @@ class PlumEcomaxFlowHandler(ConfigFlow, domain=DOMAIN):
 
     @staticmethod
     @callback
-    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlowWithReload:
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
         """Create the options flow."""
         return OptionsFlowHandler()
 
@@ -139,9 +202,11 @@ class PlumEcomaxFlowHandler(ConfigFlow, domain=DOMAIN):
         """Initialize a new config flow."""
         self.connection: Connection | None = None
         self.device: PhysicalDevice | None = None
-        self.discover_task: asyncio.Task | None = None
         self.identify_task: asyncio.Task | None = None
+        self.scan_task: asyncio.Task[list[str]] | None = None
         self._data: dict[str, Any] = {}
+        self._hosts: list[str] = []
+        self._networks: list[IPv4Network] = []
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -149,7 +214,7 @@ class PlumEcomaxFlowHandler(ConfigFlow, domain=DOMAIN):
         """Handle initial step."""
         return self.async_show_menu(
             step_id="user",
-            menu_options=["tcp", "serial"],
+            menu_options=["tcp", "serial", "scan"],
         )
 
     async def async_step_tcp(
@@ -179,6 +244,87 @@ class PlumEcomaxFlowHandler(ConfigFlow, domain=DOMAIN):
             step_id="tcp", data_schema=STEP_TCP_DATA_SCHEMA, errors=errors
         )
 
+    async def async_step_scan(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle network scan setup."""
+        if user_input is None:
+            return self.async_show_form(
+                step_id="scan", data_schema=STEP_SCAN_DATA_SCHEMA
+            )
+
+        errors: dict[str, str] = {}
+
+        try:
+            self._networks = await get_scan_networks(
+                self.hass, user_input.get(CONF_NETWORK, None)
+            )
+            return await self.async_step_scan_network()
+        except InvalidNetwork:
+            errors[CONF_NETWORK] = "invalid_network"
+        except NetworkTooLarge:
+            errors[CONF_NETWORK] = "network_too_large"
+
+        return self.async_show_form(
+            step_id="scan", data_schema=STEP_SCAN_DATA_SCHEMA, errors=errors
+        )
+
+    async def async_step_scan_network(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Scan the network for RS-485 to TCP converters."""
+        if not self.scan_task:
+            configured_hosts = {
+                entry.data.get(CONF_HOST, None)
+                for entry in self._async_current_entries()
+            }
+            self.scan_task = self.hass.async_create_task(
+                async_scan_hosts(
+                    host
+                    for network in self._networks
+                    for host in map(str, network.hosts())
+                    if host not in configured_hosts
+                ),
+                eager_start=False,
+            )
+
+        if not self.scan_task.done():
+            return self.async_show_progress(
+                step_id="scan_network",
+                progress_action="scan_network",
+                progress_task=self.scan_task,
+                description_placeholders={
+                    "networks": ", ".join(str(x) for x in self._networks)
+                },
+            )
+
+        try:
+            self._hosts = await self.scan_task
+        except Exception:
+            _LOGGER.exception("Unexpected exception")
+            self._hosts = []
+        finally:
+            self.scan_task = None
+
+        if not self._hosts:
+            return self.async_show_progress_done(next_step_id="device_not_found")
+
+        return self.async_show_progress_done(next_step_id="scan_select")
+
+    async def async_step_scan_select(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Select one of the found RS-485 to TCP converters."""
+        if user_input is None:
+            return self.async_show_form(
+                step_id="scan_select",
+                data_schema=vol.Schema({vol.Required(CONF_HOST): vol.In(self._hosts)}),
+            )
+
+        return await self.async_step_tcp(
+            {CONF_HOST: user_input[CONF_HOST], CONF_PORT: DEFAULT_PORT}
+        )
+
     async def async_step_serial(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -192,10 +338,18 @@ class PlumEcomaxFlowHandler(ConfigFlow, domain=DOMAIN):
 
         try:
             connection_type = CONNECTION_TYPE_SERIAL
+            if user_input[CONF_BAUDRATE] == BAUDRATE_AUTO:
+                user_input = {
+                    **user_input,
+                    CONF_BAUDRATE: await detect_baudrate(user_input[CONF_DEVICE]),
+                }
+
             self.connection = await validate_input(connection_type, user_input)
             self._data = deepcopy(user_input)
             self._data[CONF_CONNECTION_TYPE] = connection_type
             return await self.async_step_identify()
+        except BaudrateNotDetected:
+            errors[CONF_BAUDRATE] = "baudrate_not_detected"
         except CannotConnect:
             errors[CONF_BASE] = "cannot_connect"
         except TimeoutConnect:
@@ -211,7 +365,7 @@ class PlumEcomaxFlowHandler(ConfigFlow, domain=DOMAIN):
     async def async_step_identify(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
-        """Identify the device."""
+        """Identify the device and discover connected modules."""
         if not self.identify_task:
             self.identify_task = self.hass.async_create_task(
                 self._async_identify_device(), eager_start=False
@@ -226,42 +380,22 @@ class PlumEcomaxFlowHandler(ConfigFlow, domain=DOMAIN):
 
         try:
             await self.identify_task
+        except AbortFlow:
+            if self.connection:
+                await self.connection.close()
+                self.connection = None
+
+            raise
         except TimeoutError as device_not_found:
             _LOGGER.exception(device_not_found)
             return self.async_show_progress_done(next_step_id="device_not_found")
         except UnsupportedProduct:
             return self.async_show_progress_done(next_step_id="unsupported_product")
-        finally:
-            self.identify_task = None
-
-        return self.async_show_progress_done(next_step_id="discover")
-
-    async def async_step_discover(
-        self, user_input: dict[str, Any] | None = None
-    ) -> ConfigFlowResult:
-        """Discover connected modules."""
-        await self._async_set_unique_id(self._data[CONF_UID])
-
-        if not self.discover_task:
-            self.discover_task = self.hass.async_create_task(
-                self._async_discover_modules(), eager_start=False
-            )
-
-        if not self.discover_task.done():
-            return self.async_show_progress(
-                step_id="discover",
-                progress_action="discover_modules",
-                progress_task=self.discover_task,
-                description_placeholders={"model": self._data[CONF_MODEL]},
-            )
-
-        try:
-            await self.discover_task
-        except TimeoutError as discovery_failed:
+        except DiscoveryFailed as discovery_failed:
             _LOGGER.exception(discovery_failed)
             return self.async_show_progress_done(next_step_id="discovery_failed")
         finally:
-            self.discover_task = None
+            self.identify_task = None
 
         return self.async_show_progress_done(next_step_id="finish")
 
@@ -270,7 +404,9 @@ class PlumEcomaxFlowHandler(ConfigFlow, domain=DOMAIN):
     ) -> ConfigFlowResult:
         """Finish integration config."""
         if self.connection:
-            await self.connection.close()
+            # Hand off the connection to the config entry setup.
+            async_handoff_connection(self.hass, self._data[CONF_UID], self.connection)
+            self.connection = None
 
         return self.async_create_entry(title=self._data[CONF_MODEL], data=self._data)
 
@@ -293,22 +429,55 @@ class PlumEcomaxFlowHandler(ConfigFlow, domain=DOMAIN):
         return self.async_abort(reason="discovery_failed")
 
     async def _async_identify_device(self) -> None:
-        """Task to identify the device."""
+        """Task to identify the device and discover connected modules.
+
+        Connected modules and sub-devices are discovered concurrently
+        with the product info, so the task takes as long as the slowest
+        of them. Discovery is cancelled, if the device is unsupported or
+        already configured.
+        """
         # Tell mypy that once we here, connection is not None
         connection = cast(Connection, self.connection)
         async with connection.device(
             DeviceType.ECOMAX, timeout=DEFAULT_TIMEOUT
         ) as device:
-            product = cast(
-                ProductInfo, await device.get(ATTR_PRODUCT, timeout=DEFAULT_TIMEOUT)
-            )
             self.device = device
+            discovery = asyncio.gather(
+                device.get(ATTR_MODULES, timeout=DEFAULT_TIMEOUT),
+                async_get_sub_devices(device),
+                return_exceptions=True,
+            )
+            try:
+                await self._async_identify_product(device)
+            except BaseException:
+                discovery.cancel()
+                with suppress(asyncio.CancelledError):
+                    await discovery
+
+                raise
+
+            modules, sub_devices = await discovery
+
+        if isinstance(modules, BaseException):
+            raise DiscoveryFailed from modules
+
+        if isinstance(sub_devices, BaseException):
+            raise DiscoveryFailed from sub_devices
+
+        modules = cast(ConnectedModules, modules)
+        self._data.update(
+            {CONF_SOFTWARE: asdict(modules), CONF_SUB_DEVICES: sub_devices}
+        )
 
+    async def _async_identify_product(self, device: PhysicalDevice) -> None:
+        """Identify the product and abort, if it's already configured."""
+        product: ProductInfo = await device.get(ATTR_PRODUCT, timeout=DEFAULT_TIMEOUT)
         try:
             product_type = ProductType(product.type)
         except ValueError as validation_failure:
             raise UnsupportedProduct from validation_failure
 
+        await self._async_set_unique_id(product.uid)
         self._data.update(
             {
                 CONF_UID: product.uid,
@@ -318,28 +487,32 @@ class PlumEcomaxFlowHandler(ConfigFlow, domain=DOMAIN):
             }
         )
 
-    async def _async_discover_modules(self) -> None:
-        """Task to discover modules."""
-        device = cast(PhysicalDevice, self.device)
-        modules: ConnectedModules = await device.get(
-            ATTR_MODULES, timeout=DEFAULT_TIMEOUT
-        )
-        sub_devices = await async_get_sub_devices(device)
-
-        self._data.update(
-            {CONF_SOFTWARE: asdict(modules), CONF_SUB_DEVICES: sub_devices}
-        )
-
     async def _async_set_unique_id(self, uid: str) -> None:
         """Set the config entry's unique ID (based on UID)."""
         await self.async_set_unique_id(uid)
         self._abort_if_unique_id_configured()
 
 
+class BaudrateNotDetected(HomeAssistantError):
+    """Error to indicate that baudrate could not be detected."""
+
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
 
+class DiscoveryFailed(HomeAssistantError):
+    """Error to indicate that module discovery failed."""
+
+
+class InvalidNetwork(HomeAssistantError):
+    """Error to indicate that network is invalid."""
+
+
+class NetworkTooLarge(HomeAssistantError):
+    """Error to indicate that network is too large to scan."""
+
+
 class TimeoutConnect(HomeAssistantError):
     """Error to indicate that connection timed out."""
 
@@ -469,11 +642,23 @@ def _validate_entity_details(
 
 def _entity_keys_for_config_entry(
     hass: HomeAssistant, config_entry: ConfigEntry
-) -> list[str]:
-    """Get entity keys for config entry."""
+) -> dict[str, set[str]]:
+    """Get entity keys for config entry grouped by the source device."""
     entity_registry = er.async_get(hass)
     entities = er.async_entries_for_config_entry(entity_registry, config_entry.entry_id)
-    return [entity.unique_id.split("-")[-1] for entity in entities]
+    entity_keys: dict[str, set[str]] = {}
+    for entity in entities:
+        match entity.unique_id.split("-"):
+            case [_, device_type, device_id, key]:
+                source_device = f"{device_type}_{device_id}"
+            case [*_, key] if key.isnumeric():
+                source_device = ATTR_REGDATA
+            case [*_, key]:
+                source_device = DeviceType.ECOMAX
+
+        entity_keys.setdefault(source_device, set()).add(key)
+
+    return entity_keys
 
 
 def _custom_entity_options(
@@ -533,6 +718,76 @@ def _format_source_value(
     return value
 
 
+def _change_token(value: Any) -> Any:
+    """Return the token that changes along with the source value."""
+    return value.values if isinstance(value, Parameter) else value
+
+
+@dataclass(slots=True)
+class SourceCandidates:
+    """Represents an index of the custom entity source candidates.
+
+    Keys that are valid for each platform are kept sorted and only
+    values that have changed since the last update are reformatted.
+    """
+
+    labels: dict[str, str] = field(default_factory=dict)
+    platforms: dict[Platform, list[str]] = field(
+        default_factory=lambda: {platform: [] for platform in PLATFORM_TYPES}
+    )
+    _key_platforms: dict[str, tuple[Platform, ...]] = field(default_factory=dict)
+    _tokens: dict[str, Any] = field(default_factory=dict)
+
+    def update(self, data: Mapping[Any, Any]) -> None:
+        """Apply changes in the source data since the last update."""
+        for source_key, value in data.items():
+            key = str(source_key)
+            token = _change_token(value)
+            if key in self._tokens:
+                previous = self._tokens[key]
+                if previous is token or (
+                    type(previous) is type(token) and previous == token
+                ):
+                    continue
+
+            self._tokens[key] = token
+            platforms = tuple(
+                platform
+                for platform in PLATFORM_TYPES
+                if _is_valid_source(platform, value)
+            )
+            if platforms != self._key_platforms.get(key, ()):
+                self._remove_key(key)
+                self._key_platforms[key] = platforms
+                for platform in platforms:
+                    insort(self.platforms[platform], key)
+
+            if platforms:
+                self.labels[key] = f"{key} (value: {_format_source_value(value)})"
+
+        if len(self._tokens) != len(data):
+            for key in self._tokens.keys() - {str(k) for k in data}:
+                self._remove_key(key)
+                del self._tokens[key]
+
+    def _remove_key(self, key: str) -> None:
+        """Remove the key from the platform indexes."""
+        for platform in self._key_platforms.pop(key, ()):
+            self.platforms[platform].remove(key)
+
+        self.labels.pop(key, None)
+
+    def select_options(
+        self, platform: Platform, exclude: Collection[str], selected: str = ""
+    ) -> list[selector.SelectOptionDict]:
+        """Return select options for the platform."""
+        return [
+            selector.SelectOptionDict(value=key, label=self.labels[key])
+            for key in self.platforms[platform]
+            if key == selected or key not in exclude
+        ]
+
+
 def generate_select_schema(entities: dict[str, Any]) -> vol.Schema | None:
     """Generate schema for editing or deleting an entity."""
 
@@ -686,7 +941,7 @@ def generate_edit_schema(
     return vol.Schema(schema)
 
 
-class OptionsFlowHandler(OptionsFlowWithReload):
+class OptionsFlowHandler(OptionsFlow):
     """Represents an options flow."""
 
     async def async_step_init(
@@ -701,6 +956,7 @@ class OptionsFlowHandler(OptionsFlowWithReload):
         )
         self.options = deepcopy(dict(self.config_entry.options))
         self.entities = cast(dict[str, Any], self.options.setdefault(ATTR_ENTITIES, {}))
+        self.source_candidates: dict[str, SourceCandidates] = {}
         return self.async_show_menu(
             step_id="init",
             menu_options=[
@@ -708,6 +964,7 @@ class OptionsFlowHandler(OptionsFlowWithReload):
                 "edit_entity",
                 "remove_entity",
                 "rediscover_devices",
+                "economy",
             ],
         )
 
@@ -831,10 +1088,57 @@ class OptionsFlowHandler(OptionsFlowWithReload):
             data = dict(self.config_entry.data)
             data[CONF_SUB_DEVICES] = await async_get_sub_devices(self.connection.device)
             self.hass.config_entries.async_update_entry(self.config_entry, data=data)
+            async_handoff_connection(self.hass, data[CONF_UID], self.connection.handler)
+            await self.hass.config_entries.async_reload(self.config_entry.entry_id)
 
         self.config_entry.async_create_task(self.hass, _async_discover_devices())
         return self.async_create_entry(data=self.options)
 
+    async def async_step_economy(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle economy profile settings."""
+        if user_input is not None:
+            self.options[ATTR_ECONOMY] = user_input
+            return self.async_create_entry(title="", data=self.options)
+
+        economy: dict[str, Any] = self.options.get(ATTR_ECONOMY, {})
+        return self.async_show_form(
+            step_id="economy",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_ENABLED, default=economy.get(CONF_ENABLED, False)
+                    ): selector.BooleanSelector(),
+                    vol.Required(
+                        CONF_TOLERANCE,
+                        default=economy.get(CONF_TOLERANCE, DEFAULT_ECONOMY_TOLERANCE),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=10,
+                            step=0.1,
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_UPDATE_INTERVAL,
+                        default=economy.get(
+                            CONF_UPDATE_INTERVAL, DEFAULT_ECONOMY_UPDATE_INTERVAL
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=10,
+                            max=600,
+                            step=1,
+                            unit_of_measurement=UnitOfTime.SECONDS,
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                }
+            ),
+        )
+
     async def async_step_edit_entity(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -887,60 +1191,26 @@ class OptionsFlowHandler(OptionsFlowWithReload):
             if entity.unique_id.split("-")[-1] == key:
                 entity_registry.async_remove(entity_id=entity.entity_id)
 
-    def _ecomax_source_candidates(
-        self, entity_keys: list[str], selected: str
-    ) -> dict[str, Any]:
-        """Return source candidates for ecoMAX."""
-        existing_keys = [
-            key for key in entity_keys if key.split("_", 1)[0] not in LOGICAL_DEVICES
-        ]
-        return {
-            k: v
-            for k, v in self.connection.device.data.items()
-            if k not in existing_keys or k == selected
-        }
-
-    def _regdata_source_candidates(
-        self, entity_keys: list[str], selected: str
-    ) -> dict[str, Any]:
-        """Return source candidates for regdata."""
-        existing_keys = [int(key) for key in entity_keys if key.isnumeric()]
-        regdata = cast(
-            dict[int, Any], self.connection.device.get_nowait(ATTR_REGDATA, {})
-        )
-        return {
-            str(k): v
-            for k, v in regdata.items()
-            if k not in existing_keys or str(k) == selected
-        }
-
-    def _logical_device_source_candidates(
-        self, entity_keys: list[str], selected: str
-    ) -> dict[str, Any]:
-        """Return source candidates for logical device."""
-        device_type, device_id = self.source_device.split("_", 1)
-        device = self._get_logical_device(DeviceType(device_type), int(device_id))
-        existing_keys = [
-            key for key in entity_keys if key.startswith(f"{device_type}-{device_id}")
-        ]
-        return {
-            k: v
-            for k, v in device.data.items()
-            if k not in existing_keys or k == selected
-        }
-
-    def _entity_source_candidates(self, selected: str) -> dict[str, Any]:
-        """Return custom entity source candidates."""
-        entity_keys = _entity_keys_for_config_entry(self.hass, self.config_entry)
+    @cached_property
+    def _entity_keys(self) -> dict[str, set[str]]:
+        """Return entity keys grouped by the source device."""
+        return _entity_keys_for_config_entry(self.hass, self.config_entry)
 
+    def _entity_source_data(self) -> Mapping[Any, Any]:
+        """Return custom entity source data."""
         if self.source_device == DeviceType.ECOMAX:
-            return self._ecomax_source_candidates(entity_keys, selected)
+            return self.connection.device.data
 
         elif self.source_device == ATTR_REGDATA:
-            return self._regdata_source_candidates(entity_keys, selected)
+            return cast(
+                dict[int, Any], self.connection.device.get_nowait(ATTR_REGDATA, {})
+            )
 
         elif self.source_device.startswith(LOGICAL_DEVICES):
-            return self._logical_device_source_candidates(entity_keys, selected)
+            device_type, device_id = self.source_device.split("_", 1)
+            return self._get_logical_device(
+                DeviceType(device_type), int(device_id)
+            ).data
 
         raise HomeAssistantError(
             translation_key="unsupported_device",
@@ -969,16 +1239,16 @@ class OptionsFlowHandler(OptionsFlowWithReload):
         self, selected: str = ""
     ) -> list[selector.SelectOptionDict]:
         """Return source options."""
-        source_candidates = self._entity_source_candidates(selected)
-        data = dict(sorted(source_candidates.items()))
-
-        return [
-            selector.SelectOptionDict(
-                value=str(k), label=f"{k} (value: {_format_source_value(v)})"
-            )
-            for k, v in data.items()
-            if _is_valid_source(self.platform, v)
-        ]
+        source_data = self._entity_source_data()
+        source_candidates = self.source_candidates.setdefault(
+            self.source_device, SourceCandidates()
+        )
+        source_candidates.update(source_data)
+        return source_candidates.select_options(
+            self.platform,
+            exclude=self._entity_keys.get(self.source_device, set()),
+            selected=selected,
+        )
 
     def _source_device_select_options(self) -> list[selector.SelectOptionDict]:
         """Return source device options."""
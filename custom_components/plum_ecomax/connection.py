@@ -3,24 +3,44 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from contextlib import suppress
+from dataclasses import dataclass
+from datetime import datetime
 from functools import cached_property
+from ipaddress import IPv4Interface, IPv4Network
 import logging
 import math
 from typing import Any, Final, cast
 
 from aiohttp.resolver import AsyncResolver
+from homeassistant.components import network
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.hass_dict import HassKey
 import pyplumio
 from pyplumio.connection import Connection
 from pyplumio.const import FrameType, ProductType
+from pyplumio.data_types import DataType
 from pyplumio.devices import PhysicalDevice
+from pyplumio.exceptions import (
+    ChecksumError,
+    ConnectionFailedError,
+    ReadError,
+    UnknownDeviceError,
+    UnknownFrameError,
+)
+from pyplumio.filters import Filter
+from pyplumio.helpers.event_manager import EventCallback
+from pyplumio.protocol import DummyProtocol
 from pyplumio.structures.mixer_parameters import ATTR_MIXER_PARAMETERS
+from pyplumio.structures.regulator_data_schema import ATTR_REGDATA_SCHEMA
 from pyplumio.structures.sensor_data import (
+    ATTR_FUEL_LEVEL,
     ATTR_MIXERS_CONNECTED,
+    ATTR_STATE,
     ATTR_THERMOSTATS_CONNECTED,
     ATTR_WATER_HEATER_TEMP,
 )
@@ -31,6 +51,7 @@ from .const import (
     ATTR_REGDATA,
     ATTR_THERMOSTATS,
     ATTR_WATER_HEATER,
+    BAUDRATES,
     CONF_BAUDRATE,
     CONF_DEVICE,
     CONF_HOST,
@@ -48,6 +69,15 @@ from .const import (
     DOMAIN,
     DeviceType,
 )
+from .cycles import BurnerCycles, RuntimeCounters
+from .economy import EconomyProfile, EconomyStatistics, economy
+from .forecast import FuelForecaster
+from .regdata import RegdataView
+from .scheduler import FrameScheduler, create_protocol, get_scheduler
+from .storage import RegdataSchemaStore
+from .subscriptions import SubscriptionManager
+from .windows import RollingWindows
+from .writes import WriteTracker
 
 ATTR_SETUP: Final = "setup"
 ATTR_SENSORS: Final = "sensors"
@@ -58,6 +88,25 @@ DEFAULT_RETRIES: Final = 5
 WAIT_FOR_DEVICE_SECONDS: Final = 30
 WAIT_FOR_SETUP_SECONDS: Final = 15
 FORCE_CLOSE_AFTER_SECONDS: Final = 10
+HANDOFF_TIMEOUT: Final = 60
+BAUDRATE_PROBE_TIMEOUT: Final = 3
+SCAN_CONCURRENCY: Final = 64
+SCAN_CONNECT_TIMEOUT: Final = 1
+SCAN_FRAME_TIMEOUT: Final = 3
+SCAN_MIN_PREFIX: Final = 24
+
+# Default baudrate is probed first, followed by the rest from fastest
+# to slowest, as ecoMAX controllers are rarely set to a slow rate.
+BAUDRATE_PROBE_ORDER: Final[tuple[str, ...]] = (
+    DEFAULT_BAUDRATE,
+    *sorted(
+        (baudrate for baudrate in BAUDRATES if baudrate != DEFAULT_BAUDRATE),
+        key=int,
+        reverse=True,
+    ),
+)
+
+DATA_HANDOFF: HassKey[dict[str, ConnectionHandoff]] = HassKey(f"{DOMAIN}_handoff")
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -80,15 +129,219 @@ async def async_get_connection_handler(
     _LOGGER.debug("Getting connection handler for type: %s...", connection_type)
     if connection_type == CONNECTION_TYPE_TCP:
         return pyplumio.TcpConnection(
-            data[CONF_HOST], data.get(CONF_PORT, DEFAULT_PORT)
+            data[CONF_HOST],
+            data.get(CONF_PORT, DEFAULT_PORT),
+            protocol=create_protocol(),
         )
 
     return pyplumio.SerialConnection(
         data.get(CONF_DEVICE, DEFAULT_DEVICE),
         int(data.get(CONF_BAUDRATE, DEFAULT_BAUDRATE)),
+        protocol=create_protocol(),
     )
 
 
+async def async_wait_for_frame(protocol: DummyProtocol, timeout: float) -> bool:
+    """Wait for a valid frame on the connection.
+
+    Frame is considered valid as soon as it passes the checksum
+    validation, even if pyplumio does not support it. Broken or closed
+    stream is treated as no frame.
+    """
+    try:
+        async with asyncio.timeout(timeout):
+            while True:
+                try:
+                    await protocol.reader.read()
+                except UnknownFrameError:
+                    return True
+                except ChecksumError, ReadError, UnknownDeviceError:
+                    continue
+
+                return True
+    except OSError as read_failure:
+        _LOGGER.debug("Failed to read the frame: %s", read_failure)
+        return False
+    except TimeoutError:
+        return False
+
+
+async def async_probe_baudrate(
+    device: str, baudrate: str, timeout: float = BAUDRATE_PROBE_TIMEOUT
+) -> bool:
+    """Check if the serial device talks at the baudrate."""
+    protocol = DummyProtocol()
+    connection = pyplumio.SerialConnection(
+        device, int(baudrate), protocol=protocol, reconnect_on_failure=False
+    )
+    await connection.connect()
+    try:
+        return await async_wait_for_frame(protocol, timeout)
+    finally:
+        await connection.close()
+
+
+async def async_detect_baudrate(
+    device: str,
+    baudrates: tuple[str, ...] = BAUDRATE_PROBE_ORDER,
+    timeout: float = BAUDRATE_PROBE_TIMEOUT,
+) -> str | None:
+    """Detect the baudrate of the serial device.
+
+    Baudrates are probed in the given order and detection stops at the
+    first baudrate that yields a valid frame.
+    """
+    for baudrate in baudrates:
+        _LOGGER.debug("Probing baudrate %s on %s...", baudrate, device)
+        if await async_probe_baudrate(device, baudrate, timeout):
+            _LOGGER.info("Detected baudrate %s on %s", baudrate, device)
+            return baudrate
+
+    return None
+
+
+async def async_probe_host(
+    host: str,
+    port: int = DEFAULT_PORT,
+    connect_timeout: float = SCAN_CONNECT_TIMEOUT,
+    timeout: float = SCAN_FRAME_TIMEOUT,
+) -> bool:
+    """Check if the host is an RS-485 to TCP converter with ecoMAX on it."""
+    protocol = DummyProtocol()
+    connection = pyplumio.TcpConnection(
+        host, port, protocol=protocol, reconnect_on_failure=False
+    )
+    try:
+        async with asyncio.timeout(connect_timeout):
+            await connection.connect()
+    except ConnectionFailedError, OSError, TimeoutError:
+        return False
+
+    try:
+        return await async_wait_for_frame(protocol, timeout)
+    except ReadError, OSError:
+        return False
+    finally:
+        await connection.close()
+
+
+async def async_scan_hosts(
+    hosts: Iterable[str],
+    port: int = DEFAULT_PORT,
+    concurrency: int = SCAN_CONCURRENCY,
+    connect_timeout: float = SCAN_CONNECT_TIMEOUT,
+    timeout: float = SCAN_FRAME_TIMEOUT,
+) -> list[str]:
+    """Scan the hosts for RS-485 to TCP converters with ecoMAX on them.
+
+    Hosts are probed concurrently with at most the given number of
+    probes in flight. Returns hosts that sent a valid frame.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _async_probe(host: str) -> bool:
+        """Probe the host once the semaphore is acquired."""
+        async with semaphore:
+            return await async_probe_host(host, port, connect_timeout, timeout)
+
+    hosts = list(hosts)
+    _LOGGER.debug("Scanning %d host(s) on port %d...", len(hosts), port)
+    results = await asyncio.gather(
+        *(_async_probe(host) for host in hosts), return_exceptions=True
+    )
+    found = []
+    for host, result in zip(hosts, results, strict=True):
+        if isinstance(result, Exception):
+            _LOGGER.debug("Failed to probe host %s: %s", host, result)
+        elif result:
+            found.append(host)
+
+    _LOGGER.debug("Found %d converter(s): %s", len(found), ", ".join(found))
+    return found
+
+
+async def async_get_scan_networks(hass: HomeAssistant) -> list[IPv4Network]:
+    """Return networks of the enabled Home Assistant network adapters.
+
+    Networks larger than the scan limit are narrowed down to the part
+    that holds the adapter address.
+    """
+    networks: set[IPv4Network] = set()
+    for adapter in await network.async_get_adapters(hass):
+        if not adapter["enabled"]:
+            continue
+
+        for ip_info in adapter["ipv4"]:
+            prefix = max(ip_info["network_prefix"], SCAN_MIN_PREFIX)
+            address = IPv4Interface(f"{ip_info['address']}/{prefix}")
+            if not address.is_loopback:
+                networks.add(address.network)
+
+    return sorted(networks)
+
+
+@dataclass(slots=True)
+class ConnectionHandoff:
+    """Represents a connection handed off to the config entry setup."""
+
+    connection: Connection
+    cancel_expiry: CALLBACK_TYPE
+
+
+@callback
+def async_handoff_connection(
+    hass: HomeAssistant,
+    uid: str,
+    connection: Connection,
+    timeout: float = HANDOFF_TIMEOUT,
+) -> None:
+    """Keep the established connection for the config entry setup.
+
+    Connection is closed, if it's not claimed before the timeout.
+    """
+    handoffs = hass.data.setdefault(DATA_HANDOFF, {})
+    if (previous := handoffs.pop(uid, None)) is not None:
+        previous.cancel_expiry()
+        if previous.connection is not connection:
+            hass.async_create_background_task(
+                previous.connection.close(), name="close_replaced_connection"
+            )
+
+    @callback
+    def _async_expire(now: datetime) -> None:
+        """Close the connection that was not claimed."""
+        if handoffs.get(uid, None) is handoff:
+            del handoffs[uid]
+            _LOGGER.debug("Closing unclaimed connection for device: %s", uid)
+            hass.async_create_background_task(
+                connection.close(), name="close_unclaimed_connection"
+            )
+
+    handoff = ConnectionHandoff(
+        connection, async_call_later(hass, timeout, _async_expire)
+    )
+    handoffs[uid] = handoff
+
+
+@callback
+def async_claim_connection(hass: HomeAssistant, uid: str) -> Connection | None:
+    """Claim the connection handed off for the device."""
+    handoffs = hass.data.get(DATA_HANDOFF, {})
+    if (handoff := handoffs.pop(uid, None)) is None:
+        return None
+
+    handoff.cancel_expiry()
+    _LOGGER.debug("Using connection handed off for device: %s", uid)
+    return handoff.connection
+
+
+@callback
+def async_is_connection_handed_off(hass: HomeAssistant, connection: Connection) -> bool:
+    """Return if the connection is waiting to be claimed."""
+    handoffs = hass.data.get(DATA_HANDOFF, {})
+    return any(handoff.connection is connection for handoff in handoffs.values())
+
+
 async def async_get_sub_devices(device: PhysicalDevice) -> list[str]:
     """Return the sub-devices."""
     _LOGGER.debug("Checking connected sub-devices...")
@@ -131,8 +384,18 @@ class EcomaxConnection:
     _hass: HomeAssistant
     entry: ConfigEntry
 
+    _regdata_attached: bool
+    _regdata_schema_store: RegdataSchemaStore
     _request_cache: dict[str, bool]
     _request_locks: dict[str, asyncio.Lock]
+    cycles: BurnerCycles
+    economy_statistics: EconomyStatistics
+    fuel_forecast: FuelForecaster
+    regdata: RegdataView
+    runtimes: RuntimeCounters
+    subscriptions: SubscriptionManager
+    windows: RollingWindows
+    writes: WriteTracker
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry, connection: Connection):
         """Initialize a new ecoMAX connection."""
@@ -141,8 +404,18 @@ class EcomaxConnection:
         self._hass = hass
         self.entry = entry
 
+        self._regdata_attached = False
+        self._regdata_schema_store = RegdataSchemaStore(hass, entry.entry_id)
         self._request_cache = {}
         self._request_locks = {}
+        self.cycles = BurnerCycles(hass, entry.entry_id)
+        self.economy_statistics = EconomyStatistics()
+        self.fuel_forecast = FuelForecaster()
+        self.regdata = RegdataView()
+        self.runtimes = RuntimeCounters(hass, entry.entry_id)
+        self.subscriptions = SubscriptionManager()
+        self.windows = RollingWindows()
+        self.writes = WriteTracker()
 
     def __getattr__(self, name: str) -> Any:
         """Proxy calls to the underlying connection handler class."""
@@ -151,15 +424,61 @@ class EcomaxConnection:
 
         raise AttributeError
 
-    async def async_setup(self) -> None:
-        """Set up ecoMAX connection."""
-        await self._connection.connect()
+    async def async_setup(self, connect: bool = True) -> None:
+        """Set up ecoMAX connection.
+
+        Connection that was handed off already has the device set up,
+        so it is used as is.
+        """
+        regdata_schema = (
+            await self._regdata_schema_store.async_load(self.regdata_schema_key)
+            if connect
+            else None
+        )
+        await self.cycles.async_load()
+        await self.runtimes.async_load()
+        if connect:
+            await self._connection.connect()
+
         async with self._connection.device(
             DeviceType.ECOMAX, timeout=WAIT_FOR_DEVICE_SECONDS
         ) as device:
+            if regdata_schema:
+                # Decode regulator data right away, while the schema is
+                # being revalidated by the device setup in the background.
+                _LOGGER.debug("Using cached regulator data schema")
+                await device.dispatch(ATTR_REGDATA_SCHEMA, regdata_schema)
+
+            self.subscriptions.subscribe(
+                self, device, ATTR_REGDATA_SCHEMA, self._async_save_regdata_schema
+            )
+            for key in self.windows.keys:
+                self.subscriptions.subscribe(
+                    self, device, key, self.windows.handler(key)
+                )
+
+            self.subscriptions.subscribe(
+                self, device, ATTR_STATE, self.cycles.async_handle_state
+            )
+            for key in self.runtimes.keys:
+                self.subscriptions.subscribe(
+                    self, device, key, self.runtimes.handler(key)
+                )
+
+            self.subscriptions.subscribe(
+                self, device, ATTR_FUEL_LEVEL, self.fuel_forecast.handler()
+            )
+
             await device.wait_for(ATTR_SETUP, timeout=WAIT_FOR_SETUP_SECONDS)
             self._device = device
 
+    async def _async_save_regdata_schema(
+        self, schema: list[tuple[int, DataType]]
+    ) -> None:
+        """Save the regulator data schema received from the device."""
+        if await self._regdata_schema_store.async_save(self.regdata_schema_key, schema):
+            _LOGGER.debug("Regulator data schema cache updated")
+
     async def _request_with_cache(self, name: str, frame_type: FrameType) -> bool:
         """Make request and cache the result."""
         request_lock = self._request_locks.setdefault(name, asyncio.Lock())
@@ -192,18 +511,65 @@ class EcomaxConnection:
         )
 
     async def async_setup_regdata(self) -> bool:
-        """Set up regulator data."""
-        return await self._request_with_cache(
+        """Set up regulator data.
+
+        Regulator data view is attached to the device on the first call
+        and slots, that were resolved so far, are filled with the last
+        received regulator data.
+        """
+        if not await self._request_with_cache(
             ATTR_REGDATA, FrameType.REQUEST_REGULATOR_DATA_SCHEMA
+        ):
+            return False
+
+        device = self.device
+        if not self._regdata_attached:
+            self._regdata_attached = True
+            self.subscriptions.subscribe(
+                self, device, ATTR_REGDATA, self.regdata.async_update
+            )
+
+        if (regdata := device.data.get(ATTR_REGDATA, None)) is not None:
+            await self.regdata.async_update(regdata)
+
+        return True
+
+    def economy_filter[CallbackT: EventCallback](
+        self, callback: CallbackT, key: str
+    ) -> CallbackT | Filter:
+        """Wrap the callback with the economy filter, if profile is enabled."""
+        if (profile := self.economy_profile) is None:
+            return callback
+
+        return economy(
+            callback,
+            key=key,
+            profile=profile,
+            statistics=self.economy_statistics,
         )
 
     async def async_close(self) -> None:
         """Close ecoMAX connection."""
+        if scheduler := self.scheduler:
+            scheduler.cancel()
+
+        await self.cycles.async_stop()
+        await self.runtimes.async_stop()
         with suppress(asyncio.TimeoutError):
             await asyncio.wait_for(
                 self._connection.close(), timeout=FORCE_CLOSE_AFTER_SECONDS
             )
 
+    @property
+    def handler(self) -> Connection:
+        """Return the connection handler."""
+        return self._connection
+
+    @property
+    def scheduler(self) -> FrameScheduler | None:
+        """Return the outgoing frame scheduler."""
+        return get_scheduler(self._connection)
+
     @property
     def device(self) -> PhysicalDevice:
         """Return the device handler."""
@@ -216,6 +582,11 @@ class EcomaxConnection:
 
         return self._device
 
+    @cached_property
+    def economy_profile(self) -> EconomyProfile | None:
+        """Return the economy profile."""
+        return EconomyProfile.from_options(self.entry.options)
+
     @cached_property
     def has_water_heater(self) -> bool:
         """Return if device has attached water heater."""
@@ -246,6 +617,16 @@ class EcomaxConnection:
         """Return the product id."""
         return cast(int, self.entry.data[CONF_PRODUCT_ID])
 
+    @cached_property
+    def regdata_schema_key(self) -> str:
+        """Return the regulator data schema cache key."""
+        software = "-".join(
+            f"{module}:{version}"
+            for module, version in sorted(self.software.items())
+            if version is not None
+        )
+        return f"{self.product_id}-{software}"
+
     @cached_property
     def uid(self) -> str:
         """Return the product UID."""
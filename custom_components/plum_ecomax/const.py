@@ -6,6 +6,7 @@ from typing import Final
 DOMAIN = "plum_ecomax"
 
 # Generic attributes.
+ATTR_ECONOMY: Final = "economy"
 ATTR_ENTITIES: Final = "entities"
 ATTR_FROM: Final = "from"
 ATTR_MIXERS: Final = "mixers"
@@ -29,6 +30,7 @@ BAUDRATES: Final[tuple[str, ...]] = (
     "57600",
     "115200",
 )
+BAUDRATE_AUTO: Final = "auto"
 
 # Weekdays.
 WEEKDAYS: Final[tuple[str, ...]] = (
@@ -46,9 +48,12 @@ CONF_BAUDRATE: Final = "baudrate"
 CONF_CAPABILITIES: Final = "capabilities"
 CONF_CONNECTION_TYPE: Final = "connection_type"
 CONF_DEVICE: Final = "device"
+CONF_ENABLED: Final = "enabled"
 CONF_HOST: Final = "host"
 CONF_KEY: Final = "key"
+CONF_MIGRATED: Final = "migrated"
 CONF_MODEL: Final = "model"
+CONF_NETWORK: Final = "network"
 CONF_PORT: Final = "port"
 CONF_PRODUCT_ID: Final = "product_id"
 CONF_PRODUCT_TYPE: Final = "product_type"
@@ -56,6 +61,7 @@ CONF_SOFTWARE: Final = "software"
 CONF_SOURCE_DEVICE: Final = "source_device"
 CONF_STEP: Final = "step"
 CONF_SUB_DEVICES: Final = "sub_devices"
+CONF_TOLERANCE: Final = "tolerance"
 CONF_UID: Final = "uid"
 CONF_UPDATE_INTERVAL: Final = "update_interval"
 
@@ -67,6 +73,8 @@ CONNECTION_TYPE_TCP: Final = "TCP"
 DEFAULT_BAUDRATE: Final = BAUDRATES[-1]
 DEFAULT_CONNECTION_TYPE: Final = CONNECTION_TYPE_TCP
 DEFAULT_DEVICE: Final = "/dev/ttyUSB0"
+DEFAULT_ECONOMY_TOLERANCE: Final = 0.5
+DEFAULT_ECONOMY_UPDATE_INTERVAL: Final = 60
 DEFAULT_PORT: Final = 8899
 DEFAULT_TOLERANCE: Final = 0.1
 
@@ -0,0 +1,203 @@
+"""Custom entities for the Plum ecoMAX integration."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Collection, Mapping
+from dataclasses import dataclass, field
+import logging
+from types import MappingProxyType
+from typing import Any, Final
+
+from homeassistant.const import CONF_UNIT_OF_MEASUREMENT, Platform
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from pyplumio.filters import Filter, throttle
+
+from .const import (
+    ATTR_ENTITIES,
+    CONF_SOURCE_DEVICE,
+    CONF_STEP,
+    CONF_UPDATE_INTERVAL,
+    LOGICAL_DEVICES,
+)
+
+type CustomEntitiesBySource = Mapping[int, tuple[Mapping[str, Any], ...]]
+type CustomEntityFactory = Callable[[], Awaitable[list[Entity]]]
+
+EMPTY: Final[CustomEntitiesBySource] = MappingProxyType({})
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _filter_wrapper(update_interval: int) -> Callable[..., Any]:
+    """Return a filter function based on the update interval."""
+
+    def filter_fn[CallableT: Callable[..., Any]](x: CallableT) -> Filter | CallableT:
+        """Return a filter function."""
+        return throttle(x, seconds=update_interval) if update_interval > 0 else x
+
+    return filter_fn
+
+
+def make_description_data(entity: Mapping[str, Any]) -> dict[str, Any]:
+    """Make entity description keyword arguments from the entity data."""
+    data = {**entity}
+
+    if step := data.pop(CONF_STEP, None):
+        data["native_step"] = step
+
+    if unit_of_measurement := data.pop(CONF_UNIT_OF_MEASUREMENT, None):
+        data["native_unit_of_measurement"] = unit_of_measurement
+
+    if update_interval := data.pop(CONF_UPDATE_INTERVAL, None):
+        data["filter_fn"] = _filter_wrapper(update_interval)
+
+    del data[CONF_SOURCE_DEVICE]
+    return data
+
+
+@dataclass(frozen=True, slots=True)
+class CustomEntities:
+    """Represents compiled custom entities.
+
+    Entities are grouped by platform, source device and sub-device
+    index, so platforms can get their custom entities without walking
+    through the config entry options.
+    """
+
+    entities: Mapping[str, Mapping[str, CustomEntitiesBySource]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> CustomEntities:
+        """Compile custom entities from the config entry options."""
+        grouped: dict[str, dict[str, dict[int, list[Mapping[str, Any]]]]] = {}
+        platforms: dict[str, dict[str, Any]] = options.get(ATTR_ENTITIES, {})
+        for platform, entities in platforms.items():
+            for entity in entities.values():
+                source_device: str = entity[CONF_SOURCE_DEVICE]
+                index = 0
+                if source_device.startswith(LOGICAL_DEVICES):
+                    source_device, device_id = source_device.split("_", 1)
+                    index = int(device_id)
+
+                grouped.setdefault(platform, {}).setdefault(
+                    source_device, {}
+                ).setdefault(index, []).append(
+                    MappingProxyType(make_description_data(entity))
+                )
+
+        return cls(
+            MappingProxyType(
+                {
+                    platform: MappingProxyType(
+                        {
+                            source_device: MappingProxyType(
+                                {
+                                    index: tuple(entities)
+                                    for index, entities in sorted(indexes.items())
+                                }
+                            )
+                            for source_device, indexes in sources.items()
+                        }
+                    )
+                    for platform, sources in grouped.items()
+                }
+            )
+        )
+
+    def get(self, platform: str, source_device: str) -> CustomEntitiesBySource:
+        """Return custom entities for the platform and source device."""
+        if (sources := self.entities.get(platform, None)) is None:
+            return EMPTY
+
+        return sources.get(source_device, EMPTY)
+
+    def __len__(self) -> int:
+        """Return number of the custom entities."""
+        return sum(
+            len(entities)
+            for sources in self.entities.values()
+            for indexes in sources.values()
+            for entities in indexes.values()
+        )
+
+
+@dataclass(slots=True)
+class CustomEntityPlatform:
+    """Represents a platform that hosts custom entities.
+
+    Custom entities are tracked by key, so they can be replaced on the
+    running platform when custom entity options change.
+    """
+
+    factory: CustomEntityFactory
+    async_add_entities: AddEntitiesCallback
+    entities: dict[str, Entity] = field(default_factory=dict)
+
+    async def async_setup(self) -> None:
+        """Set up custom entities."""
+        self.async_add(await self.factory())
+
+    @callback
+    def async_add(self, entities: list[Entity]) -> None:
+        """Add custom entities to the platform."""
+        self.entities.update(
+            (entity.entity_description.key, entity) for entity in entities
+        )
+        self.async_add_entities(entities)
+
+    async def async_reload(self, keys: Collection[str]) -> None:
+        """Reload custom entities with the given keys.
+
+        Entities, that are no longer configured, are also removed from
+        the entity registry.
+        """
+        entities = [
+            entity
+            for entity in await self.factory()
+            if entity.entity_description.key in keys
+        ]
+        configured = {entity.entity_description.key for entity in entities}
+        for key in keys:
+            if (entity := self.entities.pop(key, None)) is None:
+                continue
+
+            entity_registry = er.async_get(entity.hass)
+            await entity.async_remove()
+            if key not in configured and entity_registry.async_get(entity.entity_id):
+                entity_registry.async_remove(entity.entity_id)
+
+        self.async_add(entities)
+        _LOGGER.debug("Reloaded custom entities: %s", ", ".join(sorted(keys)))
+
+
+def get_changed_custom_entities(
+    options: Mapping[str, Any], new_options: Mapping[str, Any]
+) -> dict[Platform, set[str]] | None:
+    """Return keys of the changed custom entities grouped by platform.
+
+    Returns None if options other than custom entities were changed.
+    """
+    if {k: v for k, v in options.items() if k != ATTR_ENTITIES} != {
+        k: v for k, v in new_options.items() if k != ATTR_ENTITIES
+    }:
+        return None
+
+    platforms: dict[str, dict[str, Any]] = options.get(ATTR_ENTITIES, {})
+    new_platforms: dict[str, dict[str, Any]] = new_options.get(ATTR_ENTITIES, {})
+    changed: dict[Platform, set[str]] = {}
+    for platform in platforms.keys() | new_platforms.keys():
+        entities = platforms.get(platform, {})
+        new_entities = new_platforms.get(platform, {})
+        if keys := {
+            key
+            for key in entities.keys() | new_entities.keys()
+            if entities.get(key, None) != new_entities.get(key, None)
+        }:
+            changed[Platform(platform)] = keys
+
+    return changed
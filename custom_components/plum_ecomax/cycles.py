@@ -0,0 +1,525 @@
+"""Burner cycle and equipment runtime analytics for the Plum ecoMAX integration."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from enum import StrEnum, unique
+import logging
+from typing import Any, Final, TypedDict
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from pyplumio.const import DeviceState
+from pyplumio.helpers.event_manager import EventCallback
+
+from .const import DOMAIN
+from .storage import STORAGE_VERSION
+
+CYCLE_SAVE_DELAY: Final = 60
+CYCLE_UPDATE_INTERVAL: Final = timedelta(minutes=1)
+
+# Device states in which the burner is running.
+BURNER_STATES: Final = frozenset(
+    {
+        DeviceState.STABILIZATION,
+        DeviceState.KINDLING,
+        DeviceState.WORKING,
+        DeviceState.SUPERVISION,
+    }
+)
+
+RUNTIME_KEYS: Final = (
+    "heating_pump",
+    "water_heater_pump",
+    "circulation_pump",
+    "fan",
+    "feeder",
+    "lighter",
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@unique
+class CyclePeriod(StrEnum):
+    """Contains burner cycle accounting periods."""
+
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    LIFETIME = "lifetime"
+
+
+class StateCounterData(TypedDict):
+    """Represents a stored device state counter."""
+
+    count: int
+    duration: float
+
+
+class CycleCountersData(TypedDict):
+    """Represents stored burner cycle counters."""
+
+    start: str | None
+    starts: int
+    runs: int
+    run_time: float
+    states: dict[str, StateCounterData]
+
+
+class RuntimeCounterData(TypedDict):
+    """Represents a stored equipment runtime counter."""
+
+    starts: int
+    runtime: float
+
+
+class BurnerCyclesData(TypedDict):
+    """Represents stored burner cycle analytics."""
+
+    last_run_time: float | None
+    periods: dict[str, CycleCountersData]
+
+
+@dataclass(slots=True)
+class StateCounter:
+    """Represents a device state counter.
+
+    Duration is in seconds.
+    """
+
+    count: int = 0
+    duration: float = 0.0
+
+
+@dataclass(slots=True)
+class CycleCounters:
+    """Represents burner cycle counters for the period.
+
+    Run time is a total time of the completed burner runs in seconds.
+    """
+
+    start: datetime | None = None
+    starts: int = 0
+    runs: int = 0
+    run_time: float = 0.0
+    states: dict[DeviceState, StateCounter] = field(default_factory=dict)
+
+    @property
+    def mean_run_time(self) -> float | None:
+        """Return mean time of the completed burner runs."""
+        return self.run_time / self.runs if self.runs else None
+
+    def duration(self, state: DeviceState) -> float:
+        """Return time spent in the state in seconds."""
+        return counter.duration if (counter := self.states.get(state)) else 0.0
+
+    def as_dict(self) -> CycleCountersData:
+        """Return counters as a dictionary."""
+        return CycleCountersData(
+            start=self.start.isoformat() if self.start else None,
+            starts=self.starts,
+            runs=self.runs,
+            run_time=round(self.run_time, 1),
+            states={
+                state.name.lower(): StateCounterData(
+                    count=counter.count, duration=round(counter.duration, 1)
+                )
+                for state, counter in self.states.items()
+            },
+        )
+
+    @classmethod
+    def from_dict(cls, data: CycleCountersData) -> CycleCounters:
+        """Make counters from a dictionary."""
+        states: dict[DeviceState, StateCounter] = {}
+        for name, counter in data["states"].items():
+            try:
+                state = DeviceState[name.upper()]
+            except KeyError:
+                _LOGGER.warning("Ignoring counter for unknown state '%s'", name)
+                continue
+
+            states[state] = StateCounter(counter["count"], counter["duration"])
+
+        return cls(
+            start=dt_util.parse_datetime(start) if (start := data["start"]) else None,
+            starts=data["starts"],
+            runs=data["runs"],
+            run_time=data["run_time"],
+            states=states,
+        )
+
+
+@dataclass(slots=True)
+class RuntimeCounter:
+    """Represents an equipment runtime counter.
+
+    Runtime is in seconds.
+    """
+
+    starts: int = 0
+    runtime: float = 0.0
+
+    def as_dict(self) -> RuntimeCounterData:
+        """Return counter as a dictionary."""
+        return RuntimeCounterData(starts=self.starts, runtime=round(self.runtime, 1))
+
+
+@callback
+def async_get_period_start(period: CyclePeriod, now: datetime) -> datetime | None:
+    """Return start of the period in the local time."""
+    if period is CyclePeriod.LIFETIME:
+        return None
+
+    day = dt_util.as_local(now).date()
+    if period is CyclePeriod.WEEKLY:
+        day -= timedelta(days=day.weekday())
+
+    return dt_util.start_of_local_day(day)
+
+
+class CycleTracker[DataT](ABC):
+    """Represents a base for the streaming counter trackers.
+
+    Counters are written to the storage with a delay and are refreshed
+    periodically, while something is running and there are listeners.
+    Delay is counted from the first unsaved change, so counters that
+    keep changing are still written at least once per delay.
+    """
+
+    _hass: HomeAssistant
+    _listeners: list[CALLBACK_TYPE]
+    _save_delay: float
+    _save_pending: bool
+    _store: Store[DataT]
+    _unsub_interval: CALLBACK_TYPE | None
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        name: str,
+        save_delay: float = CYCLE_SAVE_DELAY,
+    ) -> None:
+        """Initialize a new tracker."""
+        self._hass = hass
+        self._listeners = []
+        self._save_delay = save_delay
+        self._save_pending = False
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.{name}")
+        self._unsub_interval = None
+
+    async def async_load(self) -> None:
+        """Load counters from the storage."""
+        if (data := await self._store.async_load()) is None:
+            return
+
+        try:
+            self._load(data)
+        except KeyError, TypeError, ValueError:
+            _LOGGER.warning("Ignoring malformed counters in '%s'", self._store.key)
+
+    async def async_save(self) -> None:
+        """Write counters to the storage."""
+        await self._store.async_save(self._async_data_to_save())
+
+    async def async_remove(self) -> None:
+        """Remove the storage."""
+        await self._store.async_remove()
+
+    async def async_stop(self) -> None:
+        """Stop periodic updates and write counters to the storage."""
+        self._async_cancel_interval()
+        self._advance(dt_util.utcnow())
+        await self.async_save()
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for counter updates."""
+        self._listeners.append(update_callback)
+        if self._unsub_interval is None:
+            self._unsub_interval = async_track_time_interval(
+                self._hass,
+                self._async_refresh,
+                CYCLE_UPDATE_INTERVAL,
+                cancel_on_shutdown=True,
+            )
+
+        @callback
+        def _async_remove_listener() -> None:
+            """Remove the update listener."""
+            self._listeners.remove(update_callback)
+            if not self._listeners:
+                self._async_cancel_interval()
+
+        return _async_remove_listener
+
+    @property
+    @abstractmethod
+    def running(self) -> bool:
+        """Return True if time is being accounted."""
+
+    @abstractmethod
+    def _load(self, data: DataT) -> None:
+        """Load counters from the stored data."""
+
+    @abstractmethod
+    def _advance(self, now: datetime) -> None:
+        """Account time elapsed since the last update."""
+
+    @abstractmethod
+    def _data_to_save(self) -> DataT:
+        """Return data to be written to the storage."""
+
+    @callback
+    def _async_data_to_save(self) -> DataT:
+        """Return data to be written and mark the pending write as done."""
+        self._save_pending = False
+        return self._data_to_save()
+
+    @callback
+    def _async_changed(self) -> None:
+        """Schedule the counters write and notify listeners."""
+        if not self._save_pending:
+            # Store reschedules on every call, so pending write is kept.
+            self._store.async_delay_save(self._async_data_to_save, self._save_delay)
+            self._save_pending = True
+
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def _async_refresh(self, now: datetime) -> None:
+        """Refresh the running time."""
+        if self.running:
+            self._advance(dt_util.utcnow())
+            self._async_changed()
+
+    @callback
+    def _async_cancel_interval(self) -> None:
+        """Cancel periodic updates."""
+        if self._unsub_interval is not None:
+            self._unsub_interval()
+            self._unsub_interval = None
+
+
+class BurnerCycles(CycleTracker[BurnerCyclesData]):
+    """Represents a streaming burner cycle tracker.
+
+    Device state changes are accounted as they arrive, so counters
+    are kept up to date without querying the recorder history. Burner
+    start is a transition from idle to one of the burner states and
+    a run lasts until the burner leaves these states again.
+
+    Current state is not restored, as the time spent offline is unknown.
+    """
+
+    _run_start: datetime | None
+    _since: datetime | None
+    _state: DeviceState | None
+    last_run_time: float | None
+    periods: dict[CyclePeriod, CycleCounters]
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, save_delay: float = CYCLE_SAVE_DELAY
+    ) -> None:
+        """Initialize a new burner cycle tracker."""
+        super().__init__(hass, entry_id, "cycles", save_delay)
+        self._run_start = None
+        self._since = None
+        self._state = None
+        self.last_run_time = None
+        self.periods = {period: CycleCounters() for period in CyclePeriod}
+
+    async def async_handle_state(self, value: Any) -> None:
+        """Handle the device state event."""
+        try:
+            state = DeviceState(value)
+        except ValueError:
+            state = DeviceState.OTHER
+
+        self.async_track(state)
+
+    @callback
+    def async_track(self, state: DeviceState) -> None:
+        """Account the device state change."""
+        now = dt_util.utcnow()
+        self._advance(now)
+        previous, self._state = self._state, state
+        if previous is None or previous == state:
+            return
+
+        for counters in self.periods.values():
+            counters.states.setdefault(state, StateCounter()).count += 1
+
+        if state in BURNER_STATES and previous not in BURNER_STATES:
+            self._run_start = now
+            for counters in self.periods.values():
+                counters.starts += 1
+
+        elif state not in BURNER_STATES and previous in BURNER_STATES:
+            if (run_start := self._run_start) is not None:
+                self._run_start = None
+                self.last_run_time = run_time = (now - run_start).total_seconds()
+                for counters in self.periods.values():
+                    counters.runs += 1
+                    counters.run_time += run_time
+
+        self._async_changed()
+
+    def statistics(self, period: CyclePeriod) -> CycleCounters:
+        """Return counters for the current period."""
+        self._advance(dt_util.utcnow())
+        return self.periods[period]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return burner cycle analytics as a dictionary."""
+        self._advance(dt_util.utcnow())
+        return {
+            "state": self._state.name.lower() if self._state is not None else None,
+            "since": self._since.isoformat() if self._since else None,
+            "last_run_time": self.last_run_time,
+            "periods": {
+                period.value: {
+                    **counters.as_dict(),
+                    "mean_run_time": counters.mean_run_time,
+                }
+                for period, counters in self.periods.items()
+            },
+        }
+
+    @property
+    def running(self) -> bool:
+        """Return True if the device state is known."""
+        return self._state is not None
+
+    def _load(self, data: BurnerCyclesData) -> None:
+        """Load counters from the stored data."""
+        periods = {
+            period: CycleCounters.from_dict(data["periods"][period])
+            for period in CyclePeriod
+            if period in data["periods"]
+        }
+        self.last_run_time = data["last_run_time"]
+        self.periods.update(periods)
+
+    def _advance(self, now: datetime) -> None:
+        """Account time spent in the current state and roll over periods."""
+        for period in CyclePeriod:
+            counters = self.periods[period]
+            if (start := async_get_period_start(period, now)) != counters.start:
+                counters = self.periods[period] = CycleCounters(start=start)
+
+            if self._state is None or self._since is None:
+                continue
+
+            since = self._since if start is None else max(self._since, start)
+            if now > since:
+                counter = counters.states.setdefault(self._state, StateCounter())
+                counter.duration += (now - since).total_seconds()
+
+        if self._since is None or now > self._since:
+            self._since = now
+
+    @callback
+    def _data_to_save(self) -> BurnerCyclesData:
+        """Return data to be written to the storage."""
+        return BurnerCyclesData(
+            last_run_time=self.last_run_time,
+            periods={
+                period.value: counters.as_dict()
+                for period, counters in self.periods.items()
+            },
+        )
+
+
+class RuntimeCounters(CycleTracker[dict[str, RuntimeCounterData]]):
+    """Represents streaming equipment runtime counters.
+
+    Runtime and starts are accounted from the same on/off events that
+    drive the running binary sensors. Start is a transition from off
+    to on, so the state seen first after restart is not counted.
+    """
+
+    _since: dict[str, datetime]
+    _states: dict[str, bool]
+    counters: dict[str, RuntimeCounter]
+    keys: tuple[str, ...]
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        keys: Iterable[str] = RUNTIME_KEYS,
+        save_delay: float = CYCLE_SAVE_DELAY,
+    ) -> None:
+        """Initialize new runtime counters."""
+        super().__init__(hass, entry_id, "runtimes", save_delay)
+        self._since = {}
+        self._states = {}
+        self.keys = tuple(keys)
+        self.counters = {key: RuntimeCounter() for key in self.keys}
+
+    def handler(self, key: str) -> EventCallback:
+        """Return the event callback that accounts the on/off events."""
+
+        async def _async_track(value: Any) -> None:
+            """Account the on/off event."""
+            self.async_track(key, bool(value))
+
+        return _async_track
+
+    @callback
+    def async_track(self, key: str, running: bool) -> None:
+        """Account the on/off state change."""
+        now = dt_util.utcnow()
+        self._advance(now)
+        previous, self._states[key] = self._states.get(key, None), running
+        if not running:
+            self._since.pop(key, None)
+        elif key not in self._since:
+            self._since[key] = now
+
+        if previous is None or previous == running:
+            return
+
+        if running:
+            self.counters[key].starts += 1
+
+        self._async_changed()
+
+    def get(self, key: str) -> RuntimeCounter:
+        """Return the runtime counter."""
+        self._advance(dt_util.utcnow())
+        return self.counters[key]
+
+    @property
+    def running(self) -> bool:
+        """Return True if any equipment is running."""
+        return bool(self._since)
+
+    def _load(self, data: dict[str, RuntimeCounterData]) -> None:
+        """Load counters from the stored data."""
+        counters = {
+            key: RuntimeCounter(data[key]["starts"], data[key]["runtime"])
+            for key in self.keys
+            if key in data
+        }
+        self.counters.update(counters)
+
+    def _advance(self, now: datetime) -> None:
+        """Account runtime of the running equipment."""
+        for key, since in self._since.items():
+            if now > since:
+                self.counters[key].runtime += (now - since).total_seconds()
+                self._since[key] = now
+
+    @callback
+    def _data_to_save(self) -> dict[str, RuntimeCounterData]:
+        """Return data to be written to the storage."""
+        return {key: counter.as_dict() for key, counter in self.counters.items()}
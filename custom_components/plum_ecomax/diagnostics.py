@@ -13,6 +13,7 @@ from pyplumio.helpers.event_manager import EventManager
 
 from .connection import EcomaxConnection
 from .const import ATTR_PASSWORD, CONF_HOST, CONF_UID
+from .watchdog import async_get_watchdog
 
 
 @callback
@@ -56,6 +57,13 @@ async def async_get_config_entry_diagnostics(
         "pyplumio": {
             "version": pyplumio_version,
         },
+        "economy": connection.economy_statistics.as_dict(),
+        "scheduler": (
+            scheduler.as_dict() if (scheduler := connection.scheduler) else None
+        ),
+        "subscriptions": len(connection.subscriptions),
+        "slow_callbacks": async_get_watchdog(hass).as_list(),
+        "writes": connection.writes.statistics.as_dict(),
         "data": async_redact_data(
             _async_data_as_dict(dict(connection.device.data)),
             to_redact={CONF_UID, ATTR_PASSWORD},
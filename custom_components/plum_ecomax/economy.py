@@ -0,0 +1,158 @@
+"""Economy profile for the Plum ecoMAX integration."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Mapping
+from copy import copy
+from dataclasses import dataclass, field
+from decimal import Decimal
+import math
+import time
+from typing import Any, Final
+
+from pyplumio.filters import UNDEFINED, Filter, is_close
+from pyplumio.helpers.event_manager import EventCallback
+
+from .const import (
+    ATTR_ECONOMY,
+    CONF_ENABLED,
+    CONF_TOLERANCE,
+    CONF_UPDATE_INTERVAL,
+    DEFAULT_ECONOMY_TOLERANCE,
+    DEFAULT_ECONOMY_UPDATE_INTERVAL,
+)
+
+NUMERIC_TYPES: Final = (int, float, Decimal)
+
+
+@dataclass(frozen=True, slots=True)
+class EconomyProfile:
+    """Represents an economy profile."""
+
+    tolerance: float = DEFAULT_ECONOMY_TOLERANCE
+    update_interval: float = DEFAULT_ECONOMY_UPDATE_INTERVAL
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> EconomyProfile | None:
+        """Return the economy profile from the config entry options."""
+        economy: dict[str, Any] = options.get(ATTR_ECONOMY, {})
+        if not economy.get(CONF_ENABLED, False):
+            return None
+
+        return cls(
+            tolerance=float(economy.get(CONF_TOLERANCE, DEFAULT_ECONOMY_TOLERANCE)),
+            update_interval=float(
+                economy.get(CONF_UPDATE_INTERVAL, DEFAULT_ECONOMY_UPDATE_INTERVAL)
+            ),
+        )
+
+
+@dataclass(slots=True)
+class EconomyStatistics:
+    """Represents economy profile statistics.
+
+    Suppressed writes are identical state writes, that were skipped
+    regardless of the economy profile.
+    """
+
+    received_updates: int = 0
+    suppressed_updates: int = 0
+    suppressed_by_key: Counter[str] = field(default_factory=Counter)
+    suppressed_writes: int = 0
+
+    @property
+    def savings(self) -> float:
+        """Return share of the suppressed updates in percent."""
+        if self.received_updates == 0:
+            return 0.0
+
+        return round(self.suppressed_updates / self.received_updates * 100.0, 2)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return statistics as a dictionary."""
+        return {
+            "received_updates": self.received_updates,
+            "suppressed_updates": self.suppressed_updates,
+            "savings": self.savings,
+            "suppressed_by_key": dict(self.suppressed_by_key.most_common()),
+            "suppressed_writes": self.suppressed_writes,
+        }
+
+
+def _is_numeric(value: Any) -> bool:
+    """Check if value is numeric."""
+    return isinstance(value, NUMERIC_TYPES) and not isinstance(value, bool)
+
+
+class _Economy(Filter):
+    """Represents an economy filter.
+
+    Numeric values are passed to the callback only if they are outside
+    of the profile tolerance and the update interval has elapsed since
+    the last call.
+
+    Any other values, such as states, alerts and parameters, are passed
+    as soon as they are changed, so only their repeats are suppressed.
+    """
+
+    __slots__ = ("_key", "_last_call_time", "_profile", "_statistics", "_value")
+
+    _key: str
+    _last_call_time: float
+    _profile: EconomyProfile
+    _statistics: EconomyStatistics
+    _value: Any
+
+    def __init__(
+        self,
+        callback: EventCallback,
+        key: str,
+        profile: EconomyProfile,
+        statistics: EconomyStatistics,
+    ) -> None:
+        """Initialize a new economy filter."""
+        super().__init__(callback)
+        self._key = key
+        self._last_call_time = 0.0
+        self._profile = profile
+        self._statistics = statistics
+        self._value = UNDEFINED
+
+    def _is_suppressed(self, new_value: Any, current_timestamp: float) -> bool:
+        """Check if the value should be suppressed."""
+        if self._value is UNDEFINED:
+            return False
+
+        if _is_numeric(self._value) and _is_numeric(new_value):
+            return current_timestamp - self._last_call_time < (
+                self._profile.update_interval
+            ) or math.isclose(self._value, new_value, abs_tol=self._profile.tolerance)
+
+        return is_close(self._value, new_value)
+
+    async def __call__(self, new_value: Any) -> Any:
+        """Set a new value for the callback."""
+        current_timestamp = time.monotonic()
+        self._statistics.received_updates += 1
+        if self._is_suppressed(new_value, current_timestamp):
+            self._statistics.suppressed_updates += 1
+            self._statistics.suppressed_by_key[self._key] += 1
+            return None
+
+        self._value = copy(new_value)
+        self._last_call_time = current_timestamp
+        return await self._callback(new_value)
+
+
+def economy(
+    callback: EventCallback,
+    key: str,
+    profile: EconomyProfile,
+    statistics: EconomyStatistics,
+) -> _Economy:
+    """Suppress insignificant updates according to the economy profile.
+
+    Counts received and suppressed updates in the statistics.
+    """
+    return _Economy(callback, key, profile, statistics)
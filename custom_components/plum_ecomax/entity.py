@@ -1,50 +1,53 @@
 """Contains base entity classes."""
 
-from collections.abc import Callable, Generator, Iterable
+from collections.abc import AsyncGenerator, Callable, Generator, Iterable, Mapping
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from functools import cached_property
 from typing import Any, Final, Literal, cast, final, overload, override
 
-from homeassistant.const import CONF_UNIT_OF_MEASUREMENT, Platform
+from homeassistant.const import Platform
 from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import DeviceInfo, Entity, EntityDescription
 from pyplumio.const import ProductType
 from pyplumio.devices import Device
 from pyplumio.devices.mixer import Mixer
 from pyplumio.devices.thermostat import Thermostat
-from pyplumio.filters import Filter, on_change, throttle
+from pyplumio.filters import Filter, on_change
+from pyplumio.helpers.event_manager import EventCallback, EventManager
 from pyplumio.structures.sensor_data import ConnectedModules
 
 from custom_components.plum_ecomax import PlumEcomaxConfigEntry
 
 from .connection import EcomaxConnection
 from .const import (
-    ATTR_ENTITIES,
     ATTR_MIXERS,
-    ATTR_REGDATA,
     ATTR_THERMOSTATS,
     CONF_CONNECTION_TYPE,
     CONF_HOST,
-    CONF_SOURCE_DEVICE,
-    CONF_STEP,
-    CONF_UPDATE_INTERVAL,
     CONNECTION_TYPE_TCP,
     DOMAIN,
     LOGICAL_DEVICES,
     DeviceType,
     ModuleType,
 )
+from .subscriptions import Subscription
+from .watchdog import async_get_watchdog
 
 MANUFACTURER: Final = "Plum Sp. z o.o."
 
 ALL: Final = "all"
 
+_UNSET: Final = object()
+
 
 @dataclass(frozen=True, kw_only=True)
 class EcomaxEntityDescription(EntityDescription):
     """Describes an ecoMAX entity."""
 
     always_available: bool = False
+    economy: bool = True
     entity_registry_enabled_default: bool = False
     filter_fn: Callable[[Any], Filter] = on_change
     module: ModuleType = ModuleType.A
@@ -72,42 +75,6 @@ def async_get_by_modules[DescriptorT: EcomaxEntityDescription](
             yield description
 
 
-@callback
-def async_make_description_for_custom_entity[DescriptorT: EcomaxEntityDescription](
-    description_factory: Callable[..., DescriptorT], entity: dict[str, Any]
-) -> DescriptorT:
-    """Make description from partial and entity data."""
-
-    @callback
-    def filter_wrapper(update_interval: int) -> Callable[..., Any]:
-        """Return a filter function based on the update interval."""
-
-        def filter_fn[CallableT: Callable[..., Any]](
-            x: CallableT,
-        ) -> Filter | CallableT:
-            """Return a filter function."""
-            return throttle(x, seconds=update_interval) if update_interval > 0 else x
-
-        return filter_fn
-
-    data = {**entity}
-
-    if step := data.get(CONF_STEP, None):
-        data["native_step"] = step
-        del data[CONF_STEP]
-
-    if unit_of_measurement := data.get(CONF_UNIT_OF_MEASUREMENT, None):
-        data["native_unit_of_measurement"] = unit_of_measurement
-        del data[CONF_UNIT_OF_MEASUREMENT]
-
-    if update_interval := data.get(CONF_UPDATE_INTERVAL, None):
-        data["filter_fn"] = filter_wrapper(update_interval)
-        del data[CONF_UPDATE_INTERVAL]
-
-    del data[CONF_SOURCE_DEVICE]
-    return description_factory(**data)
-
-
 @overload
 def async_get_custom_entities[DescriptorT: EcomaxEntityDescription](
     platform: Platform,
@@ -134,22 +101,12 @@ def async_get_custom_entities[DescriptorT: EcomaxEntityDescription](
     description_factory: Callable[..., DescriptorT],
 ) -> Generator[tuple[DescriptorT, int] | DescriptorT]:
     """Return a list of custom entities."""
-    entities: dict[str, Any] = config_entry.options.get(ATTR_ENTITIES, {})
-    target_platform = str(platform)
-    if not entities or target_platform not in entities:
-        return
-
-    index = 0
-    for entity in entities[target_platform].values():
-        entity_source = entity[CONF_SOURCE_DEVICE]
-        if entity_source.startswith(LOGICAL_DEVICES):
-            entity_source, index = entity[CONF_SOURCE_DEVICE].split("_", 1)
-
-        if entity_source == source_device:
-            description = async_make_description_for_custom_entity(
-                description_factory, entity
-            )
-            yield description if index == 0 else (description, int(index))
+    custom_entities = config_entry.runtime_data.custom_entities
+    is_logical_device = source_device in LOGICAL_DEVICES
+    for index, entities in custom_entities.get(platform, source_device).items():
+        for data in entities:
+            description = description_factory(**data)
+            yield (description, index) if is_logical_device else description
 
 
 class EcomaxEntity(Entity):
@@ -159,6 +116,7 @@ class EcomaxEntity(Entity):
     _attr_available = False
     _attr_has_entity_name = True
     _attr_should_poll = False
+    _state_fingerprint: Any = _UNSET
     connection: EcomaxConnection
     entity_description: EcomaxEntityDescription
 
@@ -172,7 +130,7 @@ class EcomaxEntity(Entity):
     async def async_added_to_hass(self) -> None:
         """Subscribe to events."""
         description = self.entity_description
-        handler = description.filter_fn(self.async_update)
+        handler = self.async_economy_filter(description.filter_fn(self.async_update))
 
         async def _async_set_available(value: Any = None) -> None:
             """Mark entity as available."""
@@ -183,13 +141,157 @@ class EcomaxEntity(Entity):
             await _async_set_available(value)
             await handler(value)
         else:
-            self.device.subscribe_once(description.key, _async_set_available)
+            self.async_subscribe(description.key, _async_set_available, once=True)
 
-        self.device.subscribe(description.key, handler)
+        self.async_subscribe(description.key, handler)
 
     async def async_will_remove_from_hass(self) -> None:
         """Unsubscribe from events."""
-        self.device.unsubscribe(self.entity_description.key, self.async_update)
+        self.connection.subscriptions.release_all(self)
+
+    @callback
+    def async_economy_filter(
+        self, handler: EventCallback, name: str | None = None
+    ) -> EventCallback:
+        """Wrap the handler with the economy filter.
+
+        Entities, that accumulate received values, such as meters, opt
+        out of the economy profile, as every value counts. Entities, that
+        are built from several values, pass the value name, so each value
+        is filtered separately.
+        """
+        if not self.entity_description.economy:
+            return handler
+
+        key = self.entity_id if name is None else f"{self.entity_id}.{name}"
+        return self.connection.economy_filter(handler, key=key)
+
+    async def _async_run_handlers(self, handlers: Mapping[str, EventCallback]) -> bool:
+        """Run handlers for the values present in the device data.
+
+        Values are dispatched by the device before the frame event, so
+        entities, that are built from several values, can compute the
+        full state from a single frame and write it once.
+
+        Returns True if any handler changed the entity state.
+        """
+        changed = False
+        data = self.device.data
+        for name, handler in handlers.items():
+            if name in data and await handler(data[name]):
+                changed = True
+
+        return changed
+
+    @callback
+    def async_subscribe(
+        self,
+        name: str,
+        handler: EventCallback,
+        *,
+        once: bool = False,
+        source: EventManager | None = None,
+    ) -> Subscription:
+        """Subscribe to the device event for the lifetime of the entity.
+
+        Events are received from the entity device, unless other source
+        is given.
+        """
+        watchdog = async_get_watchdog(self.hass)
+        return self.connection.subscriptions.subscribe(
+            self,
+            self.device if source is None else source,
+            name,
+            watchdog.wrap(self.entity_id, name, handler),
+            once=once,
+        )
+
+    @asynccontextmanager
+    async def async_write_parameter(
+        self, name: str, value: Any, *attributes: str
+    ) -> AsyncGenerator[None]:
+        """Write the parameter and apply the optimistic state.
+
+        State that is changed inside the context is written right away.
+        Listed attributes are rolled back, if the write fails or the
+        device does not confirm it before the deadline.
+        """
+        previous = {
+            attribute: getattr(self, attribute, _UNSET) for attribute in attributes
+        }
+        yield
+        optimistic = {
+            attribute: getattr(self, attribute, _UNSET) for attribute in attributes
+        }
+
+        @callback
+        def _async_rollback() -> None:
+            """Roll back the optimistic state."""
+            for attribute, previous_value in previous.items():
+                # Keep the value, if it was already updated by the device.
+                if getattr(self, attribute, _UNSET) != optimistic[attribute]:
+                    continue
+
+                if previous_value is _UNSET:
+                    delattr(self, attribute)
+                else:
+                    setattr(self, attribute, previous_value)
+
+            self.async_write_ha_state()
+
+        self.async_write_ha_state()
+        try:
+            confirmed = await self.connection.writes.async_set(self.device, name, value)
+        except Exception as write_failure:
+            _async_rollback()
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="write_failed",
+                translation_placeholders={
+                    "parameter": name,
+                    "value": str(value),
+                    "error": str(write_failure),
+                },
+            ) from write_failure
+
+        if confirmed:
+            return
+
+        _async_rollback()
+        raise HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="write_not_confirmed",
+            translation_placeholders={"parameter": name, "value": str(value)},
+        )
+
+    @override
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state to the state machine."""
+        self._state_fingerprint = _UNSET
+        super().async_write_ha_state()
+
+    @callback
+    def async_write_ha_state_if_changed(self) -> None:
+        """Write the state, unless it is identical to the last write.
+
+        State is fingerprinted by the availability, the state and the
+        state attributes. Writes, that are made unconditionally, reset
+        the fingerprint, so optimistic states are never left behind.
+        """
+        fingerprint = (
+            self.available,
+            self.state,
+            self.capability_attributes,
+            self.state_attributes,
+            self.extra_state_attributes,
+        )
+        if fingerprint == self._state_fingerprint:
+            self.connection.economy_statistics.suppressed_writes += 1
+            return
+
+        self.async_write_ha_state()
+        self._state_fingerprint = fingerprint
 
     @property
     @override
@@ -351,37 +453,40 @@ class MixerEntity(EcomaxEntity):
 
 
 class RegdataEntity(EcomaxEntity):
-    """Represents a regulator data entity."""
+    """Represents a regulator data entity.
+
+    Regulator data key is resolved to the slot of the connection
+    regulator data view once, so the entity receives only its own value.
+    """
 
-    _regdata_key: int
+    _regdata_slot: int
 
     def __init__(
         self, connection: EcomaxConnection, description: EcomaxEntityDescription
     ) -> None:
         """Initialize a new regdata entity."""
-        self._regdata_key = int(description.key)
+        self._regdata_slot = connection.regdata.slot(int(description.key))
         super().__init__(connection, description)
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to regdata event."""
         description = self.entity_description
-        handler = description.filter_fn(self.async_update)
+        regdata = self.connection.regdata
+        name = regdata.name(self._regdata_slot)
+        handler = self.async_economy_filter(description.filter_fn(self.async_update))
 
-        async def async_set_available(regdata: dict[int, Any]) -> None:
+        async def _async_set_available(value: Any = None) -> None:
             """Mark entity as available."""
-            if self._regdata_key in regdata:
-                self._attr_available = True
-
-        if ATTR_REGDATA in self.device.data:
-            await async_set_available(self.device.data[ATTR_REGDATA])
-            await handler(self.device.data[ATTR_REGDATA])
+            self._attr_available = True
 
-        self.device.subscribe_once(ATTR_REGDATA, async_set_available)
-        self.device.subscribe(ATTR_REGDATA, handler)
+        if regdata.has_value(self._regdata_slot):
+            value = regdata.value(self._regdata_slot)
+            await _async_set_available(value)
+            await handler(value)
+        else:
+            self.async_subscribe(name, _async_set_available, once=True, source=regdata)
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Unsubscribe from regdata event."""
-        self.device.unsubscribe(ATTR_REGDATA, self.async_update)
+        self.async_subscribe(name, handler, source=regdata)
 
     @property
     def entity_registry_enabled_default(self) -> bool:
@@ -389,4 +494,4 @@ class RegdataEntity(EcomaxEntity):
 
         This only applies when first added to the entity registry.
         """
-        return self._regdata_key in self.device.data.get(ATTR_REGDATA, {})
+        return self.connection.regdata.has_value(self._regdata_slot)
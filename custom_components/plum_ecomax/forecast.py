@@ -0,0 +1,152 @@
+"""Fuel depletion forecast for the Plum ecoMAX integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+import time
+from typing import Any, Final
+
+from pyplumio.helpers.event_manager import EventCallback
+
+# Time constant of the exponential forgetting in hours.
+FORECAST_TIME_CONSTANT: Final = 12.0
+
+# Fuel level increase in percents, that is considered a hopper refill.
+REFILL_THRESHOLD: Final = 5.0
+
+# Minimum effective number of samples to make a forecast.
+MIN_SAMPLES: Final = 3.0
+
+SECONDS_PER_HOUR: Final = 3600
+
+
+@dataclass(frozen=True, slots=True)
+class FuelForecast:
+    """Represents a fuel depletion forecast.
+
+    Rate is a fuel level change in percents per hour and confidence is
+    a fraction between zero and one.
+    """
+
+    level: float
+    rate: float
+    hours_left: float | None
+    confidence: float
+
+
+class FuelForecaster:
+    """Represents an online fuel depletion estimator.
+
+    Fuel level is fitted with a weighted least squares line, where
+    weights decay exponentially with the sample age. Only the weighted
+    sums are kept and the time origin is moved to the newest sample,
+    so each sample is accounted in constant time and memory.
+
+    Fit is reset, when the hopper is refilled.
+    """
+
+    __slots__ = (
+        "_last_level",
+        "_last_timestamp",
+        "_s0",
+        "_span",
+        "_st",
+        "_stt",
+        "_stv",
+        "_sv",
+        "_svv",
+        "time_constant",
+    )
+
+    _last_level: float | None
+    _last_timestamp: float | None
+    _s0: float
+    _span: float
+    _st: float
+    _stt: float
+    _stv: float
+    _sv: float
+    _svv: float
+    time_constant: float
+
+    def __init__(self, time_constant: float = FORECAST_TIME_CONSTANT) -> None:
+        """Initialize a new fuel depletion estimator."""
+        self.time_constant = time_constant
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset the fit."""
+        self._last_level = None
+        self._last_timestamp = None
+        self._s0 = self._st = self._sv = 0.0
+        self._stt = self._stv = self._svv = 0.0
+        self._span = 0.0
+
+    def append(self, timestamp: float, level: float) -> None:
+        """Account the fuel level sample."""
+        if (
+            self._last_timestamp is None
+            or self._last_level is None
+            or level - self._last_level >= REFILL_THRESHOLD
+        ):
+            self.reset()
+            dt = 0.0
+        else:
+            dt = max(timestamp - self._last_timestamp, 0.0) / SECONDS_PER_HOUR
+
+        if dt > 0:
+            # Move the time origin to the new sample and decay the weights.
+            self._stt += dt * (dt * self._s0 - 2 * self._st)
+            self._st -= dt * self._s0
+            self._stv -= dt * self._sv
+            decay = math.exp(-dt / self.time_constant)
+            self._s0 *= decay
+            self._st *= decay
+            self._sv *= decay
+            self._stt *= decay
+            self._stv *= decay
+            self._svv *= decay
+            self._span += dt
+
+        self._s0 += 1
+        self._sv += level
+        self._svv += level * level
+        self._last_level = level
+        self._last_timestamp = timestamp
+
+    def handler(self) -> EventCallback:
+        """Return the event callback that accounts the fuel level."""
+
+        async def _async_append(value: Any) -> None:
+            """Account the fuel level sample."""
+            if isinstance(value, int | float) and not isinstance(value, bool):
+                self.append(time.monotonic(), value)
+
+        return _async_append
+
+    def forecast(self) -> FuelForecast | None:
+        """Return the fuel depletion forecast."""
+        s0, st, sv = self._s0, self._st, self._sv
+        if s0 < MIN_SAMPLES or (denominator := s0 * self._stt - st * st) <= 0:
+            return None
+
+        covariance = s0 * self._stv - st * sv
+        rate = covariance / denominator
+        level = max((sv - rate * st) / s0, 0.0)
+        variance = s0 * self._svv - sv * sv
+        r_squared = (
+            min(covariance * covariance / (denominator * variance), 1.0)
+            if variance > 0
+            else 1.0
+        )
+        return FuelForecast(
+            level=level,
+            rate=rate,
+            hours_left=level / -rate if rate < 0 else None,
+            confidence=r_squared * min(self._span / self.time_constant, 1.0),
+        )
+
+    def __len__(self) -> int:
+        """Return effective number of the samples."""
+        return int(self._s0)
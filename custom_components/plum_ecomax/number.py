@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import partial
 import logging
 from typing import Any, cast
 
@@ -105,16 +106,17 @@ class EcomaxNumber(EcomaxEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Update current value."""
-        self.device.set_nowait(self.entity_description.key, value)
-        self._attr_native_value = value
-        self.async_write_ha_state()
+        async with self.async_write_parameter(
+            self.entity_description.key, value, "_attr_native_value"
+        ):
+            self._attr_native_value = value
 
     async def async_update(self, value: Parameter) -> None:
         """Update entity state."""
         self._attr_native_value = cast(float, value.value)
         self._attr_native_min_value = cast(float, value.min_value)
         self._attr_native_max_value = cast(float, value.max_value)
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed()
 
 
 @callback
@@ -311,6 +313,23 @@ def async_setup_custom_thermostat_numbers(
     ]
 
 
+async def async_setup_custom_numbers(
+    connection: EcomaxConnection, config_entry: PlumEcomaxConfigEntry
+) -> list[EcomaxNumber]:
+    """Set up the custom numbers."""
+    entities = async_setup_custom_ecomax_numbers(connection, config_entry)
+
+    # Add custom mixer/circuit numbers.
+    if connection.has_mixers and await connection.async_setup_mixers():
+        entities += async_setup_custom_mixer_numbers(connection, config_entry)
+
+    # Add custom thermostat numbers.
+    if connection.has_thermostats and await connection.async_setup_thermostats():
+        entities += async_setup_custom_thermostat_numbers(connection, config_entry)
+
+    return entities
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: PlumEcomaxConfigEntry,
@@ -322,17 +341,16 @@ async def async_setup_entry(
     connection = entry.runtime_data.connection
     entities = async_setup_ecomax_numbers(connection)
 
-    # Add custom ecoMAX numbers.
-    entities += async_setup_custom_ecomax_numbers(connection, entry)
-
     # Add mixer/circuit numbers.
     if connection.has_mixers and await connection.async_setup_mixers():
         entities += async_setup_mixer_numbers(connection)
-        entities += async_setup_custom_mixer_numbers(connection, entry)
-
-    # Add thermostat numbers.
-    if connection.has_thermostats and await connection.async_setup_thermostats():
-        entities += async_setup_custom_thermostat_numbers(connection, entry)
 
     async_add_entities(entities)
+
+    # Add custom numbers.
+    await entry.runtime_data.async_setup_custom_entities(
+        Platform.NUMBER,
+        partial(async_setup_custom_numbers, connection, entry),
+        async_add_entities,
+    )
     return True
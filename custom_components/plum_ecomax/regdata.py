@@ -0,0 +1,86 @@
+"""Regulator data view for the Plum ecoMAX integration."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Final
+
+from pyplumio.helpers.event_manager import EventManager
+
+_LOGGER = logging.getLogger(__name__)
+
+_MISSING: Final = object()
+
+
+class RegdataView(EventManager[Any]):
+    """Represents a slot-addressed view of the regulator data.
+
+    Keys are resolved to the slots once, when entities are set up.
+    Each regulator data frame is copied into the slots and the values
+    are dispatched to the slot subscribers one by one, so entities
+    receive and compare scalar values instead of the whole dictionary.
+    """
+
+    __slots__ = ("_keys", "_names", "_slots", "_values")
+
+    _keys: list[int]
+    _names: list[str]
+    _slots: dict[int, int]
+    _values: list[Any]
+
+    def __init__(self) -> None:
+        """Initialize a new regulator data view."""
+        super().__init__()
+        self._keys = []
+        self._names = []
+        self._slots = {}
+        self._values = []
+
+    def slot(self, key: int) -> int:
+        """Resolve the key to the slot, allocating it if needed."""
+        if (slot := self._slots.get(key, None)) is None:
+            slot = self._slots[key] = len(self._keys)
+            self._keys.append(key)
+            self._names.append(str(key))
+            self._values.append(_MISSING)
+
+        return slot
+
+    def name(self, slot: int) -> str:
+        """Return the event name of the slot."""
+        return self._names[slot]
+
+    def has_value(self, slot: int) -> bool:
+        """Return if the slot has received a value."""
+        return self._values[slot] is not _MISSING
+
+    def value(self, slot: int, default: Any = None) -> Any:
+        """Return the slot value."""
+        if (value := self._values[slot]) is _MISSING:
+            return default
+
+        return value
+
+    async def async_update(self, regdata: dict[int, Any]) -> None:
+        """Copy the regulator data into the slots and dispatch it.
+
+        Values are kept in the slots only, instead of the event data,
+        so no copy of the regulator data outlives the frame.
+        """
+        values = self._values
+        for slot, key in enumerate(self._keys):
+            if (value := regdata.get(key, _MISSING)) is _MISSING:
+                continue
+
+            values[slot] = value
+            for callback in tuple(self._callbacks.get(self._names[slot], ())):
+                try:
+                    await callback(value)
+                except Exception:
+                    _LOGGER.exception(
+                        "Error in regulator data listener %s", callback.__name__
+                    )
+
+    def __len__(self) -> int:
+        """Return number of the slots."""
+        return len(self._keys)
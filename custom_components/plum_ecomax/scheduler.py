@@ -0,0 +1,184 @@
+"""Outgoing frame scheduler for the Plum ecoMAX integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from enum import IntEnum, unique
+import logging
+import time
+from typing import Any, Final
+
+from pyplumio.connection import Connection
+from pyplumio.const import FrameType
+from pyplumio.frames import Frame
+from pyplumio.protocol import AsyncProtocol
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@unique
+class FramePriority(IntEnum):
+    """Contains frame priority classes, from highest to lowest."""
+
+    INTERACTIVE = 0
+    SERVICE = 1
+    BACKGROUND = 2
+
+
+FRAME_PRIORITIES: Final[dict[FrameType, FramePriority]] = {
+    FrameType.REQUEST_ECOMAX_CONTROL: FramePriority.INTERACTIVE,
+    FrameType.REQUEST_SET_ECOMAX_PARAMETER: FramePriority.INTERACTIVE,
+    FrameType.REQUEST_SET_MIXER_PARAMETER: FramePriority.INTERACTIVE,
+    FrameType.REQUEST_SET_THERMOSTAT_PARAMETER: FramePriority.INTERACTIVE,
+    FrameType.REQUEST_SET_SCHEDULE: FramePriority.SERVICE,
+}
+
+
+@dataclass(slots=True)
+class SchedulerStatistics:
+    """Represents frame scheduler statistics for a priority class."""
+
+    sent: int = 0
+    cancelled: int = 0
+    max_wait: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return statistics as a dictionary."""
+        return {
+            "sent": self.sent,
+            "cancelled": self.cancelled,
+            "max_wait": round(self.max_wait, 3),
+        }
+
+
+class _PendingFrames:
+    """Represents pending frames, grouped by priority class and type."""
+
+    __slots__ = ("_length", "_queues")
+
+    _length: int
+    _queues: dict[FramePriority, dict[FrameType, deque[tuple[float, Frame]]]]
+
+    def __init__(self) -> None:
+        """Initialize new pending frames."""
+        self._length = 0
+        self._queues = {priority: {} for priority in FramePriority}
+
+    def append(self, frame: Frame) -> None:
+        """Append the frame to its priority class."""
+        priority = FRAME_PRIORITIES.get(frame.frame_type, FramePriority.BACKGROUND)
+        queues = self._queues[priority]
+        queues.setdefault(frame.frame_type, deque()).append((time.monotonic(), frame))
+        self._length += 1
+
+    def popleft(self) -> tuple[FramePriority, float, Frame]:
+        """Pop the next frame from the highest non-empty priority class.
+
+        Frame types within a class take turns, so retries of a single
+        request can't starve the others.
+        """
+        for priority, queues in self._queues.items():
+            if not queues:
+                continue
+
+            frame_type = next(iter(queues))
+            frames = queues.pop(frame_type)
+            queued_at, frame = frames.popleft()
+            if frames:
+                # Move the frame type to the end of the queue.
+                queues[frame_type] = frames
+
+            self._length -= 1
+            return priority, queued_at, frame
+
+        raise IndexError("pop from empty pending frames")
+
+    def pending(self, priority: FramePriority) -> int:
+        """Return number of pending frames in the priority class."""
+        return sum(len(frames) for frames in self._queues[priority].values())
+
+    def __len__(self) -> int:
+        """Return number of pending frames."""
+        return self._length
+
+
+class FrameScheduler(asyncio.Queue[Frame]):
+    """Represents an outgoing frame scheduler.
+
+    Scheduler replaces the pyplumio write queue, so every frame that is
+    sent to the device, including pyplumio retries and periodic
+    requests, passes through it. Frames are sent strictly by priority
+    class, so a parameter write never waits behind the background
+    requests. Within a class frame types are sent round-robin.
+    """
+
+    _queue: _PendingFrames
+    statistics: dict[FramePriority, SchedulerStatistics]
+
+    def __init__(self) -> None:
+        """Initialize a new frame scheduler."""
+        self.statistics = {
+            priority: SchedulerStatistics() for priority in FramePriority
+        }
+        super().__init__()
+
+    def _init(self, maxsize: int) -> None:
+        """Initialize the pending frames."""
+        self._queue = _PendingFrames()
+
+    def _put(self, item: Frame) -> None:
+        """Put the frame into its priority class."""
+        self._queue.append(item)
+
+    def _get(self) -> Frame:
+        """Get the frame with the highest priority."""
+        priority, queued_at, frame = self._queue.popleft()
+        statistics = self.statistics[priority]
+        statistics.sent += 1
+        statistics.max_wait = max(statistics.max_wait, time.monotonic() - queued_at)
+        return frame
+
+    def cancel(self) -> int:
+        """Cancel all pending frames.
+
+        Returns number of cancelled frames.
+        """
+        cancelled = 0
+        while self._queue:
+            priority, _, _ = self._queue.popleft()
+            self.statistics[priority].cancelled += 1
+            self.task_done()
+            cancelled += 1
+
+        if cancelled:
+            _LOGGER.debug("Cancelled %d pending frame(s)", cancelled)
+
+        return cancelled
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return scheduler statistics as a dictionary."""
+        return {
+            priority.name.lower(): {
+                **statistics.as_dict(),
+                "pending": self._queue.pending(priority),
+            }
+            for priority, statistics in self.statistics.items()
+        }
+
+
+def create_protocol() -> AsyncProtocol:
+    """Return the protocol that sends frames through the scheduler."""
+    protocol = AsyncProtocol()
+
+    # Devices keep a reference to the write queue, so it must be replaced
+    # before the connection is established.
+    protocol._write_queue = FrameScheduler()  # noqa: SLF001
+    return protocol
+
+
+def get_scheduler(connection: Connection) -> FrameScheduler | None:
+    """Return the frame scheduler of the connection, if it has one."""
+    write_queue = getattr(connection.protocol, "_write_queue", None)
+    return write_queue if isinstance(write_queue, FrameScheduler) else None
@@ -56,15 +56,18 @@ class EcomaxSelect(EcomaxEntity, SelectEntity):
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
         if options := self.entity_description.options:
-            self.device.set_nowait(self.entity_description.key, options.index(option))
-            self._attr_current_option = option
-            self.async_write_ha_state()
+            async with self.async_write_parameter(
+                self.entity_description.key,
+                options.index(option),
+                "_attr_current_option",
+            ):
+                self._attr_current_option = option
 
     async def async_update(self, value: Any) -> None:
         """Update entity state."""
         if self.entity_description.options:
             self._attr_current_option = self.entity_description.options[int(value)]
-            self.async_write_ha_state()
+            self.async_write_ha_state_if_changed()
 
 
 @dataclass(frozen=True, kw_only=True)
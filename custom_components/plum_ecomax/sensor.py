@@ -6,7 +6,7 @@ from collections.abc import Callable
 from dataclasses import asdict, astuple, dataclass
 from functools import partial
 import logging
-from typing import Any, Final, cast
+from typing import Any, Final, Literal, cast
 
 from homeassistant.components.sensor import (
     RestoreSensor,
@@ -25,6 +25,7 @@ from homeassistant.const import (
     UnitOfMass,
     UnitOfPower,
     UnitOfTemperature,
+    UnitOfTime,
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
@@ -37,7 +38,9 @@ from pyplumio.structures.sensor_data import ConnectedModules
 from . import PlumEcomaxConfigEntry
 from .connection import EcomaxConnection
 from .const import DEFAULT_TOLERANCE, DeviceType, ModuleType
+from .cycles import CycleCounters, CyclePeriod, RuntimeCounter
 from .entity import (
+    ALL,
     EcomaxEntity,
     EcomaxEntityDescription,
     MixerEntity,
@@ -47,11 +50,24 @@ from .entity import (
     async_get_by_product_type,
     async_get_custom_entities,
 )
+from .storage import MeterStore
+from .windows import DEFAULT_WINDOW
 
 UPDATE_INTERVAL: Final = 10
 
+SECONDS_PER_HOUR: Final = 3600
+
+# Fixed-point scale of the meter accumulator (kg to mg).
+METER_SCALE: Final = 1_000_000
+
 ATTR_BURNED_SINCE_LAST_UPDATE: Final = "burned_since_last_update"
+ATTR_CONFIDENCE: Final = "confidence"
+ATTR_CONSUMPTION_RATE: Final = "consumption_rate"
+ATTR_LAST_RUN_TIME: Final = "last_run_time"
+ATTR_MEAN_RUN_TIME: Final = "mean_run_time"
 ATTR_NUMERIC_STATE: Final = "numeric_state"
+ATTR_SAMPLES: Final = "samples"
+ATTR_WINDOW: Final = "window"
 
 STATE_STABILIZATION: Final = "stabilization"
 STATE_KINDLING: Final = "kindling"
@@ -363,7 +379,7 @@ class EcomaxSensor(EcomaxEntity, SensorEntity):
                 key: value for key, value in asdict(value).items() if value is not None
             }
 
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed()
 
 
 @callback
@@ -507,6 +523,7 @@ METER_TYPES: tuple[EcomaxMeterEntityDescription, ...] = (
     EcomaxMeterEntityDescription(
         key="fuel_burned",
         always_available=True,
+        economy=False,
         filter_fn=lambda x: aggregate(x, seconds=30, sample_size=50),
         native_unit_of_measurement=UnitOfMass.KILOGRAMS,
         product_types={ProductType.ECOMAX_P},
@@ -519,36 +536,72 @@ METER_TYPES: tuple[EcomaxMeterEntityDescription, ...] = (
 
 
 class EcomaxMeter(EcomaxSensor, RestoreSensor):
-    """Represents an ecoMAX sensor that restores previous value."""
+    """Represents an ecoMAX sensor that restores previous value.
 
+    Meter value is accumulated as a fixed-point integer to avoid drifting
+    from float summation and is periodically checkpointed to the storage.
+    """
+
+    _accumulator: int
     _attr_device_class = DEVICE_CLASS_METER  # type: ignore[assignment]
+    _store: MeterStore
     _unrecorded_attributes = frozenset({ATTR_BURNED_SINCE_LAST_UPDATE})
     entity_description: EcomaxMeterEntityDescription
 
     def __init__(
-        self, connection: EcomaxConnection, description: EcomaxMeterEntityDescription
+        self,
+        connection: EcomaxConnection,
+        description: EcomaxMeterEntityDescription,
+        store: MeterStore,
     ) -> None:
         """Initialize a new meter."""
         super().__init__(connection, description)
+        self._accumulator = 0
         self._attr_native_value = 0.0
+        self._store = store
 
     async def async_added_to_hass(self) -> None:
         """Restore native value."""
         await super().async_added_to_hass()
-        if (last_sensor_data := await self.async_get_last_sensor_data()) is not None:
-            self._attr_native_value = cast(float, last_sensor_data.native_value)
+        checkpoint = self._store.get(self.entity_description.key)
+        last_state = await self.async_get_last_state()
+        last_sensor_data = await self.async_get_last_sensor_data()
+        if last_sensor_data is not None and last_state is not None:
             self._attr_native_unit_of_measurement = (
                 last_sensor_data.native_unit_of_measurement
             )
+            if checkpoint is None or last_state.last_updated > checkpoint.last_updated:
+                self._set_accumulator(
+                    round(
+                        float(cast(float, last_sensor_data.native_value)) * METER_SCALE
+                    )
+                )
+                return
+
+        if checkpoint is not None:
+            self._set_accumulator(checkpoint.value)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Write the meter checkpoint and unsubscribe from events."""
+        await super().async_will_remove_from_hass()
+        await self._store.async_save()
+
+    def _set_accumulator(self, value: int, force_checkpoint: bool = False) -> None:
+        """Set the accumulator value and store the checkpoint."""
+        self._accumulator = value
+        self._attr_native_value = value / METER_SCALE
+        self._store.async_checkpoint(
+            self.entity_description.key, value, force=force_checkpoint
+        )
 
     async def async_calibrate_meter(self, value: float) -> None:
         """Calibrate meter state."""
-        self._attr_native_value = value
+        self._set_accumulator(round(value * METER_SCALE), force_checkpoint=True)
         self.async_write_ha_state()
 
     async def async_reset_meter(self) -> None:
         """Reset stored value."""
-        self._attr_native_value = 0.0
+        self._set_accumulator(0, force_checkpoint=True)
         self.async_write_ha_state()
 
     async def async_update(self, value: float | None = None) -> None:
@@ -557,7 +610,7 @@ class EcomaxMeter(EcomaxSensor, RestoreSensor):
             self._attr_extra_state_attributes = {
                 ATTR_BURNED_SINCE_LAST_UPDATE: value * 1000
             }
-            self._attr_native_value += value  # type: ignore[operator]
+            self._set_accumulator(self._accumulator + round(value * METER_SCALE))
 
         self.async_write_ha_state()
 
@@ -568,10 +621,12 @@ class EcomaxMeter(EcomaxSensor, RestoreSensor):
 
 
 @callback
-def async_setup_ecomax_meters(connection: EcomaxConnection) -> list[EcomaxMeter]:
+def async_setup_ecomax_meters(
+    connection: EcomaxConnection, store: MeterStore
+) -> list[EcomaxMeter]:
     """Set up the ecoMAX meters."""
     return [
-        EcomaxMeter(connection, description)
+        EcomaxMeter(connection, description, store)
         for description in async_get_by_modules(
             connection.device.modules,
             async_get_by_product_type(connection.product_type, METER_TYPES),
@@ -580,20 +635,373 @@ def async_setup_ecomax_meters(connection: EcomaxConnection) -> list[EcomaxMeter]
 
 
 @dataclass(frozen=True, kw_only=True)
-class RegdataSensorEntityDescription(EcomaxSensorEntityDescription):
-    """Describes a regulator data sensor."""
+class DerivedSensorEntityDescription(EcomaxSensorEntityDescription):
+    """Describes a sensor derived from the source key."""
 
+    source: str
 
-class RegdataSensor(RegdataEntity, EcomaxSensor):
-    """Represents a regulator data sensor."""
 
-    async def async_update(self, regdata: dict[int, Any]) -> None:
+class DerivedSensor(EcomaxSensor):
+    """Represents a sensor derived from the source key.
+
+    State is computed from the data kept by the connection and is
+    refreshed when the source value is updated.
+    """
+
+    entity_description: DerivedSensorEntityDescription
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to source events."""
+        description = self.entity_description
+        handler = description.filter_fn(self.async_update)
+        if description.source in self.device.data:
+            await handler(None)
+
+        self.async_subscribe(description.source, handler)
+
+    async def async_update(self, value: Any = None) -> None:
+        """Update entity state."""
+        raise NotImplementedError
+
+
+@dataclass(frozen=True, kw_only=True)
+class WindowSensorEntityDescription(DerivedSensorEntityDescription):
+    """Describes a rolling window sensor."""
+
+    statistic: Literal["minimum", "maximum", "mean", "slope"]
+    window: int = DEFAULT_WINDOW
+
+
+WINDOW_SENSOR_TYPES: tuple[WindowSensorEntityDescription, ...] = tuple(
+    WindowSensorEntityDescription(
+        key=f"{source}_{statistic}",
+        device_class=SensorDeviceClass.TEMPERATURE if statistic != "slope" else None,
+        filter_fn=lambda x: throttle(x, seconds=UPDATE_INTERVAL),
+        native_unit_of_measurement=(
+            UnitOfTemperature.CELSIUS
+            if statistic != "slope"
+            else f"{UnitOfTemperature.CELSIUS}/min"
+        ),
+        product_types=product_types,
+        source=source,
+        state_class=SensorStateClass.MEASUREMENT,
+        statistic=statistic,
+        suggested_display_precision=1 if statistic != "slope" else 2,
+        translation_key=f"{source}_{statistic}",
+        value_fn=lambda x: x,
+    )
+    for source, product_types in (
+        ("heating_temp", ALL),
+        ("exhaust_temp", {ProductType.ECOMAX_P}),
+    )
+    for statistic in ("minimum", "maximum", "mean", "slope")
+)
+
+
+class WindowSensor(DerivedSensor):
+    """Represents a sensor derived from the rolling window.
+
+    State is computed from the raw source values kept in memory.
+    """
+
+    _unrecorded_attributes = frozenset({ATTR_SAMPLES, ATTR_WINDOW})
+    entity_description: WindowSensorEntityDescription
+
+    async def async_update(self, value: Any = None) -> None:
         """Update entity state."""
-        self._attr_native_value = self.entity_description.value_fn(
-            regdata.get(self._regdata_key, None)
+        description = self.entity_description
+        statistics = self.connection.windows.statistics(
+            description.source, description.window
         )
+        if statistics is None:
+            return
+
+        self._attr_available = True
+        self._attr_native_value = description.value_fn(
+            getattr(statistics, description.statistic)
+        )
+        self._attr_extra_state_attributes = {
+            ATTR_SAMPLES: statistics.count,
+            ATTR_WINDOW: description.window,
+        }
+        self.async_write_ha_state()
+
+
+@callback
+def async_setup_window_sensors(connection: EcomaxConnection) -> list[WindowSensor]:
+    """Set up the rolling window sensors."""
+    return [
+        WindowSensor(connection, description)
+        for description in async_get_by_modules(
+            connection.device.modules,
+            async_get_by_product_type(connection.product_type, WINDOW_SENSOR_TYPES),
+        )
+    ]
+
+
+@dataclass(frozen=True, kw_only=True)
+class FuelForecastSensorEntityDescription(DerivedSensorEntityDescription):
+    """Describes a fuel depletion forecast sensor."""
+
+
+FUEL_FORECAST_SENSOR_TYPES: tuple[FuelForecastSensorEntityDescription, ...] = (
+    FuelForecastSensorEntityDescription(
+        key="fuel_depletion",
+        device_class=SensorDeviceClass.DURATION,
+        filter_fn=lambda x: throttle(x, seconds=UPDATE_INTERVAL),
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        product_types={ProductType.ECOMAX_P},
+        source="fuel_level",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        translation_key="fuel_depletion",
+        value_fn=lambda x: x,
+    ),
+)
+
+
+class FuelForecastSensor(DerivedSensor):
+    """Represents a fuel depletion forecast sensor.
+
+    State is a time left until the hopper is empty, estimated from
+    the fuel level trend.
+    """
+
+    _unrecorded_attributes = frozenset({ATTR_CONFIDENCE, ATTR_CONSUMPTION_RATE})
+    entity_description: FuelForecastSensorEntityDescription
+
+    async def async_update(self, value: Any = None) -> None:
+        """Update entity state."""
+        if (forecast := self.connection.fuel_forecast.forecast()) is None:
+            return
+
+        self._attr_available = True
+        self._attr_native_value = self.entity_description.value_fn(forecast.hours_left)
+        self._attr_extra_state_attributes = {
+            ATTR_CONFIDENCE: round(forecast.confidence * 100),
+            ATTR_CONSUMPTION_RATE: round(-forecast.rate, 2),
+        }
         self.async_write_ha_state()
 
+    @property
+    def entity_registry_enabled_default(self) -> bool:
+        """Return if the entity should be enabled when first added.
+
+        This only applies when first added to the entity registry.
+        """
+        return self.entity_description.source in self.device.data
+
+
+@callback
+def async_setup_fuel_forecast_sensors(
+    connection: EcomaxConnection,
+) -> list[FuelForecastSensor]:
+    """Set up the fuel depletion forecast sensors."""
+    return [
+        FuelForecastSensor(connection, description)
+        for description in async_get_by_modules(
+            connection.device.modules,
+            async_get_by_product_type(
+                connection.product_type, FUEL_FORECAST_SENSOR_TYPES
+            ),
+        )
+    ]
+
+
+@dataclass(frozen=True, kw_only=True)
+class BurnerCycleSensorEntityDescription(EcomaxSensorEntityDescription):
+    """Describes a burner cycle sensor."""
+
+    period: CyclePeriod
+    value_fn: Callable[[CycleCounters], Any]
+
+
+def _get_hours_in_state(counters: CycleCounters, state: DeviceState) -> float:
+    """Return time spent in the state in hours."""
+    return counters.duration(state) / SECONDS_PER_HOUR
+
+
+BURNER_CYCLE_SENSOR_TYPES: tuple[BurnerCycleSensorEntityDescription, ...] = (
+    *(
+        BurnerCycleSensorEntityDescription(
+            key=f"burner_starts_{period}",
+            entity_registry_enabled_default=period != CyclePeriod.WEEKLY,
+            period=period,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            translation_key=f"burner_starts_{period}",
+            value_fn=lambda x: x.starts,
+        )
+        for period in CyclePeriod
+    ),
+    *(
+        BurnerCycleSensorEntityDescription(
+            key=f"{state.name.lower()}_time_{period}",
+            device_class=SensorDeviceClass.DURATION,
+            entity_registry_enabled_default=period != CyclePeriod.WEEKLY,
+            native_unit_of_measurement=UnitOfTime.HOURS,
+            period=period,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            suggested_display_precision=1,
+            translation_key=f"{state.name.lower()}_time_{period}",
+            value_fn=partial(_get_hours_in_state, state=state),
+        )
+        for state in (
+            DeviceState.KINDLING,
+            DeviceState.WORKING,
+            DeviceState.SUPERVISION,
+        )
+        for period in CyclePeriod
+    ),
+)
+
+
+class BurnerCycleSensor(EcomaxSensor):
+    """Represents a burner cycle sensor.
+
+    State is updated by the burner cycle tracker, when device state
+    changes and periodically, while the state lasts.
+    """
+
+    _unrecorded_attributes = frozenset({ATTR_LAST_RUN_TIME, ATTR_MEAN_RUN_TIME})
+    entity_description: BurnerCycleSensorEntityDescription
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to burner cycle updates."""
+        self.async_on_remove(
+            self.connection.cycles.async_add_listener(self._async_handle_update)
+        )
+        self._async_handle_update()
+
+    @callback
+    def _async_handle_update(self) -> None:
+        """Update entity state."""
+        cycles = self.connection.cycles
+        counters = cycles.statistics(self.entity_description.period)
+        self._attr_available = True
+        self._attr_native_value = self.entity_description.value_fn(counters)
+        self._attr_extra_state_attributes = {
+            ATTR_LAST_RUN_TIME: cycles.last_run_time,
+            ATTR_MEAN_RUN_TIME: counters.mean_run_time,
+        }
+        self.async_write_ha_state()
+
+
+@callback
+def async_setup_burner_cycle_sensors(
+    connection: EcomaxConnection,
+) -> list[BurnerCycleSensor]:
+    """Set up the burner cycle sensors."""
+    return [
+        BurnerCycleSensor(connection, description)
+        for description in async_get_by_modules(
+            connection.device.modules,
+            async_get_by_product_type(
+                connection.product_type, BURNER_CYCLE_SENSOR_TYPES
+            ),
+        )
+    ]
+
+
+@dataclass(frozen=True, kw_only=True)
+class RuntimeSensorEntityDescription(EcomaxSensorEntityDescription):
+    """Describes an equipment runtime sensor."""
+
+    source: str
+    value_fn: Callable[[RuntimeCounter], Any]
+
+
+RUNTIME_SOURCES: tuple[tuple[str, set[ProductType] | Literal["all"]], ...] = (
+    ("heating_pump", ALL),
+    ("water_heater_pump", ALL),
+    ("circulation_pump", ALL),
+    ("fan", {ProductType.ECOMAX_P}),
+    ("feeder", {ProductType.ECOMAX_P}),
+    ("lighter", {ProductType.ECOMAX_P}),
+)
+
+RUNTIME_SENSOR_TYPES: tuple[RuntimeSensorEntityDescription, ...] = (
+    *(
+        RuntimeSensorEntityDescription(
+            key=f"{source}_runtime",
+            device_class=SensorDeviceClass.DURATION,
+            native_unit_of_measurement=UnitOfTime.HOURS,
+            product_types=product_types,
+            source=source,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            suggested_display_precision=1,
+            translation_key=f"{source}_runtime",
+            value_fn=lambda x: x.runtime / SECONDS_PER_HOUR,
+        )
+        for source, product_types in RUNTIME_SOURCES
+    ),
+    *(
+        RuntimeSensorEntityDescription(
+            key=f"{source}_starts",
+            product_types=product_types,
+            source=source,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            translation_key=f"{source}_starts",
+            value_fn=lambda x: x.starts,
+        )
+        for source, product_types in RUNTIME_SOURCES
+    ),
+)
+
+
+class RuntimeSensor(EcomaxSensor):
+    """Represents an equipment runtime sensor.
+
+    State is updated by the runtime counters, when equipment is turned
+    on or off and periodically, while it is running.
+    """
+
+    entity_description: RuntimeSensorEntityDescription
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to runtime counter updates."""
+        self.async_on_remove(
+            self.connection.runtimes.async_add_listener(self._async_handle_update)
+        )
+        self._async_handle_update()
+
+    @callback
+    def _async_handle_update(self) -> None:
+        """Update entity state."""
+        description = self.entity_description
+        counter = self.connection.runtimes.get(description.source)
+        self._attr_available = True
+        self._attr_native_value = description.value_fn(counter)
+        self.async_write_ha_state()
+
+    @property
+    def entity_registry_enabled_default(self) -> bool:
+        """Return if the entity should be enabled when first added.
+
+        This only applies when first added to the entity registry.
+        """
+        return self.entity_description.source in self.device.data
+
+
+@callback
+def async_setup_runtime_sensors(connection: EcomaxConnection) -> list[RuntimeSensor]:
+    """Set up the equipment runtime sensors."""
+    return [
+        RuntimeSensor(connection, description)
+        for description in async_get_by_modules(
+            connection.device.modules,
+            async_get_by_product_type(connection.product_type, RUNTIME_SENSOR_TYPES),
+        )
+    ]
+
+
+@dataclass(frozen=True, kw_only=True)
+class RegdataSensorEntityDescription(EcomaxSensorEntityDescription):
+    """Describes a regulator data sensor."""
+
+
+class RegdataSensor(RegdataEntity, EcomaxSensor):
+    """Represents a regulator data sensor."""
+
 
 @callback
 def async_setup_custom_regdata_sensors(
@@ -652,6 +1060,29 @@ def async_setup_custom_thermostat_sensors(
     ]
 
 
+async def async_setup_custom_sensors(
+    connection: EcomaxConnection, config_entry: PlumEcomaxConfigEntry
+) -> list[EcomaxSensor]:
+    """Set up the custom sensors."""
+    entities = async_setup_custom_ecomax_sensors(connection, config_entry)
+
+    # Add custom regulator data (device-specific) sensors.
+    if (
+        regdata_entities := async_setup_custom_regdata_sensors(connection, config_entry)
+    ) and await connection.async_setup_regdata():
+        entities += regdata_entities
+
+    # Add custom mixer/circuit sensors.
+    if connection.has_mixers and await connection.async_setup_mixers():
+        entities += async_setup_custom_mixer_sensors(connection, config_entry)
+
+    # Add custom thermostat sensors.
+    if connection.has_thermostats and await connection.async_setup_thermostats():
+        entities += async_setup_custom_thermostat_sensors(connection, config_entry)
+
+    return entities
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: PlumEcomaxConfigEntry,
@@ -663,27 +1094,34 @@ async def async_setup_entry(
     connection = entry.runtime_data.connection
     entities = async_setup_ecomax_sensors(connection)
 
-    # Add custom ecoMAX sensors.
-    entities += async_setup_custom_ecomax_sensors(connection, entry)
-
-    # Add custom regulator data (device-specific) sensors.
-    if (
-        regdata_entities := async_setup_custom_regdata_sensors(connection, entry)
-    ) and await connection.async_setup_regdata():
-        entities += regdata_entities
-
     # Add mixer/circuit sensors.
     if connection.has_mixers and await connection.async_setup_mixers():
         entities += async_setup_mixer_sensors(connection)
-        entities += async_setup_custom_mixer_sensors(connection, entry)
-
-    # Add thermostat sensors.
-    if connection.has_thermostats and await connection.async_setup_thermostats():
-        entities += async_setup_custom_thermostat_sensors(connection, entry)
 
     # Add ecoMAX meters.
-    if meters := async_setup_ecomax_meters(connection):
+    store = MeterStore(hass, entry.entry_id)
+    if meters := async_setup_ecomax_meters(connection, store):
+        await store.async_load()
         entities += meters
 
+    # Add rolling window sensors.
+    entities += async_setup_window_sensors(connection)
+
+    # Add fuel depletion forecast sensors.
+    entities += async_setup_fuel_forecast_sensors(connection)
+
+    # Add burner cycle sensors.
+    entities += async_setup_burner_cycle_sensors(connection)
+
+    # Add equipment runtime sensors.
+    entities += async_setup_runtime_sensors(connection)
+
     async_add_entities(entities)
+
+    # Add custom sensors.
+    await entry.runtime_data.async_setup_custom_entities(
+        Platform.SENSOR,
+        partial(async_setup_custom_sensors, connection, entry),
+        async_add_entities,
+    )
     return True
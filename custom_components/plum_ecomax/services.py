@@ -39,6 +39,8 @@ import voluptuous as vol
 
 from .connection import DEFAULT_TIMEOUT, EcomaxConnection
 from .const import ATTR_PRODUCT, ATTR_VALUE, DOMAIN, WEEKDAYS
+from .watchdog import async_get_watchdog
+from .windows import DEFAULT_WINDOW, MAX_WINDOW
 
 if TYPE_CHECKING:
     from . import PlumEcomaxConfigEntry
@@ -49,6 +51,8 @@ ATTR_PRESET: Final = "preset"
 ATTR_SCHEDULES: Final = "schedules"
 ATTR_TYPE: Final = "type"
 ATTR_WEEKDAYS: Final = "weekdays"
+ATTR_CLEAR: Final = "clear"
+ATTR_WINDOW: Final = "window"
 
 PRESET_DAY: Final = "day"
 PRESET_NIGHT: Final = "night"
@@ -97,6 +101,25 @@ SERVICE_SET_SCHEDULE_SCHEMA = vol.Schema(
 SERVICE_RESET_METER: Final = "reset_meter"
 SERVICE_CALIBRATE_METER: Final = "calibrate_meter"
 
+SERVICE_GET_SLOW_CALLBACKS: Final = "get_slow_callbacks"
+SERVICE_GET_SLOW_CALLBACKS_SCHEMA = vol.Schema(
+    {vol.Optional(ATTR_CLEAR, default=False): cv.boolean}
+)
+
+SERVICE_GET_BURNER_CYCLES: Final = "get_burner_cycles"
+SERVICE_GET_BURNER_CYCLES_SCHEMA = vol.Schema({vol.Required(ATTR_DEVICE_ID): str})
+
+SERVICE_GET_WINDOW_STATISTICS: Final = "get_window_statistics"
+SERVICE_GET_WINDOW_STATISTICS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): str,
+        vol.Required(ATTR_NAME): str,
+        vol.Optional(ATTR_WINDOW, default=DEFAULT_WINDOW): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_WINDOW)
+        ),
+    }
+)
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -152,15 +175,24 @@ def async_get_device_from_entry(
 
 
 @callback
-def async_extract_device_from_service(
+def async_extract_device_entry_from_service(
     hass: HomeAssistant, service_call: ServiceCall
-) -> Device:
-    """Extract a connection instance from the service call."""
+) -> dr.DeviceEntry:
+    """Extract a device entry from the service call."""
     device_registry = dr.async_get(hass)
     device_id = cast(str, service_call.data.get(ATTR_DEVICE_ID))
     if not (device_entry := device_registry.async_get(device_id)):
         raise ValueError(f"Unknown Plum ecoMAX device id: {device_id}")
 
+    return device_entry
+
+
+@callback
+def async_extract_device_from_service(
+    hass: HomeAssistant, service_call: ServiceCall
+) -> Device:
+    """Extract a device instance from the service call."""
+    device_entry = async_extract_device_entry_from_service(hass, service_call)
     return async_get_device_from_entry(hass, device_entry)
 
 
@@ -304,7 +336,7 @@ def async_setup_get_parameter_service(hass: HomeAssistant) -> None:
     hass.services.async_register(
         DOMAIN,
         SERVICE_GET_PARAMETER,
-        _async_get_parameter_service,
+        async_get_watchdog(hass).wrap_service(_async_get_parameter_service),
         schema=SERVICE_GET_PARAMETER_SCHEMA,
         supports_response=SupportsResponse.ONLY,
     )
@@ -347,7 +379,7 @@ def async_setup_set_parameter_service(hass: HomeAssistant) -> None:
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_PARAMETER,
-        _async_set_parameter_service,
+        async_get_watchdog(hass).wrap_service(_async_set_parameter_service),
         schema=SERVICE_SET_PARAMETER_SCHEMA,
         supports_response=SupportsResponse.OPTIONAL,
     )
@@ -420,7 +452,9 @@ def async_setup_get_schedule_service(hass: HomeAssistant) -> None:
     hass.services.async_register(
         DOMAIN,
         SERVICE_GET_SCHEDULE,
-        _async_get_schedule_service,
+        async_get_watchdog(hass).wrap_service(
+            _async_get_schedule_service, key=ATTR_TYPE
+        ),
         schema=SERVICE_GET_SCHEDULE_SCHEMA,
         supports_response=SupportsResponse.ONLY,
     )
@@ -468,11 +502,103 @@ def async_setup_set_schedule_service(hass: HomeAssistant) -> None:
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_SCHEDULE,
-        _async_set_schedule_service,
+        async_get_watchdog(hass).wrap_service(
+            _async_set_schedule_service, key=ATTR_TYPE
+        ),
         schema=SERVICE_SET_SCHEDULE_SCHEMA,
     )
 
 
+@callback
+def async_setup_get_slow_callbacks_service(hass: HomeAssistant) -> None:
+    """Set up the service to get slow callbacks."""
+
+    async def _async_get_slow_callbacks_service(
+        service_call: ServiceCall,
+    ) -> ServiceResponse:
+        """Service to get slow callbacks."""
+        watchdog = async_get_watchdog(hass)
+        response: ServiceResponse = {
+            "enabled": watchdog.enabled,
+            "threshold": watchdog.threshold,
+            "slow_callbacks": cast(list, watchdog.as_list()),
+        }
+        if service_call.data[ATTR_CLEAR]:
+            watchdog.clear()
+
+        return response
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_SLOW_CALLBACKS,
+        _async_get_slow_callbacks_service,
+        schema=SERVICE_GET_SLOW_CALLBACKS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+@callback
+def async_setup_get_window_statistics_service(hass: HomeAssistant) -> None:
+    """Set up the service to get rolling window statistics."""
+
+    @service.verify_domain_control(DOMAIN)
+    async def _async_get_window_statistics_service(
+        service_call: ServiceCall,
+    ) -> ServiceResponse:
+        """Service to get rolling window statistics."""
+        name: str = service_call.data[ATTR_NAME]
+        window: int = service_call.data[ATTR_WINDOW]
+        device_entry = async_extract_device_entry_from_service(hass, service_call)
+        connection = async_extract_connection_from_device_entry(hass, device_entry)
+        if name not in connection.windows.keys:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="window_not_found",
+                translation_placeholders={
+                    "name": name,
+                    "keys": ", ".join(connection.windows.keys),
+                },
+            )
+
+        response: ServiceResponse = {"name": name, "window": window}
+        if statistics := connection.windows.statistics(name, window):
+            response.update(statistics.as_dict())
+        else:
+            response.update(count=0, min=None, max=None, mean=None, slope=None)
+
+        return response
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_WINDOW_STATISTICS,
+        _async_get_window_statistics_service,
+        schema=SERVICE_GET_WINDOW_STATISTICS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+@callback
+def async_setup_get_burner_cycles_service(hass: HomeAssistant) -> None:
+    """Set up the service to get burner cycle analytics."""
+
+    @service.verify_domain_control(DOMAIN)
+    async def _async_get_burner_cycles_service(
+        service_call: ServiceCall,
+    ) -> ServiceResponse:
+        """Service to get burner cycle analytics."""
+        device_entry = async_extract_device_entry_from_service(hass, service_call)
+        connection = async_extract_connection_from_device_entry(hass, device_entry)
+        return connection.cycles.as_dict()
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_BURNER_CYCLES,
+        _async_get_burner_cycles_service,
+        schema=SERVICE_GET_BURNER_CYCLES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
 @callback
 def async_setup_services(hass: HomeAssistant) -> bool:
     """Set up the ecoMAX services."""
@@ -482,6 +608,9 @@ def async_setup_services(hass: HomeAssistant) -> bool:
     async_setup_set_parameter_service(hass)
     async_setup_get_schedule_service(hass)
     async_setup_set_schedule_service(hass)
+    async_setup_get_slow_callbacks_service(hass)
+    async_setup_get_window_statistics_service(hass)
+    async_setup_get_burner_cycles_service(hass)
     service.async_register_platform_entity_service(
         hass,
         DOMAIN,
@@ -0,0 +1,191 @@
+"""Persistent storage for the Plum ecoMAX integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+from typing import Final, TypedDict
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from pyplumio.data_types import DATA_TYPES, DataType
+
+from .const import DOMAIN
+
+STORAGE_VERSION: Final = 1
+
+METER_SAVE_DELAY: Final = 60
+METER_SAVE_THRESHOLD: Final = 10_000
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RegdataSchemaData(TypedDict):
+    """Represents a stored regulator data schema."""
+
+    key: str
+    schema: list[list[int]]
+
+
+class MeterCheckpointData(TypedDict):
+    """Represents a stored meter checkpoint."""
+
+    value: int
+    last_updated: str
+
+
+@dataclass(frozen=True, slots=True)
+class MeterCheckpoint:
+    """Represents a meter checkpoint.
+
+    Value is stored as a fixed-point integer in meter units.
+    """
+
+    value: int
+    last_updated: datetime
+
+
+class MeterStore:
+    """Represents a meter checkpoint store.
+
+    Checkpoints are written with a delay, unless the value changed since
+    the last write exceeds the save threshold. Delay is counted from the
+    first unsaved checkpoint, so a meter that keeps updating is still
+    written at least once per delay.
+    """
+
+    _checkpoints: dict[str, MeterCheckpoint]
+    _save_pending: bool
+    _saved: dict[str, int]
+    _save_delay: float
+    _save_threshold: int
+    _store: Store[dict[str, MeterCheckpointData]]
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        save_delay: float = METER_SAVE_DELAY,
+        save_threshold: int = METER_SAVE_THRESHOLD,
+    ) -> None:
+        """Initialize a new meter store."""
+        self._checkpoints = {}
+        self._save_pending = False
+        self._saved = {}
+        self._save_delay = save_delay
+        self._save_threshold = save_threshold
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.meters")
+
+    async def async_load(self) -> None:
+        """Load checkpoints from the storage."""
+        if (data := await self._store.async_load()) is None:
+            return
+
+        for key, checkpoint in data.items():
+            last_updated = dt_util.parse_datetime(checkpoint["last_updated"])
+            if last_updated is None:
+                _LOGGER.warning("Ignoring malformed checkpoint for meter '%s'", key)
+                continue
+
+            self._checkpoints[key] = MeterCheckpoint(checkpoint["value"], last_updated)
+            self._saved[key] = checkpoint["value"]
+
+    def get(self, key: str) -> MeterCheckpoint | None:
+        """Return the meter checkpoint."""
+        return self._checkpoints.get(key, None)
+
+    @callback
+    def async_checkpoint(self, key: str, value: int, force: bool = False) -> None:
+        """Store the meter checkpoint."""
+        self._checkpoints[key] = MeterCheckpoint(value, dt_util.utcnow())
+        if force or abs(value - self._saved.get(key, 0)) >= self._save_threshold:
+            self._store.async_delay_save(self._data_to_save, 0)
+        elif not self._save_pending:
+            # Store reschedules on every call, so pending save is kept.
+            self._store.async_delay_save(self._data_to_save, self._save_delay)
+
+        self._save_pending = True
+
+    async def async_save(self) -> None:
+        """Write checkpoints to the storage."""
+        await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Remove the storage."""
+        await self._store.async_remove()
+
+    @callback
+    def _data_to_save(self) -> dict[str, MeterCheckpointData]:
+        """Return data to be written to the storage."""
+        self._save_pending = False
+        self._saved = {key: x.value for key, x in self._checkpoints.items()}
+        return {
+            key: MeterCheckpointData(
+                value=checkpoint.value,
+                last_updated=checkpoint.last_updated.isoformat(),
+            )
+            for key, checkpoint in self._checkpoints.items()
+        }
+
+
+class RegdataSchemaStore:
+    """Represents a regulator data schema store.
+
+    Schema is stored as a list of parameter ids and data type codes
+    along with the key, which identifies product and firmware it
+    belongs to.
+    """
+
+    _data: RegdataSchemaData | None
+    _store: Store[RegdataSchemaData]
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize a new regulator data schema store."""
+        self._data = None
+        self._store = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.regdata_schema"
+        )
+
+    async def async_load(self, key: str) -> list[tuple[int, DataType]] | None:
+        """Load the regulator data schema for the key."""
+        if (data := await self._store.async_load()) is None:
+            return None
+
+        try:
+            if data["key"] != key:
+                return None
+
+            schema = [
+                (param_id, DATA_TYPES[code]()) for param_id, code in data["schema"]
+            ]
+        except IndexError, KeyError, TypeError, ValueError:
+            _LOGGER.warning("Ignoring malformed regulator data schema cache")
+            return None
+
+        self._data = data
+        return schema
+
+    async def async_save(self, key: str, schema: list[tuple[int, DataType]]) -> bool:
+        """Save the regulator data schema for the key.
+
+        Returns True if stored schema was changed.
+        """
+        data = RegdataSchemaData(
+            key=key,
+            schema=[
+                [param_id, DATA_TYPES.index(type(data_type))]
+                for param_id, data_type in schema
+            ],
+        )
+        if data == self._data:
+            return False
+
+        self._data = data
+        await self._store.async_save(data)
+        return True
+
+    async def async_remove(self) -> None:
+        """Remove the storage."""
+        await self._store.async_remove()
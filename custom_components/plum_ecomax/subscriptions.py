@@ -0,0 +1,113 @@
+"""Event subscriptions for the Plum ecoMAX integration."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+from dataclasses import dataclass
+import logging
+from typing import Any
+
+from pyplumio.helpers.event_manager import EventCallback, EventManager
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(eq=False, slots=True)
+class Subscription:
+    """Represents a handle for the device event subscription."""
+
+    manager: SubscriptionManager
+    owner: Hashable
+    device: EventManager
+    name: str
+    callback: EventCallback
+    active: bool = True
+
+    def release(self) -> bool:
+        """Release the subscription.
+
+        Returns True if subscription was active.
+        """
+        return self.manager.release(self)
+
+
+class SubscriptionManager:
+    """Represents a subscription manager.
+
+    Subscriptions are tracked by owner, so all of them, including ones
+    that were never fired, can be released at once.
+    """
+
+    _subscriptions: dict[Hashable, set[Subscription]]
+
+    def __init__(self) -> None:
+        """Initialize a new subscription manager."""
+        self._subscriptions = {}
+
+    def subscribe(
+        self,
+        owner: Hashable,
+        device: EventManager,
+        name: str,
+        callback: EventCallback,
+        *,
+        once: bool = False,
+    ) -> Subscription:
+        """Subscribe the callback to the device event."""
+        subscription = Subscription(self, owner, device, name, callback)
+        if once:
+
+            async def _call_once(value: Any) -> Any:
+                """Discard the subscription and call the callback."""
+                self._discard(subscription)
+                return await callback(value)
+
+            subscription.callback = device.subscribe_once(name, _call_once)
+        else:
+            device.subscribe(name, callback)
+
+        self._subscriptions.setdefault(owner, set()).add(subscription)
+        return subscription
+
+    def release(self, subscription: Subscription) -> bool:
+        """Release the subscription."""
+        if not subscription.active:
+            return False
+
+        self._discard(subscription)
+        subscription.device.unsubscribe(subscription.name, subscription.callback)
+        return True
+
+    def release_all(self, owner: Hashable) -> int:
+        """Release all subscriptions of the owner.
+
+        Returns number of released subscriptions.
+        """
+        subscriptions = self._subscriptions.pop(owner, set())
+        for subscription in subscriptions:
+            subscription.active = False
+            subscription.device.unsubscribe(subscription.name, subscription.callback)
+
+        if subscriptions:
+            _LOGGER.debug(
+                "Released %d subscription(s) of '%s'", len(subscriptions), owner
+            )
+
+        return len(subscriptions)
+
+    def count(self, owner: Hashable) -> int:
+        """Return number of active subscriptions of the owner."""
+        return len(self._subscriptions.get(owner, ()))
+
+    def _discard(self, subscription: Subscription) -> None:
+        """Discard the subscription without unsubscribing it."""
+        subscription.active = False
+        owner = subscription.owner
+        if (subscriptions := self._subscriptions.get(owner, None)) is not None:
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[owner]
+
+    def __len__(self) -> int:
+        """Return number of active subscriptions."""
+        return sum(len(x) for x in self._subscriptions.values())
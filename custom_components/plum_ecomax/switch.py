@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import partial
 import logging
 from typing import Any, cast
 
@@ -87,19 +88,19 @@ class EcomaxSwitch(EcomaxEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
-        self.device.set_nowait(
-            self.entity_description.key, self.entity_description.state_on
-        )
-        self._attr_is_on = True
-        self.async_write_ha_state()
+        async with self.async_write_parameter(
+            self.entity_description.key, self.entity_description.state_on, "_attr_is_on"
+        ):
+            self._attr_is_on = True
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
-        self.device.set_nowait(
-            self.entity_description.key, self.entity_description.state_off
-        )
-        self._attr_is_on = False
-        self.async_write_ha_state()
+        async with self.async_write_parameter(
+            self.entity_description.key,
+            self.entity_description.state_off,
+            "_attr_is_on",
+        ):
+            self._attr_is_on = False
 
     async def async_update(self, value: Parameter) -> None:
         """Update entity state."""
@@ -109,7 +110,7 @@ class EcomaxSwitch(EcomaxEntity, SwitchEntity):
         }
         states |= self.entity_description.extra_states
         self._attr_is_on = states.get(value.value, None)
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed()
 
 
 @callback
@@ -261,6 +262,23 @@ def async_setup_custom_thermostat_switches(
     ]
 
 
+async def async_setup_custom_switches(
+    connection: EcomaxConnection, config_entry: PlumEcomaxConfigEntry
+) -> list[EcomaxSwitch]:
+    """Set up the custom switches."""
+    entities = async_setup_custom_ecomax_switches(connection, config_entry)
+
+    # Add custom mixer/circuit switches.
+    if connection.has_mixers and await connection.async_setup_mixers():
+        entities += async_setup_custom_mixer_switches(connection, config_entry)
+
+    # Add custom thermostat switches.
+    if connection.has_thermostats and await connection.async_setup_thermostats():
+        entities += async_setup_custom_thermostat_switches(connection, config_entry)
+
+    return entities
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: PlumEcomaxConfigEntry,
@@ -272,17 +290,16 @@ async def async_setup_entry(
     connection = entry.runtime_data.connection
     entities = async_setup_ecomax_switches(connection)
 
-    # Add custom ecoMAX switches.
-    entities += async_setup_custom_ecomax_switches(connection, entry)
-
     # Add mixer/circuit switches.
     if connection.has_mixers and await connection.async_setup_mixers():
         entities += async_setup_mixer_switches(connection)
-        entities += async_setup_custom_mixer_switches(connection, entry)
-
-    # Add thermostat switches.
-    if connection.has_thermostats and await connection.async_setup_thermostats():
-        entities += async_setup_custom_thermostat_switches(connection, entry)
 
     async_add_entities(entities)
+
+    # Add custom switches.
+    await entry.runtime_data.async_setup_custom_entities(
+        Platform.SWITCH,
+        partial(async_setup_custom_switches, connection, entry),
+        async_add_entities,
+    )
     return True
@@ -29,6 +29,7 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
         failure_rate_string = f"{round(failure_rate, 2)} %"
 
     custom_entities: dict[Platform, dict] = config_entry.options.get(ATTR_ENTITIES, {})
+    economy_statistics = config_entry.runtime_data.connection.economy_statistics
 
     return {
         "pyplumio_version": pyplumio_version,
@@ -39,6 +40,9 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
         "connected_since": statistics.connected_since,
         "connection_losses": statistics.connection_losses,
         "custom_entities": sum(len(entities) for entities in custom_entities.values()),
+        "suppressed_updates": economy_statistics.suppressed_updates,
+        "suppressed_writes": economy_statistics.suppressed_writes,
+        "active_subscriptions": len(config_entry.runtime_data.connection.subscriptions),
     }
 
 
@@ -0,0 +1,187 @@
+"""Slow callback watchdog for the Plum ecoMAX integration."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Coroutine, Generator
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+import time
+import types
+from typing import Any, Final, TypedDict, cast
+
+from homeassistant.const import ATTR_NAME
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+from pyplumio.helpers.event_manager import EventCallback
+
+from .const import DOMAIN
+
+SLOW_CALLBACK_THRESHOLD: Final = 0.1
+SLOW_CALLBACK_HISTORY: Final = 50
+
+DATA_WATCHDOG: HassKey[SlowCallbackWatchdog] = HassKey(f"{DOMAIN}_watchdog")
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@types.coroutine
+def _suspend(future: Any) -> Generator[Any, Any, Any]:
+    """Suspend the caller on the future yielded by the measured step."""
+    return (yield future)
+
+
+class SlowCallbackData(TypedDict):
+    """Represents a slow callback record as a dictionary."""
+
+    name: str
+    key: str
+    duration: float
+    timestamp: str
+
+
+@dataclass(frozen=True, slots=True)
+class SlowCallback:
+    """Represents a slow callback record."""
+
+    name: str
+    key: str
+    duration: float
+    timestamp: datetime
+
+    def as_dict(self) -> SlowCallbackData:
+        """Return the record as a dictionary."""
+        return SlowCallbackData(
+            name=self.name,
+            key=self.key,
+            duration=round(self.duration, 6),
+            timestamp=self.timestamp.isoformat(),
+        )
+
+
+class SlowCallbackWatchdog:
+    """Represents a slow callback watchdog.
+
+    Watchdog is only active while debug logging is enabled for the
+    integration and keeps a fixed number of the most recent records.
+    Duration is the longest time the callback held the event loop,
+    excluding time spent awaiting inside the callback.
+    """
+
+    _records: deque[SlowCallback]
+    threshold: float
+
+    def __init__(
+        self,
+        threshold: float = SLOW_CALLBACK_THRESHOLD,
+        history: int = SLOW_CALLBACK_HISTORY,
+    ) -> None:
+        """Initialize a new slow callback watchdog."""
+        self._records = deque(maxlen=history)
+        self.threshold = threshold
+
+    @property
+    def enabled(self) -> bool:
+        """Return if watchdog is enabled."""
+        return _LOGGER.isEnabledFor(logging.DEBUG)
+
+    async def async_measure[T](
+        self, name: str, key: str, coro: Coroutine[Any, Any, T]
+    ) -> T:
+        """Run the coroutine and measure its longest step.
+
+        Coroutine is stepped through manually, so time spent awaiting
+        device I/O is not accounted and only the longest synchronous
+        step, that blocks the event loop, is recorded.
+        """
+        if not self.enabled:
+            return await coro
+
+        longest = 0.0
+        value: Any = None
+        error: BaseException | None = None
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    if error is None:
+                        future = coro.send(value)
+                    else:
+                        future = coro.throw(error)
+                except StopIteration as result:
+                    return cast(T, result.value)
+                finally:
+                    longest = max(longest, time.perf_counter() - start)
+
+                try:
+                    value, error = await _suspend(future), None
+                except BaseException as suspend_error:
+                    value, error = None, suspend_error
+        finally:
+            coro.close()
+            self.record(name, key, longest)
+
+    def wrap(self, name: str, key: str, handler: EventCallback) -> EventCallback:
+        """Wrap the event callback."""
+
+        async def _measured(value: Any) -> Any:
+            """Measure the event callback duration."""
+            return await self.async_measure(name, key, handler(value))
+
+        return _measured
+
+    def wrap_service[T](
+        self,
+        handler: Callable[[ServiceCall], Coroutine[Any, Any, T]],
+        key: str = ATTR_NAME,
+    ) -> Callable[[ServiceCall], Coroutine[Any, Any, T]]:
+        """Wrap the service handler.
+
+        Service call data field with the given key is recorded as the
+        callback key.
+        """
+
+        async def _measured(service_call: ServiceCall) -> T:
+            """Measure the service handler duration."""
+            return await self.async_measure(
+                f"{service_call.domain}.{service_call.service}",
+                str(service_call.data.get(key, "")),
+                handler(service_call),
+            )
+
+        return _measured
+
+    def record(self, name: str, key: str, duration: float) -> bool:
+        """Record the callback, if it exceeds the threshold.
+
+        Returns True if callback was recorded.
+        """
+        if duration < self.threshold:
+            return False
+
+        self._records.append(SlowCallback(name, key, duration, dt_util.utcnow()))
+        _LOGGER.debug("Slow callback for '%s' (%s) took %.3fs", name, key, duration)
+        return True
+
+    def clear(self) -> None:
+        """Clear the records."""
+        self._records.clear()
+
+    def as_list(self) -> list[SlowCallbackData]:
+        """Return the records as a list of dictionaries."""
+        return [record.as_dict() for record in self._records]
+
+    def __len__(self) -> int:
+        """Return number of the records."""
+        return len(self._records)
+
+
+@callback
+def async_get_watchdog(hass: HomeAssistant) -> SlowCallbackWatchdog:
+    """Return the slow callback watchdog."""
+    if (watchdog := hass.data.get(DATA_WATCHDOG, None)) is None:
+        watchdog = hass.data[DATA_WATCHDOG] = SlowCallbackWatchdog()
+
+    return watchdog
@@ -22,8 +22,11 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from pyplumio.const import ATTR_SENSORS
 from pyplumio.filters import Filter, deadband, on_change, throttle
+from pyplumio.helpers.event_manager import EventCallback
 from pyplumio.parameters import Parameter
+from pyplumio.structures.ecomax_parameters import ATTR_ECOMAX_PARAMETERS
 
 from . import PlumEcomaxConfigEntry
 from .connection import EcomaxConnection
@@ -67,7 +70,8 @@ class EcomaxWaterHeater(EcomaxEntity, WaterHeaterEntity):
         | WaterHeaterEntityFeature.OPERATION_MODE
     )
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
-    _callbacks: dict[str, Filter]
+    _filters: dict[str, EventCallback]
+    _handlers: dict[str, Filter]
     entity_description: EcomaxWaterHeaterEntityDescription
 
     def __init__(
@@ -76,75 +80,82 @@ class EcomaxWaterHeater(EcomaxEntity, WaterHeaterEntity):
         description: EcomaxWaterHeaterEntityDescription,
     ):
         """Initialize a new ecoMAX climate entity."""
-        self._callbacks = {
+        self._handlers = {
             "water_heater_temp": throttle(
-                deadband(self.async_update, tolerance=DEFAULT_TOLERANCE),
+                deadband(self._async_set_current_temp, tolerance=DEFAULT_TOLERANCE),
                 seconds=UPDATE_INTERVAL,
             ),
-            "water_heater_target_temp": on_change(self.async_update_target_temp),
-            "water_heater_work_mode": on_change(self.async_update_work_mode),
-            "water_heater_hysteresis": on_change(self.async_update_hysteresis),
+            "water_heater_target_temp": on_change(self._async_set_target_temp),
+            "water_heater_work_mode": on_change(self._async_set_work_mode),
+            "water_heater_hysteresis": on_change(self._async_set_hysteresis),
         }
+        self._filters = dict(self._handlers)
         super().__init__(connection, description)
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         temperature = kwargs[ATTR_TEMPERATURE]
-        self.device.set_nowait(
-            f"{self.entity_description.key}_target_temp", int(temperature)
-        )
-        self._attr_target_temperature = temperature
-        self.async_write_ha_state()
+        async with self.async_write_parameter(
+            f"{self.entity_description.key}_target_temp",
+            int(temperature),
+            "_attr_target_temperature",
+        ):
+            self._attr_target_temperature = temperature
 
     async def async_set_operation_mode(self, operation_mode: str) -> None:
         """Set new target operation mode."""
-        self.device.set_nowait(
-            f"{self.entity_description.key}_work_mode", HA_TO_EM_STATE[operation_mode]
-        )
-        self._attr_current_operation = operation_mode
-        self.async_write_ha_state()
-
-    async def async_update_target_temp(self, value: Parameter) -> None:
-        """Update target temperature."""
+        async with self.async_write_parameter(
+            f"{self.entity_description.key}_work_mode",
+            HA_TO_EM_STATE[operation_mode],
+            "_attr_current_operation",
+        ):
+            self._attr_current_operation = operation_mode
+
+    async def _async_set_target_temp(self, value: Parameter) -> bool:
+        """Set target temperature."""
         self._attr_min_temp = float(value.min_value)
         self._attr_max_temp = float(value.max_value)
         target_temperature = float(value.value)
         self._attr_target_temperature = target_temperature
         self._attr_target_temperature_high = target_temperature
         self._attr_target_temperature_low = target_temperature - self.hysteresis
-        self.async_write_ha_state()
+        return True
 
-    async def async_update_hysteresis(self, value: Parameter) -> None:
-        """Update lower target temperature bound."""
+    async def _async_set_hysteresis(self, value: Parameter) -> bool:
+        """Set lower target temperature bound."""
         self._attr_hysteresis = int(value.value)
-        if self.target_temperature is not None:
-            self._attr_target_temperature_low = (
-                int(self.target_temperature) - self.hysteresis
-            )
-            self.async_write_ha_state()
+        if self.target_temperature is None:
+            return False
+
+        self._attr_target_temperature_low = (
+            int(self.target_temperature) - self.hysteresis
+        )
+        return True
 
-    async def async_update_work_mode(self, value: Parameter) -> None:
-        """Update current operation."""
+    async def _async_set_work_mode(self, value: Parameter) -> bool:
+        """Set current operation."""
         self._attr_current_operation = EM_TO_HA_STATE[int(value.value)]
-        self.async_write_ha_state()
+        return True
 
-    async def async_update(self, value: float) -> None:
-        """Update entity state."""
+    async def _async_set_current_temp(self, value: float) -> bool:
+        """Set current temperature."""
         self._attr_current_temperature = value
-        self.async_write_ha_state()
-
-    async def async_added_to_hass(self) -> None:
-        """Subscribe to water heater events."""
-        for name, handler in self._callbacks.items():
-            if name in self.device.data:
-                await handler(self.device.data[name])
+        return True
 
-            self.device.subscribe(name, handler)
+    async def async_update(self, _: Any = None) -> None:
+        """Update entity state from the sensors or parameters frame."""
+        if await self._async_run_handlers(self._filters):
+            self.async_write_ha_state()
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Unsubscribe to water heater events."""
-        for name, handler in self._callbacks.items():
-            self.device.unsubscribe(name, handler)
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to sensors and parameters frames."""
+        self._filters = {
+            name: self.async_economy_filter(handler, name)
+            for name, handler in self._handlers.items()
+        }
+        await self.async_update()
+        self.async_subscribe(ATTR_SENSORS, self.async_update)
+        self.async_subscribe(ATTR_ECOMAX_PARAMETERS, self.async_update)
 
     @property
     def hysteresis(self) -> int:
@@ -0,0 +1,191 @@
+"""Rolling windows of the sensor values for the Plum ecoMAX integration."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass
+import math
+import time
+from typing import Any, Final, TypedDict
+
+from pyplumio.helpers.event_manager import EventCallback
+
+WINDOW_KEYS: Final = (
+    "heating_temp",
+    "water_heater_temp",
+    "outside_temp",
+    "exhaust_temp",
+    "return_temp",
+    "feeder_temp",
+)
+
+# Number of samples kept per key, an hour of the per-second updates.
+WINDOW_CAPACITY: Final = 3600
+
+DEFAULT_WINDOW: Final = 15
+MAX_WINDOW: Final = 60
+
+SECONDS_PER_MINUTE: Final = 60
+
+# Minimum time span of the values in seconds to compute the slope.
+MIN_SLOPE_SPAN: Final = 1.0
+
+
+class WindowStatisticsData(TypedDict):
+    """Represents rolling window statistics as a dictionary."""
+
+    count: int
+    min: float
+    max: float
+    mean: float
+    slope: float
+
+
+@dataclass(frozen=True, slots=True)
+class WindowStatistics:
+    """Represents rolling window statistics.
+
+    Slope is a least squares fit of the values in units per minute.
+    """
+
+    count: int
+    minimum: float
+    maximum: float
+    mean: float
+    slope: float
+
+    def as_dict(self) -> WindowStatisticsData:
+        """Return statistics as a dictionary."""
+        return WindowStatisticsData(
+            count=self.count,
+            min=round(self.minimum, 2),
+            max=round(self.maximum, 2),
+            mean=round(self.mean, 2),
+            slope=round(self.slope, 3),
+        )
+
+
+class RollingWindow:
+    """Represents a fixed size ring buffer of the timestamped values."""
+
+    __slots__ = ("_count", "_index", "_timestamps", "_values")
+
+    _count: int
+    _index: int
+    _timestamps: array[float]
+    _values: array[float]
+
+    def __init__(self, capacity: int = WINDOW_CAPACITY) -> None:
+        """Initialize a new rolling window."""
+        self._count = 0
+        self._index = 0
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._values = array("f", bytes(4 * capacity))
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Append the value to the window."""
+        capacity = len(self._values)
+        self._timestamps[self._index] = timestamp
+        self._values[self._index] = value
+        self._index = (self._index + 1) % capacity
+        self._count = min(self._count + 1, capacity)
+
+    def statistics(self, now: float, duration: float) -> WindowStatistics | None:
+        """Return statistics of the values within the duration."""
+        capacity = len(self._values)
+        since = now - duration
+        count = 0
+        minimum = math.inf
+        maximum = -math.inf
+        sum_t = sum_v = sum_tt = sum_tv = 0.0
+        newest = oldest = 0.0
+        index = self._index
+        for _ in range(self._count):
+            index = (index - 1) % capacity
+            if (timestamp := self._timestamps[index]) < since:
+                break
+
+            value = self._values[index]
+            t = timestamp - now
+            if count == 0:
+                newest = t
+
+            oldest = t
+            count += 1
+            minimum = min(minimum, value)
+            maximum = max(maximum, value)
+            sum_t += t
+            sum_v += value
+            sum_tt += t * t
+            sum_tv += t * value
+
+        if count == 0:
+            return None
+
+        slope = 0.0
+        if newest - oldest >= MIN_SLOPE_SPAN:
+            denominator = count * sum_tt - sum_t * sum_t
+            slope = (count * sum_tv - sum_t * sum_v) / denominator
+        return WindowStatistics(
+            count=count,
+            minimum=minimum,
+            maximum=maximum,
+            mean=sum_v / count,
+            slope=slope * SECONDS_PER_MINUTE,
+        )
+
+    def __len__(self) -> int:
+        """Return number of the values in the window."""
+        return self._count
+
+
+class RollingWindows:
+    """Represents rolling windows of the raw sensor values.
+
+    Values are recorded before any entity filter is applied, so
+    windowed statistics can be answered from memory instead of
+    the recorder.
+    """
+
+    _capacity: int
+    _windows: dict[str, RollingWindow]
+    keys: tuple[str, ...]
+
+    def __init__(
+        self, keys: Iterable[str] = WINDOW_KEYS, capacity: int = WINDOW_CAPACITY
+    ) -> None:
+        """Initialize new rolling windows."""
+        self._capacity = capacity
+        self._windows = {}
+        self.keys = tuple(keys)
+
+    def append(self, key: str, value: Any) -> None:
+        """Append the value to the window."""
+        if not isinstance(value, int | float) or isinstance(value, bool):
+            return
+
+        if (window := self._windows.get(key, None)) is None:
+            window = self._windows[key] = RollingWindow(self._capacity)
+
+        window.append(time.monotonic(), value)
+
+    def handler(self, key: str) -> EventCallback:
+        """Return the event callback that appends values to the window."""
+
+        async def _async_append(value: Any) -> None:
+            """Append the value to the window."""
+            self.append(key, value)
+
+        return _async_append
+
+    def statistics(self, key: str, minutes: float) -> WindowStatistics | None:
+        """Return statistics for the last minutes of the values."""
+        if (window := self._windows.get(key, None)) is None:
+            return None
+
+        return window.statistics(time.monotonic(), minutes * SECONDS_PER_MINUTE)
+
+    def __len__(self) -> int:
+        """Return number of the windows."""
+        return len(self._windows)
@@ -0,0 +1,99 @@
+"""Acknowledged parameter writes for the Plum ecoMAX integration."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any, Final
+
+from pyplumio.devices import Device
+
+WRITE_TIMEOUT: Final = 5
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class WriteStatistics:
+    """Represents parameter write statistics."""
+
+    confirmed_writes: int = 0
+    failed_writes: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    last_latency: float | None = None
+
+    @property
+    def mean_latency(self) -> float | None:
+        """Return mean latency of the confirmed writes in seconds."""
+        if self.confirmed_writes == 0:
+            return None
+
+        return round(self.total_latency / self.confirmed_writes, 3)
+
+    def record(self, confirmed: bool, latency: float) -> None:
+        """Record the write result."""
+        if not confirmed:
+            self.failed_writes += 1
+            return
+
+        self.confirmed_writes += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        self.last_latency = latency
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return statistics as a dictionary."""
+        return {
+            "confirmed_writes": self.confirmed_writes,
+            "failed_writes": self.failed_writes,
+            "mean_latency": self.mean_latency,
+            "max_latency": round(self.max_latency, 3),
+            "last_latency": (
+                round(self.last_latency, 3) if self.last_latency is not None else None
+            ),
+        }
+
+
+class WriteTracker:
+    """Represents an acknowledged parameter write tracker.
+
+    Writes are awaited until the device confirms the new value or
+    the deadline expires.
+    """
+
+    statistics: WriteStatistics
+    timeout: float
+
+    def __init__(self, timeout: float = WRITE_TIMEOUT) -> None:
+        """Initialize a new write tracker."""
+        self.statistics = WriteStatistics()
+        self.timeout = timeout
+
+    async def async_set(self, device: Device, name: str, value: Any) -> bool:
+        """Set the parameter and wait for the confirmation.
+
+        Returns True if the write was confirmed before the deadline.
+        Errors raised by the device, such as rejected values, are
+        recorded as failed writes and re-raised.
+        """
+        start = time.monotonic()
+        try:
+            async with asyncio.timeout(self.timeout):
+                confirmed = await device.set(name, value)
+        except TimeoutError:
+            confirmed = False
+        except Exception:
+            self.statistics.record(False, time.monotonic() - start)
+            raise
+
+        latency = time.monotonic() - start
+        self.statistics.record(confirmed, latency)
+        if confirmed:
+            _LOGGER.debug("Write to '%s' confirmed in %.3fs", name, latency)
+        else:
+            _LOGGER.warning("Write to '%s' was not confirmed by the device", name)
+
+        return confirmed
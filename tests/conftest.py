@@ -58,6 +58,7 @@ from custom_components.plum_ecomax.const import (
     DEFAULT_PORT,
     DOMAIN,
 )
+from tests.emulator import EcomaxEmulator, EmulatorConfig
 
 TITLE: Final = "ecoMAX"
 HOST: Final = "localhost"
@@ -186,6 +187,21 @@ def fixture_connection(
     return connection
 
 
+@pytest.fixture(name="emulator_config")
+def fixture_emulator_config() -> EmulatorConfig:
+    """Get the ecoMAX emulator config."""
+    return EmulatorConfig(port=0, frame_rate=20)
+
+
+@pytest.fixture(name="ecomax_emulator")
+async def fixture_ecomax_emulator(
+    socket_enabled, emulator_config: EmulatorConfig
+) -> AsyncGenerator[EcomaxEmulator]:
+    """Start the ecoMAX emulator on an ephemeral port."""
+    async with EcomaxEmulator(emulator_config) as emulator:
+        yield emulator
+
+
 class MutableEcoMAX(EcoMAX):
     """Allows to set otherwise properties readonly due to __slots__."""
 
@@ -0,0 +1,716 @@
+"""Local ecoMAX emulator.
+
+Emulates an ecoMAX controller behind an RS-485 to TCP converter. The
+emulator broadcasts sensor and regulator data and answers requests,
+that are sent by PyPlumIO during the device setup and when parameters
+are changed.
+
+It can be used as a test fixture or started manually to develop the
+integration without a physical device:
+
+    python -m tests.emulator --mixers 2 --thermostats 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from collections.abc import Callable, Sequence
+import contextlib
+from dataclasses import dataclass, field
+import logging
+import math
+import random
+import struct
+from typing import Final
+
+from pyplumio.const import DeviceState, DeviceType, FrameType, ProductType
+from pyplumio.data_types import (
+    DATA_TYPES,
+    BitArray,
+    DataType,
+    Float,
+    UnsignedChar,
+    UnsignedInt,
+    UnsignedShort,
+)
+from pyplumio.frames import (
+    ECONET_TYPE,
+    ECONET_VERSION,
+    FRAME_END,
+    FRAME_START,
+    HEADER_SIZE,
+    bcc,
+    struct_header,
+)
+from pyplumio.parameters import ParameterDescription, SwitchDescription
+from pyplumio.parameters.ecomax import PARAMETER_TYPES as ECOMAX_PARAMETER_TYPES
+from pyplumio.parameters.mixer import PARAMETER_TYPES as MIXER_PARAMETER_TYPES
+from pyplumio.parameters.thermostat import PARAMETER_TYPES as THERMOSTAT_PARAMETER_TYPES
+from pyplumio.stream import MAX_FRAME_LENGTH, MIN_FRAME_LENGTH
+from pyplumio.structures.sensor_data import (
+    ATTR_MODULE_A,
+    ATTR_PANEL,
+    MODULES,
+    OUTPUTS,
+    STATUSES,
+    TEMPERATURES,
+)
+
+from custom_components.plum_ecomax.const import DEFAULT_PORT
+
+BYTE_UNDEFINED: Final = 0xFF
+
+MAX_MIXERS: Final = 10
+MAX_THERMOSTATS: Final = 3
+MAX_REGDATA_SIZE: Final = 320
+
+PRODUCT_TYPE: Final = ProductType.ECOMAX_P
+PRODUCT_ID: Final = 90
+PRODUCT_UID: Final = bytes.fromhex("0011223344556677889900aabb")
+PRODUCT_MODEL: Final = "EM350P2-ZF"
+MODULE_A_VERSION: Final = bytes((6, 10, 32, ord("K"), 1))
+PANEL_VERSION: Final = bytes((6, 30, 36))
+PASSWORD: Final = "0000"
+
+REGDATA_VERSION: Final = bytes((0, 1))
+REGDATA_FIRST_ID: Final = 1024
+REGDATA_TYPES: Final[tuple[type[DataType], ...]] = (
+    UnsignedShort,
+    Float,
+    BitArray,
+    BitArray,
+    BitArray,
+    UnsignedChar,
+)
+
+NUMBER_VALUES: Final = (50, 0, 100)
+SWITCH_VALUES: Final = (0, 0, 1)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, kw_only=True)
+class EmulatorConfig:
+    """Represents an emulator configuration.
+
+    Frame rate is a number of sensor and regulator data broadcasts per
+    second. Packet loss is a probability of dropping an outgoing frame
+    and latency is a delay in seconds before a request is answered.
+    """
+
+    host: str = "127.0.0.1"
+    port: int = DEFAULT_PORT
+    mixers: int = 1
+    thermostats: int = 1
+    regdata_size: int = 32
+    frame_rate: float = 1.0
+    packet_loss: float = 0.0
+    latency: float = 0.0
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the configuration."""
+        if not 0 <= self.mixers <= MAX_MIXERS:
+            raise ValueError(f"Number of mixers must be between 0 and {MAX_MIXERS}")
+
+        if not 0 <= self.thermostats <= MAX_THERMOSTATS:
+            raise ValueError(
+                f"Number of thermostats must be between 0 and {MAX_THERMOSTATS}"
+            )
+
+        if not 0 <= self.regdata_size <= MAX_REGDATA_SIZE:
+            raise ValueError(
+                f"Regulator data size must be between 0 and {MAX_REGDATA_SIZE}"
+            )
+
+        if self.frame_rate <= 0:
+            raise ValueError("Frame rate must be positive")
+
+        if not 0 <= self.packet_loss < 1:
+            raise ValueError("Packet loss must be in [0, 1) range")
+
+        if self.latency < 0:
+            raise ValueError("Latency must not be negative")
+
+
+@dataclass(slots=True)
+class EmulatorStatistics:
+    """Represents emulator statistics."""
+
+    frames_sent: int = 0
+    frames_dropped: int = 0
+    requests: Counter[int] = field(default_factory=Counter)
+
+
+@dataclass(slots=True)
+class EmulatedParameter:
+    """Represents an emulated device parameter."""
+
+    value: int
+    min_value: int
+    max_value: int
+    size: int = 1
+
+    @classmethod
+    def from_description(cls, description: ParameterDescription) -> EmulatedParameter:
+        """Create a parameter with default values for the description."""
+        values = (
+            SWITCH_VALUES
+            if isinstance(description, SwitchDescription)
+            else NUMBER_VALUES
+        )
+        return cls(*values, size=getattr(description, "size", 1))
+
+    def pack(self) -> bytes:
+        """Pack the parameter values."""
+        return b"".join(
+            x.to_bytes(self.size, byteorder="little")
+            for x in (self.value, self.min_value, self.max_value)
+        )
+
+
+def _parameters(
+    descriptions: Sequence[ParameterDescription],
+) -> list[EmulatedParameter]:
+    """Return emulated parameters for the descriptions."""
+    return [EmulatedParameter.from_description(x) for x in descriptions]
+
+
+def pack_regdata(values: Sequence[tuple[type[DataType], int]]) -> bytes:
+    """Pack the regulator data values.
+
+    Consecutive bit arrays share a single byte, the same way they are
+    unpacked by the regulator data structure.
+    """
+    buffer = bytearray()
+    bits = bit_index = 0
+    for data_type, value in values:
+        if data_type is BitArray:
+            bits |= bool(value) << bit_index
+            bit_index += 1
+            if bit_index == 8:
+                buffer.append(bits)
+                bits = bit_index = 0
+
+            continue
+
+        if bit_index > 0:
+            buffer.append(bits)
+            bits = bit_index = 0
+
+        buffer += data_type(value).to_bytes()
+
+    if bit_index > 0:
+        buffer.append(bits)
+
+    return bytes(buffer)
+
+
+def pack_frame(
+    frame_type: int,
+    message: bytes,
+    recipient: DeviceType = DeviceType.ECONET,
+    sender: DeviceType = DeviceType.ECOMAX,
+) -> bytes:
+    """Pack the frame."""
+    frame = bytearray(HEADER_SIZE)
+    struct_header.pack_into(
+        frame,
+        0,
+        FRAME_START,
+        HEADER_SIZE + len(message) + 3,
+        recipient,
+        sender,
+        ECONET_TYPE,
+        ECONET_VERSION,
+    )
+    frame.append(frame_type)
+    frame += message
+    frame.append(bcc(frame))
+    frame.append(FRAME_END)
+    return bytes(frame)
+
+
+class EcomaxEmulator:
+    """Represents an ecoMAX emulator."""
+
+    config: EmulatorConfig
+    state: DeviceState
+    statistics: EmulatorStatistics
+
+    _clients: set[asyncio.Task]
+    _ecomax_parameters: list[EmulatedParameter]
+    _frame_versions: dict[int, int]
+    _mixer_parameters: list[list[EmulatedParameter]]
+    _random: random.Random
+    _regdata_schema: list[tuple[int, type[DataType]]]
+    _server: asyncio.Server | None
+    _thermostat_parameters: list[list[EmulatedParameter]]
+    _thermostat_profile: EmulatedParameter
+    _tick: int
+
+    def __init__(self, config: EmulatorConfig | None = None) -> None:
+        """Initialize a new ecoMAX emulator."""
+        self.config = config if config else EmulatorConfig()
+        self.state = DeviceState.WORKING
+        self.statistics = EmulatorStatistics()
+
+        self._clients = set()
+        self._ecomax_parameters = _parameters(ECOMAX_PARAMETER_TYPES[PRODUCT_TYPE])
+        self._frame_versions = dict.fromkeys(
+            (
+                FrameType.REQUEST_ECOMAX_PARAMETERS,
+                FrameType.REQUEST_MIXER_PARAMETERS,
+                FrameType.REQUEST_THERMOSTAT_PARAMETERS,
+                FrameType.REQUEST_ALERTS,
+                FrameType.REQUEST_SCHEDULES,
+                FrameType.REQUEST_REGULATOR_DATA_SCHEMA,
+            ),
+            1,
+        )
+        self._mixer_parameters = [
+            _parameters(MIXER_PARAMETER_TYPES[PRODUCT_TYPE])
+            for _ in range(self.config.mixers)
+        ]
+        self._random = random.Random(self.config.seed)
+        self._regdata_schema = [
+            (REGDATA_FIRST_ID + index, REGDATA_TYPES[index % len(REGDATA_TYPES)])
+            for index in range(self.config.regdata_size)
+        ]
+        self._server = None
+        self._thermostat_parameters = [
+            _parameters(THERMOSTAT_PARAMETER_TYPES)
+            for _ in range(self.config.thermostats)
+        ]
+        self._thermostat_profile = EmulatedParameter(0, 0, 5)
+        self._tick = 0
+
+    async def __aenter__(self) -> EcomaxEmulator:
+        """Start the emulator."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Stop the emulator."""
+        await self.stop()
+
+    async def start(self) -> None:
+        """Start listening for connections."""
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.config.host, self.config.port
+        )
+        _LOGGER.info("ecoMAX emulator is listening on %s:%d", self.host, self.port)
+
+    async def stop(self) -> None:
+        """Stop listening and close client connections."""
+        if self._server is None:
+            return
+
+        self._server.close()
+        for task in self._clients:
+            task.cancel()
+
+        await asyncio.gather(*self._clients, return_exceptions=True)
+        await self._server.wait_closed()
+        self._server = None
+
+    async def serve_forever(self) -> None:
+        """Serve connections until cancelled."""
+        async with self:
+            await asyncio.Event().wait()
+
+    @property
+    def host(self) -> str:
+        """Return the host that emulator is listening on."""
+        return self.config.host
+
+    @property
+    def port(self) -> int:
+        """Return the port that emulator is listening on.
+
+        Returns an actual port, when emulator is configured to use the
+        ephemeral one.
+        """
+        if self._server is None or not self._server.sockets:
+            return self.config.port
+
+        return int(self._server.sockets[0].getsockname()[1])
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Handle the client connection."""
+        if task := asyncio.current_task():
+            self._clients.add(task)
+
+        _LOGGER.debug("Client connected: %s", writer.get_extra_info("peername"))
+        tasks = {asyncio.create_task(self._broadcast(writer))}
+        try:
+            while frame := await self._read_frame(reader):
+                frame_type, message = frame
+                self.statistics.requests[frame_type] += 1
+                if response := self._handle_request(frame_type, message):
+                    respond = asyncio.create_task(self._respond(writer, *response))
+                    tasks.add(respond)
+                    respond.add_done_callback(tasks.discard)
+        except ConnectionError, asyncio.IncompleteReadError:
+            pass
+        finally:
+            for child in tasks:
+                child.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+            self._clients.discard(task)
+            _LOGGER.debug("Client disconnected")
+
+    async def _read_frame(
+        self, reader: asyncio.StreamReader
+    ) -> tuple[int, bytes] | None:
+        """Read the next frame addressed to the ecoMAX.
+
+        Returns None, when connection is closed.
+        """
+        while True:
+            try:
+                await reader.readuntil(bytes([FRAME_START]))
+            except asyncio.IncompleteReadError:
+                return None
+
+            header = bytes([FRAME_START]) + await reader.readexactly(HEADER_SIZE - 1)
+            _, length, recipient, *_ = struct_header.unpack(header)
+            if not MIN_FRAME_LENGTH <= length <= MAX_FRAME_LENGTH:
+                continue
+
+            frame = header + await reader.readexactly(length - HEADER_SIZE)
+            if frame[-1] != FRAME_END or bcc(frame[:-2]) != frame[-2]:
+                _LOGGER.debug("Skipping malformed frame: %s", frame.hex())
+                continue
+
+            if recipient in (DeviceType.ECOMAX, DeviceType.ALL):
+                return frame[HEADER_SIZE], frame[HEADER_SIZE + 1 : -2]
+
+    async def _write(
+        self,
+        writer: asyncio.StreamWriter,
+        frame_type: int,
+        message: bytes,
+        recipient: DeviceType = DeviceType.ECONET,
+    ) -> None:
+        """Write the frame, unless it's lost."""
+        if self._random.random() < self.config.packet_loss:
+            self.statistics.frames_dropped += 1
+            return
+
+        writer.write(pack_frame(frame_type, message, recipient))
+        await writer.drain()
+        self.statistics.frames_sent += 1
+
+    async def _respond(
+        self, writer: asyncio.StreamWriter, frame_type: int, message: bytes
+    ) -> None:
+        """Write the response after the configured latency."""
+        if self.config.latency > 0:
+            await asyncio.sleep(self.config.latency)
+
+        await self._write(writer, frame_type, message)
+
+    async def _broadcast(self, writer: asyncio.StreamWriter) -> None:
+        """Broadcast sensor and regulator data at the configured rate."""
+        while True:
+            self._tick += 1
+            await self._write(
+                writer,
+                FrameType.MESSAGE_SENSOR_DATA,
+                self._sensor_data(),
+                recipient=DeviceType.ALL,
+            )
+            await self._write(
+                writer,
+                FrameType.MESSAGE_REGULATOR_DATA,
+                self._regulator_data(),
+                recipient=DeviceType.ALL,
+            )
+            await asyncio.sleep(1 / self.config.frame_rate)
+
+    def _handle_request(
+        self, frame_type: int, message: bytes
+    ) -> tuple[int, bytes] | None:
+        """Handle the request and return the response."""
+        handlers: dict[int, tuple[FrameType, Callable[[bytes], bytes]]] = {
+            FrameType.REQUEST_UID: (FrameType.RESPONSE_UID, self._uid),
+            FrameType.REQUEST_PASSWORD: (FrameType.RESPONSE_PASSWORD, self._password),
+            FrameType.REQUEST_REGULATOR_DATA_SCHEMA: (
+                FrameType.RESPONSE_REGULATOR_DATA_SCHEMA,
+                self._regulator_data_schema,
+            ),
+            FrameType.REQUEST_ECOMAX_PARAMETERS: (
+                FrameType.RESPONSE_ECOMAX_PARAMETERS,
+                self._ecomax_parameters_message,
+            ),
+            FrameType.REQUEST_MIXER_PARAMETERS: (
+                FrameType.RESPONSE_MIXER_PARAMETERS,
+                self._mixer_parameters_message,
+            ),
+            FrameType.REQUEST_THERMOSTAT_PARAMETERS: (
+                FrameType.RESPONSE_THERMOSTAT_PARAMETERS,
+                self._thermostat_parameters_message,
+            ),
+            FrameType.REQUEST_ALERTS: (FrameType.RESPONSE_ALERTS, self._alerts),
+            FrameType.REQUEST_SCHEDULES: (
+                FrameType.RESPONSE_SCHEDULES,
+                self._schedules,
+            ),
+            FrameType.REQUEST_SET_ECOMAX_PARAMETER: (
+                FrameType.RESPONSE_SET_ECOMAX_PARAMETER,
+                self._set_ecomax_parameter,
+            ),
+            FrameType.REQUEST_SET_MIXER_PARAMETER: (
+                FrameType.RESPONSE_SET_MIXER_PARAMETER,
+                self._set_mixer_parameter,
+            ),
+            FrameType.REQUEST_SET_THERMOSTAT_PARAMETER: (
+                FrameType.RESPONSE_SET_THERMOSTAT_PARAMETER,
+                self._set_thermostat_parameter,
+            ),
+            FrameType.REQUEST_ECOMAX_CONTROL: (
+                FrameType.RESPONSE_ECOMAX_CONTROL,
+                self._ecomax_control,
+            ),
+        }
+        if frame_type not in handlers:
+            _LOGGER.debug("Ignoring unsupported frame type: %d", frame_type)
+            return None
+
+        response_type, handler = handlers[frame_type]
+        try:
+            return response_type, handler(message)
+        except IndexError:
+            _LOGGER.debug("Ignoring malformed request: %d", frame_type)
+            return None
+
+    def _bump_frame_version(self, frame_type: FrameType) -> None:
+        """Increase the frame version to notify client about a change."""
+        self._frame_versions[frame_type] = (
+            self._frame_versions[frame_type] + 1
+        ) % 0xFFFF
+
+    def _frame_versions_structure(self) -> bytes:
+        """Return the frame versions structure."""
+        return bytes([len(self._frame_versions)]) + b"".join(
+            bytes([frame_type]) + UnsignedShort(version).to_bytes()
+            for frame_type, version in self._frame_versions.items()
+        )
+
+    def _sensor_data(self) -> bytes:
+        """Return the sensor data message."""
+        working = self.state == DeviceState.WORKING
+        wave = math.sin(self._tick / 10)
+        noise = self._random.uniform(-0.05, 0.05)
+        outputs = {
+            "fan": working,
+            "feeder": working and self._tick % 4 == 0,
+            "heating_pump": True,
+            "water_heater_pump": self._tick % 20 < 10,
+            "lighter": self.state == DeviceState.KINDLING,
+        }
+        temperatures = {
+            "heating_temp": 60.0 + wave + noise,
+            "feeder_temp": 30.0 + noise,
+            "water_heater_temp": 50.0 + wave / 2 + noise,
+            "outside_temp": 2.0 + noise,
+            "return_temp": 45.0 + wave + noise,
+            "exhaust_temp": 120.0 + 5 * wave + noise,
+        }
+        statuses = {
+            "heating_target": 65,
+            "heating_status": 0,
+            "water_heater_target": 50,
+            "water_heater_status": 0,
+        }
+
+        message = bytearray(self._frame_versions_structure())
+        message.append(self.state)
+        message += UnsignedInt(
+            sum(1 << OUTPUTS.index(name) for name, state in outputs.items() if state)
+        ).to_bytes()
+        message += UnsignedInt(0x04 | 0x08).to_bytes()  # Pump flags.
+        message.append(len(temperatures))
+        for name, temp in temperatures.items():
+            message.append(TEMPERATURES.index(name))
+            message += Float(temp).to_bytes()
+
+        message += bytes(statuses[name] for name in STATUSES)
+        message.append(0)  # Pending alerts.
+        message.append(100 - self._tick // 60 % 100)  # Fuel level.
+        message.append(0)  # Transmission.
+        message += Float(60.0 if working else 0.0).to_bytes()  # Fan power.
+        message.append(50 if working else 0)  # Boiler load.
+        message += Float(10.0 if working else 0.0).to_bytes()  # Boiler power.
+        message += Float(2.0 if working else 0.0).to_bytes()  # Fuel consumption.
+        message.append(0)  # Thermostat.
+        for module in MODULES:
+            if module == ATTR_MODULE_A:
+                message += MODULE_A_VERSION
+            elif module == ATTR_PANEL:
+                message += PANEL_VERSION
+            else:
+                message.append(BYTE_UNDEFINED)
+
+        message.append(BYTE_UNDEFINED)  # Lambda sensor.
+        if self.config.thermostats > 0:
+            message.append(0)  # Contacts.
+            message.append(self.config.thermostats)
+            for _ in range(self.config.thermostats):
+                message.append(0)  # State.
+                message += Float(21.0 + wave / 2 + noise).to_bytes()
+                message += Float(22.0).to_bytes()
+        else:
+            message.append(BYTE_UNDEFINED)
+
+        message.append(self.config.mixers)
+        for index in range(self.config.mixers):
+            message += Float(40.0 + index + wave + noise).to_bytes()
+            message += bytes((45, 0, working, 0))
+
+        return bytes(message)
+
+    def _regulator_data(self) -> bytes:
+        """Return the regulator data message."""
+        values = [
+            (data_type, (param_id + self._tick) % 0xFF)
+            for param_id, data_type in self._regdata_schema
+        ]
+        return (
+            bytes(2)
+            + REGDATA_VERSION
+            + self._frame_versions_structure()
+            + pack_regdata(values)
+        )
+
+    def _uid(self, _: bytes) -> bytes:
+        """Return the UID response message."""
+        return (
+            struct.pack("<BH", PRODUCT_TYPE, PRODUCT_ID)
+            + bytes([len(PRODUCT_UID)])
+            + PRODUCT_UID
+            + UnsignedShort(0).to_bytes()  # Logo.
+            + UnsignedShort(0).to_bytes()  # Image.
+            + bytes([len(PRODUCT_MODEL)])
+            + PRODUCT_MODEL.encode()
+        )
+
+    def _password(self, _: bytes) -> bytes:
+        """Return the password response message."""
+        return bytes([len(PASSWORD)]) + PASSWORD.encode()
+
+    def _regulator_data_schema(self, _: bytes) -> bytes:
+        """Return the regulator data schema response message."""
+        return UnsignedShort(len(self._regdata_schema)).to_bytes() + b"".join(
+            bytes([DATA_TYPES.index(data_type)]) + UnsignedShort(param_id).to_bytes()
+            for param_id, data_type in self._regdata_schema
+        )
+
+    def _ecomax_parameters_message(self, _: bytes) -> bytes:
+        """Return the ecoMAX parameters response message."""
+        return bytes((0, 0, len(self._ecomax_parameters))) + b"".join(
+            parameter.pack() for parameter in self._ecomax_parameters
+        )
+
+    def _mixer_parameters_message(self, _: bytes) -> bytes:
+        """Return the mixer parameters response message."""
+        count = len(MIXER_PARAMETER_TYPES[PRODUCT_TYPE])
+        return bytes((0, 0, count, self.config.mixers)) + b"".join(
+            parameter.pack()
+            for parameters in self._mixer_parameters
+            for parameter in parameters
+        )
+
+    def _thermostat_parameters_message(self, _: bytes) -> bytes:
+        """Return the thermostat parameters response message."""
+        if not self._thermostat_parameters:
+            return bytes(3)
+
+        count = len(THERMOSTAT_PARAMETER_TYPES) * self.config.thermostats
+        return (
+            bytes((0, 0, count))
+            + self._thermostat_profile.pack()
+            + b"".join(
+                parameter.pack()
+                for parameters in self._thermostat_parameters
+                for parameter in parameters
+            )
+        )
+
+    def _alerts(self, _: bytes) -> bytes:
+        """Return the alerts response message."""
+        return bytes(3)
+
+    def _schedules(self, _: bytes) -> bytes:
+        """Return the schedules response message."""
+        return b""
+
+    def _set_ecomax_parameter(self, message: bytes) -> bytes:
+        """Set the ecoMAX parameter."""
+        index, value = message[0], message[1]
+        self._ecomax_parameters[index].value = value
+        self._bump_frame_version(FrameType.REQUEST_ECOMAX_PARAMETERS)
+        return b""
+
+    def _set_mixer_parameter(self, message: bytes) -> bytes:
+        """Set the mixer parameter."""
+        mixer, index, value = message[0], message[1], message[2]
+        self._mixer_parameters[mixer][index].value = value
+        self._bump_frame_version(FrameType.REQUEST_MIXER_PARAMETERS)
+        return b""
+
+    def _set_thermostat_parameter(self, message: bytes) -> bytes:
+        """Set the thermostat parameter.
+
+        Index is shifted by one to account for the thermostat profile
+        and offset by the number of parameters per thermostat.
+        """
+        value = int.from_bytes(message[1:], byteorder="little")
+        if message[0] == 0:
+            self._thermostat_profile.value = value
+        else:
+            thermostat, index = divmod(message[0] - 1, len(THERMOSTAT_PARAMETER_TYPES))
+            self._thermostat_parameters[thermostat][index].value = value
+
+        self._bump_frame_version(FrameType.REQUEST_THERMOSTAT_PARAMETERS)
+        return b""
+
+    def _ecomax_control(self, message: bytes) -> bytes:
+        """Turn the ecoMAX on or off."""
+        self.state = DeviceState.WORKING if message[0] else DeviceState.OFF
+        return b""
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the emulator from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    defaults = EmulatorConfig()
+    parser.add_argument("--host", default=defaults.host)
+    parser.add_argument("--port", type=int, default=defaults.port)
+    parser.add_argument("--mixers", type=int, default=defaults.mixers)
+    parser.add_argument("--thermostats", type=int, default=defaults.thermostats)
+    parser.add_argument("--regdata-size", type=int, default=defaults.regdata_size)
+    parser.add_argument("--frame-rate", type=float, default=defaults.frame_rate)
+    parser.add_argument("--packet-loss", type=float, default=defaults.packet_loss)
+    parser.add_argument("--latency", type=float, default=defaults.latency)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--debug", action="store_true")
+    args = vars(parser.parse_args(argv))
+
+    logging.basicConfig(level=logging.DEBUG if args.pop("debug") else logging.INFO)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(EcomaxEmulator(EmulatorConfig(**args)).serve_forever())
+
+
+if __name__ == "__main__":
+    main()
@@ -23,13 +23,18 @@ from homeassistant.components.climate import (
     HVACAction,
     HVACMode,
 )
-from homeassistant.const import ATTR_ENTITY_ID, ATTR_FRIENDLY_NAME
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_FRIENDLY_NAME, EVENT_STATE_CHANGED
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import entity_registry as er
 from pyplumio.parameters import ParameterValues
 from pyplumio.parameters.thermostat import ThermostatNumber, ThermostatNumberDescription
+from pyplumio.structures.sensor_data import ATTR_THERMOSTAT_SENSORS
+from pyplumio.structures.thermostat_parameters import ATTR_THERMOSTAT_PARAMETERS
 import pytest
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+)
 
 from custom_components.plum_ecomax.climate import (
     HA_PRESET_TO_EM_TEMP,
@@ -42,6 +47,7 @@ from custom_components.plum_ecomax.climate import (
     PRESET_SCHEDULE,
 )
 from custom_components.plum_ecomax.connection import EcomaxConnection
+from custom_components.plum_ecomax.const import ATTR_ECONOMY, CONF_ENABLED
 from tests.conftest import FLOAT_TOLERANCE
 
 
@@ -102,6 +108,35 @@ async def fixture_async_set_temperature():
     return async_set_temperature
 
 
+@pytest.mark.usefixtures("ecomax_p", "thermostats")
+async def test_thermostat_economy(
+    hass: HomeAssistant,
+    connection: EcomaxConnection,
+    config_entry: MockConfigEntry,
+    setup_config_entry,
+) -> None:
+    """Test that economy profile counts thermostat values separately."""
+    await setup_config_entry({ATTR_ECONOMY: {CONF_ENABLED: True}})
+    thermostat_entity_id = "climate.ecomax_thermostat_1_thermostat"
+    await connection.device.thermostats[0].dispatch(
+        ATTR_THERMOSTAT_SENSORS, {"current_temp": 18, "contacts": True}
+    )
+    await connection.device.thermostats[0].dispatch(
+        ATTR_THERMOSTAT_SENSORS, {"current_temp": 18, "contacts": True}
+    )
+    state = hass.states.get(thermostat_entity_id)
+    assert isinstance(state, State)
+    assert state.attributes[ATTR_HVAC_ACTION] == HVACAction.HEATING
+    suppressed_by_key = (
+        config_entry.runtime_data.connection.economy_statistics.suppressed_by_key
+    )
+    # Contacts change is passed right away, while the room temperature
+    # is held back until the update interval elapses.
+    assert suppressed_by_key[f"{thermostat_entity_id}.current_temp"] == 2
+    assert suppressed_by_key[f"{thermostat_entity_id}.contacts"] == 1
+    assert thermostat_entity_id not in suppressed_by_key
+
+
 @pytest.mark.usefixtures("ecomax_p", "thermostats")
 async def test_thermostat(
     hass: HomeAssistant,
@@ -160,7 +195,7 @@ async def test_thermostat(
     # Dispatch new room temperature.
     frozen_time.move_to("12:00:10")
     await connection.device.thermostats[0].dispatch(
-        thermostat_current_temperature_key, 18
+        ATTR_THERMOSTAT_SENSORS, {thermostat_current_temperature_key: 18}
     )
     state = hass.states.get(thermostat_entity_id)
     assert isinstance(state, State)
@@ -168,18 +203,22 @@ async def test_thermostat(
 
     # Dispatch new thermostat state.
     await connection.device.thermostats[0].dispatch(
-        thermostat_state_key, HA_TO_EM_MODE[PRESET_ECO]
+        ATTR_THERMOSTAT_SENSORS, {thermostat_state_key: HA_TO_EM_MODE[PRESET_ECO]}
     )
     state = hass.states.get(thermostat_entity_id)
     assert isinstance(state, State)
     assert state.attributes[ATTR_PRESET_MODE] == PRESET_ECO
 
     # Dispatch unknown thermostat state and check for log message.
-    await connection.device.thermostats[0].dispatch(thermostat_state_key, 99)
+    await connection.device.thermostats[0].dispatch(
+        ATTR_THERMOSTAT_SENSORS, {thermostat_state_key: 99}
+    )
     assert "Unknown climate preset 99" in caplog.text
 
     # Dispatch new thermostat contacts state.
-    await connection.device.thermostats[0].dispatch(thermostat_contacts_key, True)
+    await connection.device.thermostats[0].dispatch(
+        ATTR_THERMOSTAT_SENSORS, {thermostat_contacts_key: True}
+    )
     state = hass.states.get(thermostat_entity_id)
     assert isinstance(state, State)
     assert state.attributes[ATTR_HVAC_ACTION] == HVACAction.HEATING
@@ -197,18 +236,45 @@ async def test_thermostat(
         ),
     )
     await connection.device.thermostats[0].dispatch(
-        thermostat_target_temperature_key, 11
+        ATTR_THERMOSTAT_SENSORS, {thermostat_target_temperature_key: 11}
     )
     state = hass.states.get(thermostat_entity_id)
     assert isinstance(state, State)
     assert state.attributes[ATTR_TEMPERATURE] == 11
 
+    # Test that state is written once per thermostat frame.
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    frozen_time.move_to("12:00:20")
+    await connection.device.thermostats[0].dispatch(
+        ATTR_THERMOSTAT_SENSORS,
+        {
+            thermostat_state_key: HA_TO_EM_MODE[PRESET_SCHEDULE],
+            thermostat_current_temperature_key: 20,
+            thermostat_target_temperature_key: 12,
+            thermostat_contacts_key: False,
+        },
+    )
+    await hass.async_block_till_done()
+    assert len(events) == 1
+    state = events[0].data["new_state"]
+    assert state.attributes[ATTR_PRESET_MODE] == PRESET_SCHEDULE
+    assert state.attributes[ATTR_CURRENT_TEMPERATURE] == 20
+    assert state.attributes[ATTR_TEMPERATURE] == 12
+    assert state.attributes[ATTR_HVAC_ACTION] == HVACAction.IDLE
+
+    # Test that unchanged frame is not written.
+    await connection.device.thermostats[0].dispatch(
+        ATTR_THERMOSTAT_SENSORS, {thermostat_target_temperature_key: 12}
+    )
+    await hass.async_block_till_done()
+    assert len(events) == 1
+
     # Test that thermostat preset mode can be set.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_set_preset_mode(hass, thermostat_entity_id, PRESET_COMFORT)
 
     assert isinstance(state, State)
-    mock_set_nowait.assert_called_once_with(
+    mock_set.assert_awaited_once_with(
         thermostat_mode_key, HA_TO_EM_MODE[PRESET_COMFORT]
     )
     assert state.attributes[ATTR_PRESET_MODE] == PRESET_COMFORT
@@ -237,40 +303,32 @@ async def test_thermostat_presets(
     """Test thermostat presets."""
     await setup_config_entry()
     thermostat_entity_id = "climate.ecomax_thermostat_1_thermostat"
-    thermostat_mode_key = "mode"
     thermostat_target_temperature_key = "target_temp"
     thermostat_day_target_temperature_key = "day_target_temp"
     thermostat_night_target_temperature_key = "night_target_temp"
 
     # Test that correct target temperature is being set depending on the preset.
     for preset, temperature in HA_PRESET_TO_EM_TEMP.items():
-        with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+        with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
             await async_set_preset_mode(hass, thermostat_entity_id, preset)
             await async_set_temperature(hass, thermostat_entity_id, 19)
 
-        mock_set_nowait.assert_any_call(temperature, 19)
+        mock_set.assert_any_await(temperature, 19)
 
     # Test that target temperature name doesn't change when
     # in airing mode.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         await async_set_preset_mode(hass, thermostat_entity_id, PRESET_ECO)
         await async_set_preset_mode(hass, thermostat_entity_id, PRESET_AIRING)
         await async_set_temperature(hass, thermostat_entity_id, 19)
 
-    mock_set_nowait.assert_any_call(thermostat_night_target_temperature_key, 19)
+    mock_set.assert_any_await(thermostat_night_target_temperature_key, 19)
 
     # Test that airing mode is correctly set.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         await connection.device.thermostats[0].dispatch(
-            thermostat_mode_key,
-            ThermostatNumber(
-                offset=0,
-                device=connection.device.thermostats[0],
-                values=ParameterValues(value=4, min_value=0, max_value=7),
-                description=ThermostatNumberDescription(
-                    thermostat_mode_key, step=1, size=2
-                ),
-            ),
+            ATTR_THERMOSTAT_PARAMETERS,
+            [(0, ParameterValues(value=4, min_value=0, max_value=7))],
         )
 
     state = hass.states.get(thermostat_entity_id)
@@ -278,17 +336,10 @@ async def test_thermostat_presets(
     assert state.attributes[ATTR_PRESET_MODE] == PRESET_AIRING
 
     # Test that exiting airing mode works.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         await connection.device.thermostats[0].dispatch(
-            thermostat_mode_key,
-            ThermostatNumber(
-                offset=0,
-                device=connection.device.thermostats[0],
-                values=ParameterValues(value=0, min_value=0, max_value=7),
-                description=ThermostatNumberDescription(
-                    thermostat_mode_key, step=1, size=2
-                ),
-            ),
+            ATTR_THERMOSTAT_PARAMETERS,
+            [(0, ParameterValues(value=0, min_value=0, max_value=7))],
         )
 
     state = hass.states.get(thermostat_entity_id)
@@ -297,33 +348,33 @@ async def test_thermostat_presets(
 
     # Test that target temperature name is correct when
     # in day mode (schedule).
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         await async_set_preset_mode(hass, thermostat_entity_id, PRESET_SCHEDULE)
         await connection.device.thermostats[0].dispatch(
-            thermostat_target_temperature_key, 16
+            ATTR_THERMOSTAT_SENSORS, {thermostat_target_temperature_key: 16}
         )
         await async_set_temperature(hass, thermostat_entity_id, 17)
 
-    mock_set_nowait.assert_any_call(thermostat_day_target_temperature_key, 17)
+    mock_set.assert_any_await(thermostat_day_target_temperature_key, 17)
 
     # Test that target temperature name is correct when
     # in night mode (schedule).
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         await async_set_preset_mode(hass, thermostat_entity_id, PRESET_SCHEDULE)
         await connection.device.thermostats[0].dispatch(
-            thermostat_target_temperature_key, 10
+            ATTR_THERMOSTAT_SENSORS, {thermostat_target_temperature_key: 10}
         )
         await async_set_temperature(hass, thermostat_entity_id, 12)
 
-    mock_set_nowait.assert_any_call(thermostat_night_target_temperature_key, 12)
+    mock_set.assert_any_await(thermostat_night_target_temperature_key, 12)
 
     # Test that target temperature name doesn't change when
     # changing only target temperature.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         await async_set_preset_mode(hass, thermostat_entity_id, PRESET_SCHEDULE)
         await connection.device.thermostats[0].dispatch(
-            thermostat_target_temperature_key, 21
+            ATTR_THERMOSTAT_SENSORS, {thermostat_target_temperature_key: 21}
         )
         await async_set_temperature(hass, thermostat_entity_id, 10)
 
-    mock_set_nowait.assert_any_call(thermostat_night_target_temperature_key, 10)
+    mock_set.assert_any_await(thermostat_night_target_temperature_key, 10)
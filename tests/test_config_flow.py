@@ -2,6 +2,7 @@
 
 from collections.abc import Generator
 from dataclasses import replace
+from ipaddress import IPv4Network
 from typing import Any, Final, cast
 from unittest.mock import AsyncMock, Mock, call, patch
 
@@ -33,19 +34,26 @@ from pyplumio.connection import SerialConnection, TcpConnection
 from pyplumio.const import ProductType
 from pyplumio.devices.ecomax import EcoMAX
 from pyplumio.exceptions import ConnectionFailedError
+from pyplumio.protocol import AsyncProtocol
 from pyplumio.structures.product_info import ProductInfo
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.plum_ecomax.config_flow import SourceCandidates
+from custom_components.plum_ecomax.connection import async_claim_connection
 from custom_components.plum_ecomax.const import (
+    ATTR_ECONOMY,
     ATTR_ENTITIES,
     ATTR_REGDATA,
+    BAUDRATE_AUTO,
     CONF_BAUDRATE,
     CONF_CONNECTION_TYPE,
     CONF_DEVICE,
+    CONF_ENABLED,
     CONF_HOST,
     CONF_KEY,
     CONF_MODEL,
+    CONF_NETWORK,
     CONF_PORT,
     CONF_PRODUCT_ID,
     CONF_PRODUCT_TYPE,
@@ -53,6 +61,7 @@ from custom_components.plum_ecomax.const import (
     CONF_SOURCE_DEVICE,
     CONF_STEP,
     CONF_SUB_DEVICES,
+    CONF_TOLERANCE,
     CONF_UID,
     CONF_UPDATE_INTERVAL,
     CONNECTION_TYPE_SERIAL,
@@ -146,6 +155,7 @@ async def test_form_tcp(
 
     # Create the PyPlumIO connection mock.
     mock_connection = Mock(spec=TcpConnection)
+    mock_connection.protocol = AsyncProtocol()
     mock_connection.device.return_value.__aenter__ = AsyncMock(return_value=ecomax_p)
     mock_connection.device.return_value.__aexit__ = AsyncMock()
 
@@ -162,14 +172,8 @@ async def test_form_tcp(
     assert result3["type"] is FlowResultType.SHOW_PROGRESS
     assert result3["step_id"] == "identify"
 
-    # Discover connected modules.
-    result4 = await hass.config_entries.flow.async_configure(result3["flow_id"])
-    await hass.async_block_till_done()
-    assert result4["type"] is FlowResultType.SHOW_PROGRESS
-    assert result4["step_id"] == "discover"
-
     # Finish the config flow.
-    result5 = await hass.config_entries.flow.async_configure(result4["flow_id"])
+    result5 = await hass.config_entries.flow.async_configure(result3["flow_id"])
     assert result5["type"] is FlowResultType.CREATE_ENTRY
     assert result5["title"] == "ecoMAX 850P2-C"
     assert result5["data"] == {
@@ -191,6 +195,11 @@ async def test_form_tcp(
         CONF_SUB_DEVICES: ["water_heater"],
     }
 
+    # Check that the connection was handed off to the config entry.
+    config_entry = result5["result"]
+    assert config_entry.runtime_data.connection.handler is mock_connection
+    mock_connection.close.assert_not_awaited()
+
 
 @pytest.mark.usefixtures("water_heater")
 async def test_form_serial(
@@ -247,6 +256,7 @@ async def test_form_serial(
 
     # Create the PyPlumIO connection mock.
     mock_connection = Mock(spec=SerialConnection)
+    mock_connection.protocol = AsyncProtocol()
     mock_connection.device.return_value.__aenter__ = AsyncMock(return_value=ecomax_p)
     mock_connection.device.return_value.__aexit__ = AsyncMock()
 
@@ -263,14 +273,8 @@ async def test_form_serial(
     assert result3["type"] is FlowResultType.SHOW_PROGRESS
     assert result3["step_id"] == "identify"
 
-    # Discover connected modules.
-    result4 = await hass.config_entries.flow.async_configure(result3["flow_id"])
-    await hass.async_block_till_done()
-    assert result4["type"] is FlowResultType.SHOW_PROGRESS
-    assert result4["step_id"] == "discover"
-
     # Finish the config flow.
-    result5 = await hass.config_entries.flow.async_configure(result4["flow_id"])
+    result5 = await hass.config_entries.flow.async_configure(result3["flow_id"])
     assert result5["type"] is FlowResultType.CREATE_ENTRY
     assert result5["title"] == "ecoMAX 850P2-C"
     assert result5["data"] == {
@@ -292,6 +296,185 @@ async def test_form_serial(
         CONF_SUB_DEVICES: ["water_heater"],
     }
 
+    # Check that the connection was handed off to the config entry.
+    config_entry = result5["result"]
+    assert config_entry.runtime_data.connection.handler is mock_connection
+    mock_connection.close.assert_not_awaited()
+
+
+async def test_form_serial_auto_baudrate(
+    hass: HomeAssistant, serial_user_input: dict[str, Any]
+) -> None:
+    """Test that serial baudrate is detected."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"], user_input={"next_step_id": "serial"}
+    )
+    serial_user_input[CONF_BAUDRATE] = BAUDRATE_AUTO
+
+    # Catch connection error.
+    with patch(
+        "custom_components.plum_ecomax.config_flow.async_detect_baudrate",
+        side_effect=ConnectionFailedError,
+    ):
+        result3 = await hass.config_entries.flow.async_configure(
+            result2["flow_id"], serial_user_input
+        )
+
+    assert result3["type"] is FlowResultType.FORM
+    assert result3["errors"] == {CONF_BASE: "cannot_connect"}
+
+    # Catch undetected baudrate.
+    with patch(
+        "custom_components.plum_ecomax.config_flow.async_detect_baudrate",
+        return_value=None,
+    ) as mock_detect_baudrate:
+        result3 = await hass.config_entries.flow.async_configure(
+            result2["flow_id"], serial_user_input
+        )
+
+    mock_detect_baudrate.assert_awaited_once_with(DEFAULT_DEVICE)
+    assert result3["type"] is FlowResultType.FORM
+    assert result3["errors"] == {CONF_BAUDRATE: "baudrate_not_detected"}
+
+    # Connect with the detected baudrate.
+    with (
+        patch(
+            "custom_components.plum_ecomax.config_flow.async_detect_baudrate",
+            return_value="57600",
+        ),
+        patch(
+            "custom_components.plum_ecomax.config_flow.async_get_connection_handler",
+            side_effect=ConnectionFailedError,
+        ) as mock_get_connection_handler,
+    ):
+        result3 = await hass.config_entries.flow.async_configure(
+            result2["flow_id"], serial_user_input
+        )
+
+    mock_get_connection_handler.assert_called_once_with(
+        CONNECTION_TYPE_SERIAL,
+        {CONF_DEVICE: DEFAULT_DEVICE, CONF_BAUDRATE: "57600"},
+    )
+    assert result3["errors"] == {CONF_BASE: "cannot_connect"}
+
+
+async def test_form_scan(hass: HomeAssistant) -> None:
+    """Test that we can scan the network for converters."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"], user_input={"next_step_id": "scan"}
+    )
+    assert result2["type"] is FlowResultType.FORM
+    assert result2["step_id"] == "scan"
+
+    # Catch invalid network.
+    result3 = await hass.config_entries.flow.async_configure(
+        result2["flow_id"], {CONF_NETWORK: "192.168.1.300/24"}
+    )
+    assert result3["type"] is FlowResultType.FORM
+    assert result3["errors"] == {CONF_NETWORK: "invalid_network"}
+
+    # Catch network that is too large.
+    result3 = await hass.config_entries.flow.async_configure(
+        result2["flow_id"], {CONF_NETWORK: "10.0.0.0/8"}
+    )
+    assert result3["type"] is FlowResultType.FORM
+    assert result3["errors"] == {CONF_NETWORK: "network_too_large"}
+
+    # Scan the network.
+    with patch(
+        "custom_components.plum_ecomax.config_flow.async_scan_hosts",
+        return_value=["192.168.1.10"],
+    ) as mock_scan_hosts:
+        result3 = await hass.config_entries.flow.async_configure(
+            result2["flow_id"], {CONF_NETWORK: "192.168.1.0/24"}
+        )
+        assert result3["type"] is FlowResultType.SHOW_PROGRESS
+        assert result3["step_id"] == "scan_network"
+        assert result3["description_placeholders"] == {"networks": "192.168.1.0/24"}
+        await hass.async_block_till_done()
+
+    assert len(list(mock_scan_hosts.call_args.args[0])) == 254
+
+    result4 = await hass.config_entries.flow.async_configure(result3["flow_id"])
+    assert result4["type"] is FlowResultType.FORM
+    assert result4["step_id"] == "scan_select"
+
+    # Select the found converter.
+    with patch(
+        "custom_components.plum_ecomax.config_flow.async_get_connection_handler",
+        side_effect=ConnectionFailedError,
+    ) as mock_get_connection_handler:
+        result5 = await hass.config_entries.flow.async_configure(
+            result4["flow_id"], {CONF_HOST: "192.168.1.10"}
+        )
+
+    mock_get_connection_handler.assert_called_once_with(
+        CONNECTION_TYPE_TCP, {CONF_HOST: "192.168.1.10", CONF_PORT: DEFAULT_PORT}
+    )
+    assert result5["type"] is FlowResultType.FORM
+    assert result5["step_id"] == "tcp"
+    assert result5["errors"] == {CONF_BASE: "cannot_connect"}
+
+
+async def test_form_scan_not_found(hass: HomeAssistant) -> None:
+    """Test that flow is aborted if no converters are found."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"], user_input={"next_step_id": "scan"}
+    )
+
+    with (
+        patch(
+            "custom_components.plum_ecomax.config_flow.async_get_scan_networks",
+            return_value=[IPv4Network("192.168.1.0/24")],
+        ),
+        patch(
+            "custom_components.plum_ecomax.config_flow.async_scan_hosts",
+            return_value=[],
+        ),
+    ):
+        result3 = await hass.config_entries.flow.async_configure(result2["flow_id"], {})
+        await hass.async_block_till_done()
+
+    result4 = await hass.config_entries.flow.async_configure(result3["flow_id"])
+    assert result4["type"] is FlowResultType.ABORT
+    assert result4["reason"] == "no_devices_found"
+
+
+async def test_form_scan_failed(hass: HomeAssistant) -> None:
+    """Test that flow is aborted if the scan fails."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"], user_input={"next_step_id": "scan"}
+    )
+
+    with (
+        patch(
+            "custom_components.plum_ecomax.config_flow.async_get_scan_networks",
+            return_value=[IPv4Network("192.168.1.0/24")],
+        ),
+        patch(
+            "custom_components.plum_ecomax.config_flow.async_scan_hosts",
+            side_effect=OSError("Connection reset by peer"),
+        ),
+    ):
+        result3 = await hass.config_entries.flow.async_configure(result2["flow_id"], {})
+        await hass.async_block_till_done()
+
+    result4 = await hass.config_entries.flow.async_configure(result3["flow_id"])
+    assert result4["type"] is FlowResultType.ABORT
+    assert result4["reason"] == "no_devices_found"
+
 
 async def test_abort_device_not_found(
     hass: HomeAssistant, tcp_user_input: dict[str, Any]
@@ -398,10 +581,22 @@ async def test_abort_discovery_failed(
     mock_connection.device.return_value.__aenter__ = AsyncMock(return_value=ecomax_p)
     mock_connection.device.return_value.__aexit__ = AsyncMock()
 
-    # Identify the device.
-    with patch(
-        "custom_components.plum_ecomax.config_flow.async_get_connection_handler",
-        return_value=mock_connection,
+    # Identify the device and fail to discover connected modules.
+    get = ecomax_p.get
+
+    async def _get(name: str, *args: Any, **kwargs: Any) -> Any:
+        """Time out waiting for the connected modules."""
+        if name == "modules":
+            raise TimeoutError
+
+        return await get(name, *args, **kwargs)
+
+    with (
+        patch(
+            "custom_components.plum_ecomax.config_flow.async_get_connection_handler",
+            return_value=mock_connection,
+        ),
+        patch.object(ecomax_p, "get", side_effect=_get),
     ):
         result3 = await hass.config_entries.flow.async_configure(
             result2["flow_id"], tcp_user_input
@@ -411,18 +606,10 @@ async def test_abort_discovery_failed(
     assert result3["type"] is FlowResultType.SHOW_PROGRESS
     assert result3["step_id"] == "identify"
 
-    # Discover connected modules.
-    with patch("pyplumio.devices.ecomax.EcoMAX.get", side_effect=TimeoutError):
-        result4 = await hass.config_entries.flow.async_configure(result3["flow_id"])
-        await hass.async_block_till_done()
-
-    assert result4["type"] is FlowResultType.SHOW_PROGRESS
-    assert result4["step_id"] == "discover"
-
     # Fail with module discovery failure.
-    result5 = await hass.config_entries.flow.async_configure(result4["flow_id"])
-    assert result5["type"] is FlowResultType.ABORT
-    assert result5["reason"] == "discovery_failed"
+    result4 = await hass.config_entries.flow.async_configure(result3["flow_id"])
+    assert result4["type"] is FlowResultType.ABORT
+    assert result4["reason"] == "discovery_failed"
 
 
 async def test_abort_already_configured(
@@ -445,11 +632,21 @@ async def test_abort_already_configured(
     mock_connection = Mock(spec=TcpConnection)
     mock_connection.device.return_value.__aenter__ = AsyncMock(return_value=ecomax_p)
     mock_connection.device.return_value.__aexit__ = AsyncMock()
+    mock_config_entry = Mock(spec=config_entries.ConfigEntry)
+    product = cast(ProductInfo, ecomax_p.get_nowait("product"))
+    mock_config_entry.unique_id = product.uid
+    mock_config_entry.source = config_entries.SOURCE_USER
 
     # Identify the device.
-    with patch(
-        "custom_components.plum_ecomax.config_flow.async_get_connection_handler",
-        return_value=mock_connection,
+    with (
+        patch(
+            "custom_components.plum_ecomax.config_flow.async_get_connection_handler",
+            return_value=mock_connection,
+        ),
+        patch(
+            "homeassistant.config_entries.ConfigEntries.async_entry_for_domain_unique_id",
+            return_value=mock_config_entry,
+        ),
     ):
         result3 = await hass.config_entries.flow.async_configure(
             result2["flow_id"], tcp_user_input
@@ -459,19 +656,11 @@ async def test_abort_already_configured(
     assert result3["type"] is FlowResultType.SHOW_PROGRESS
     assert result3["step_id"] == "identify"
 
-    # Fail with device already configured.
-    mock_config_entry = Mock(spec=config_entries.ConfigEntry)
-    product = cast(ProductInfo, ecomax_p.get_nowait("product"))
-    mock_config_entry.unique_id = product.uid
-    mock_config_entry.source = config_entries.SOURCE_USER
-    with patch(
-        "homeassistant.config_entries.ConfigEntries.async_entry_for_domain_unique_id",
-        return_value=mock_config_entry,
-    ):
-        result4 = await hass.config_entries.flow.async_configure(result3["flow_id"])
-
+    # Fail with device already configured and close the connection.
+    result4 = await hass.config_entries.flow.async_configure(result3["flow_id"])
     assert result4["type"] is FlowResultType.ABORT
     assert result4["reason"] == "already_configured"
+    mock_connection.close.assert_awaited_once()
 
 
 COMMON_TYPE_MENU_OPTIONS: Final = [
@@ -1328,3 +1517,60 @@ async def test_rediscover_devices(
     expected_data[CONF_SUB_DEVICES] = mock_async_get_sub_devices.return_value
     mock_async_update_entry.assert_has_calls([call(config_entry, data=expected_data)])
     mock_async_reload.assert_awaited_once_with(config_entry.entry_id)
+    assert (
+        async_claim_connection(hass, config_entry.data[CONF_UID]) is connection.handler
+    )
+
+
+@pytest.mark.usefixtures("connection", "bypass_async_setup_entry")
+async def test_economy(
+    hass: HomeAssistant, config_entry: MockConfigEntry, setup_config_entry
+) -> None:
+    """Test configuring the economy profile."""
+    await setup_config_entry()
+    result = await setup_options_flow(hass, config_entry)
+
+    # Get the economy profile form.
+    result2 = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={"next_step_id": "economy"}
+    )
+    assert result2["type"] is FlowResultType.FORM
+    assert result2["step_id"] == "economy"
+
+    # Enable the economy profile.
+    economy = {CONF_ENABLED: True, CONF_TOLERANCE: 1.5, CONF_UPDATE_INTERVAL: 120}
+    result3 = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input=economy
+    )
+    assert result3["type"] is FlowResultType.CREATE_ENTRY
+    assert result3["data"] == {ATTR_ENTITIES: {}, ATTR_ECONOMY: economy}
+
+
+def test_source_candidates() -> None:
+    """Test the source candidates index."""
+    source_candidates = SourceCandidates()
+    source_candidates.update({"heating_temp": 60.0, "fan": True, "product": object()})
+    assert source_candidates.platforms[Platform.SENSOR] == ["heating_temp"]
+    assert source_candidates.platforms[Platform.BINARY_SENSOR] == ["fan"]
+    assert "product" not in source_candidates.labels
+
+    # Test that changed values are reformatted.
+    source_candidates.update(
+        {"heating_temp": 65.0, "fan": True, "fuel_level": 50, "product": object()}
+    )
+    assert source_candidates.platforms[Platform.SENSOR] == [
+        "fuel_level",
+        "heating_temp",
+    ]
+    assert source_candidates.labels["heating_temp"] == "heating_temp (value: 65.0)"
+
+    # Test that removed keys are dropped from the index.
+    source_candidates.update({"heating_temp": 65.0, "fan": "on"})
+    assert source_candidates.platforms[Platform.SENSOR] == ["fan", "heating_temp"]
+    assert source_candidates.platforms[Platform.BINARY_SENSOR] == []
+    assert "fuel_level" not in source_candidates.labels
+
+    # Test that registered keys are excluded, unless selected.
+    assert source_candidates.select_options(
+        Platform.SENSOR, exclude={"fan", "heating_temp"}, selected="fan"
+    ) == [{"value": "fan", "label": "fan (value: on)"}]
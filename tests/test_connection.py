@@ -1,29 +1,51 @@
 """Test Plum ecoMAX connection."""
 
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import suppress
+from datetime import timedelta
 from functools import partial
+from ipaddress import IPv4Network
 import logging
+import os
+import termios
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.util import dt as dt_util
 from pyplumio import RequestError
 from pyplumio.connection import Connection, SerialConnection, TcpConnection
 from pyplumio.const import FrameType
+from pyplumio.data_types import UnsignedChar, UnsignedShort
 from pyplumio.devices.ecomax import EcoMAX
+from pyplumio.exceptions import ConnectionFailedError
 from pyplumio.structures.mixer_parameters import ATTR_MIXER_PARAMETERS
+from pyplumio.structures.regulator_data_schema import ATTR_REGDATA_SCHEMA
+from pyplumio.structures.sensor_data import ATTR_STATE
 from pyplumio.structures.thermostat_parameters import ATTR_THERMOSTAT_PARAMETERS
 import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
 from custom_components.plum_ecomax.connection import (
+    BAUDRATE_PROBE_ORDER,
     DEFAULT_RETRIES,
     DEFAULT_TIMEOUT,
+    HANDOFF_TIMEOUT,
     WAIT_FOR_DEVICE_SECONDS,
     EcomaxConnection,
+    async_claim_connection,
+    async_detect_baudrate,
     async_get_connection_handler,
+    async_get_scan_networks,
     async_get_sub_devices,
+    async_handoff_connection,
+    async_is_connection_handed_off,
+    async_probe_host,
     async_resolve_host_name,
+    async_scan_hosts,
 )
 from custom_components.plum_ecomax.const import (
     ATTR_MIXERS,
@@ -38,8 +60,14 @@ from custom_components.plum_ecomax.const import (
     CONF_UID,
     CONNECTION_TYPE_SERIAL,
     CONNECTION_TYPE_TCP,
+    DEFAULT_BAUDRATE,
     DeviceType,
+    ModuleType,
 )
+from custom_components.plum_ecomax.cycles import RUNTIME_KEYS
+from custom_components.plum_ecomax.scheduler import get_scheduler
+from custom_components.plum_ecomax.windows import WINDOW_KEYS
+from tests.emulator import EcomaxEmulator, pack_frame
 
 
 @pytest.mark.parametrize(
@@ -81,6 +109,7 @@ async def test_async_get_connection_handler(
         connection = await connection_partial(serial_config_data)
 
     assert isinstance(connection, connection_cls)
+    assert get_scheduler(connection) is not None
 
 
 @pytest.mark.usefixtures("mixers", "thermostats", "water_heater")
@@ -143,6 +172,61 @@ async def test_async_setup(
         await connection.async_setup()
 
 
+async def test_async_setup_with_cached_regdata_schema(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test connection setup with cached regulator data schema."""
+    mock_ecomax = AsyncMock(spec=EcoMAX)
+    mock_connection = Mock(spec=TcpConnection)
+    mock_connection.device.return_value.__aenter__ = AsyncMock(return_value=mock_ecomax)
+    mock_connection.device.return_value.__aexit__ = AsyncMock()
+    connection = EcomaxConnection(hass, config_entry, mock_connection)
+    storage_key = "plum_ecomax.test.regdata_schema"
+    hass_storage[storage_key] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": storage_key,
+        "data": {"key": connection.regdata_schema_key, "schema": [[1792, 5]]},
+    }
+    await connection.async_setup()
+    mock_ecomax.dispatch.assert_awaited_once_with(
+        ATTR_REGDATA_SCHEMA, [(1792, UnsignedShort())]
+    )
+    mock_ecomax.subscribe.assert_any_call(
+        ATTR_REGDATA_SCHEMA, connection._async_save_regdata_schema
+    )
+
+    # Test that rolling windows, burner cycles, runtime counters and
+    # fuel forecast are subscribed to the raw values.
+    mock_ecomax.subscribe.assert_any_call(
+        ATTR_STATE, connection.cycles.async_handle_state
+    )
+    assert mock_ecomax.subscribe.call_count == len(WINDOW_KEYS) + len(RUNTIME_KEYS) + 3
+
+    # Test that cache is updated when schema is changed.
+    await connection._async_save_regdata_schema([(1792, UnsignedShort())])
+    await connection._async_save_regdata_schema([(1792, UnsignedChar())])
+    assert hass_storage[storage_key]["data"]["schema"] == [[1792, 4]]
+
+    # Test that cached schema is ignored for a different firmware.
+    hass.config_entries.async_update_entry(
+        config_entry,
+        data={
+            **config_entry.data,
+            CONF_SOFTWARE: {
+                **config_entry.data[CONF_SOFTWARE],
+                ModuleType.A: "7.0.0",
+            },
+        },
+    )
+    connection = EcomaxConnection(hass, config_entry, mock_connection)
+    mock_ecomax.reset_mock()
+    await connection.async_setup()
+    mock_ecomax.dispatch.assert_not_awaited()
+
+
 @patch("custom_components.plum_ecomax.connection.EcomaxConnection.device")
 @pytest.mark.parametrize(
     ("request_result", "expected_result", "error_message"),
@@ -252,3 +336,210 @@ async def test_async_setup_regdata(
     )
     if error_message:
         assert error_message in caplog.text
+        mock_device.subscribe.assert_not_called()
+    else:
+        # Test that regulator data view is attached once.
+        mock_device.subscribe.assert_called_once_with(
+            ATTR_REGDATA, connection.regdata.async_update
+        )
+
+
+async def test_connection_handoff(hass: HomeAssistant) -> None:
+    """Test handing off the connection to the config entry setup."""
+    mock_connection = AsyncMock(spec=TcpConnection)
+    assert async_claim_connection(hass, "TEST") is None
+    async_handoff_connection(hass, "TEST", mock_connection)
+    assert async_is_connection_handed_off(hass, mock_connection)
+
+    # Test claiming the connection.
+    assert async_claim_connection(hass, "TEST") is mock_connection
+    assert not async_is_connection_handed_off(hass, mock_connection)
+    assert async_claim_connection(hass, "TEST") is None
+
+    # Test that replaced connection is closed.
+    mock_connection2 = AsyncMock(spec=TcpConnection)
+    async_handoff_connection(hass, "TEST", mock_connection)
+    async_handoff_connection(hass, "TEST", mock_connection2)
+    await hass.async_block_till_done()
+    mock_connection.close.assert_awaited_once()
+
+    # Test that unclaimed connection is closed after the timeout.
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=HANDOFF_TIMEOUT + 1)
+    )
+    await hass.async_block_till_done()
+    mock_connection2.close.assert_awaited_once()
+    assert async_claim_connection(hass, "TEST") is None
+
+
+async def test_async_setup_handed_off(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> None:
+    """Test connection setup with the connection that was handed off."""
+    mock_ecomax = AsyncMock(spec=EcoMAX)
+    mock_connection = Mock(spec=TcpConnection)
+    mock_connection.device.return_value.__aenter__ = AsyncMock(return_value=mock_ecomax)
+    mock_connection.device.return_value.__aexit__ = AsyncMock()
+    connection = EcomaxConnection(hass, config_entry, mock_connection)
+    await connection.async_setup(connect=False)
+    mock_connection.connect.assert_not_called()
+    assert connection.device is mock_ecomax
+    assert connection.handler is mock_connection
+
+
+@pytest.fixture(name="serial_device")
+async def fixture_serial_device() -> AsyncGenerator[str]:
+    """Get a pseudo-terminal that talks at 57600 baud only."""
+    master, slave = os.openpty()
+    os.set_blocking(master, False)
+    frame = pack_frame(FrameType.REQUEST_CHECK_DEVICE, b"")
+
+    async def _talk() -> None:
+        """Write frames at the expected baudrate and garbage otherwise."""
+        while True:
+            ospeed = termios.tcgetattr(slave)[5]
+            with suppress(BlockingIOError):
+                os.write(master, frame if ospeed == termios.B57600 else b"\x00\xff")
+
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(_talk())
+    try:
+        yield os.ttyname(slave)
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+        os.close(master)
+        os.close(slave)
+
+
+async def test_async_detect_baudrate(serial_device: str) -> None:
+    """Test detecting the serial baudrate."""
+    assert BAUDRATE_PROBE_ORDER[0] == DEFAULT_BAUDRATE
+    assert [int(x) for x in BAUDRATE_PROBE_ORDER[1:]] == sorted(
+        (int(x) for x in BAUDRATE_PROBE_ORDER[1:]), reverse=True
+    )
+    assert await async_detect_baudrate(serial_device, timeout=0.5) == "57600"
+    assert (
+        await async_detect_baudrate(serial_device, ("115200", "9600"), timeout=0.2)
+        is None
+    )
+
+    with pytest.raises(ConnectionFailedError):
+        await async_detect_baudrate("/dev/nonexistent", timeout=0.2)
+
+
+async def test_async_detect_baudrate_read_failure() -> None:
+    """Test that read failure fails the probe for the baudrate."""
+    mock_protocol = Mock()
+    mock_protocol.reader.read = AsyncMock(
+        side_effect=(OSError("Serial connection broken"), None)
+    )
+    with (
+        patch(
+            "custom_components.plum_ecomax.connection.DummyProtocol",
+            return_value=mock_protocol,
+        ),
+        patch(
+            "custom_components.plum_ecomax.connection.pyplumio.SerialConnection"
+        ) as mock_serial_connection,
+    ):
+        mock_serial_connection.return_value.connect = AsyncMock()
+        mock_serial_connection.return_value.close = AsyncMock()
+        assert (
+            await async_detect_baudrate("/dev/ttyUSB0", ("115200", "9600"), timeout=1)
+            == "9600"
+        )
+
+    assert mock_serial_connection.return_value.close.await_count == 2
+
+
+async def test_async_probe_host(ecomax_emulator: EcomaxEmulator) -> None:
+    """Test probing the host for the RS-485 to TCP converter."""
+    assert await async_probe_host(ecomax_emulator.host, ecomax_emulator.port)
+
+    async def _handle_client(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Write garbage to the client."""
+        writer.write(b"\x68\x00\xff" * 10)
+        await writer.drain()
+
+    # Test with the service that does not talk ecoNET.
+    server = await asyncio.start_server(_handle_client, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        assert not await async_probe_host("127.0.0.1", port, timeout=0.2)
+
+    # Test with the closed port.
+    assert not await async_probe_host("127.0.0.1", port, connect_timeout=0.2)
+
+    async def _close_client(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Close the client right away."""
+        writer.close()
+        await writer.wait_closed()
+
+    # Test with the service that accepts and then closes the connection.
+    server = await asyncio.start_server(_close_client, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        assert not await async_probe_host("127.0.0.1", port, timeout=1)
+        assert await async_scan_hosts(["127.0.0.1"], port, timeout=1) == []
+
+
+async def test_async_scan_hosts() -> None:
+    """Test scanning the hosts concurrently."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _probe_host(host: str, *args: Any) -> bool:
+        """Pretend to probe the host."""
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if host == "192.168.1.20":
+            raise OSError("Connection reset by peer")
+
+        return host in ("192.168.1.10", "192.168.1.200")
+
+    network = IPv4Network("192.168.1.0/24")
+    with patch(
+        "custom_components.plum_ecomax.connection.async_probe_host",
+        side_effect=_probe_host,
+    ) as mock_probe_host:
+        hosts = await async_scan_hosts(
+            (str(host) for host in network.hosts()), concurrency=16
+        )
+
+    assert hosts == ["192.168.1.10", "192.168.1.200"]
+    assert mock_probe_host.await_count == 254
+    assert max_in_flight == 16
+
+
+async def test_async_scan_hosts_emulator(ecomax_emulator: EcomaxEmulator) -> None:
+    """Test scanning the emulator host."""
+    assert await async_scan_hosts(
+        [ecomax_emulator.host], port=ecomax_emulator.port
+    ) == [ecomax_emulator.host]
+
+
+async def test_async_get_scan_networks(hass: HomeAssistant) -> None:
+    """Test getting networks to scan."""
+    adapters = [
+        {"enabled": True, "ipv4": [{"address": "192.168.1.5", "network_prefix": 24}]},
+        {"enabled": True, "ipv4": [{"address": "10.0.42.5", "network_prefix": 8}]},
+        {"enabled": True, "ipv4": [{"address": "127.0.0.1", "network_prefix": 8}]},
+        {"enabled": False, "ipv4": [{"address": "172.16.0.5", "network_prefix": 24}]},
+    ]
+    with patch(
+        "homeassistant.components.network.async_get_adapters", return_value=adapters
+    ):
+        networks = await async_get_scan_networks(hass)
+
+    assert networks == [IPv4Network("10.0.42.0/24"), IPv4Network("192.168.1.0/24")]
@@ -0,0 +1,75 @@
+"""Test Plum ecoMAX custom entities."""
+
+from homeassistant.const import CONF_NAME, CONF_UNIT_OF_MEASUREMENT, Platform
+import pytest
+
+from custom_components.plum_ecomax.const import (
+    ATTR_ENTITIES,
+    CONF_KEY,
+    CONF_SOURCE_DEVICE,
+    CONF_STEP,
+    CONF_UPDATE_INTERVAL,
+    DeviceType,
+)
+from custom_components.plum_ecomax.custom_entities import CustomEntities
+
+
+def test_custom_entities() -> None:
+    """Test compiling custom entities from the config entry options."""
+    custom_entities = CustomEntities.from_options(
+        {
+            ATTR_ENTITIES: {
+                Platform.SENSOR: {
+                    "custom_sensor": {
+                        CONF_NAME: "Custom sensor",
+                        CONF_KEY: "custom_sensor",
+                        CONF_SOURCE_DEVICE: "ecomax",
+                        CONF_UNIT_OF_MEASUREMENT: "°C",
+                        CONF_UPDATE_INTERVAL: 10,
+                    },
+                    "mixer_sensor": {
+                        CONF_NAME: "Custom mixer sensor",
+                        CONF_KEY: "mixer_sensor",
+                        CONF_SOURCE_DEVICE: "mixer_1",
+                    },
+                },
+                Platform.NUMBER: {
+                    "1792": {
+                        CONF_NAME: "Custom number",
+                        CONF_KEY: "1792",
+                        CONF_SOURCE_DEVICE: "regdata",
+                        CONF_STEP: 0.5,
+                    }
+                },
+            }
+        }
+    )
+    assert len(custom_entities) == 3
+    assert not custom_entities.get(Platform.SWITCH, DeviceType.ECOMAX)
+    assert not custom_entities.get(Platform.SENSOR, DeviceType.THERMOSTAT)
+
+    ecomax_sensors = custom_entities.get(Platform.SENSOR, DeviceType.ECOMAX)
+    assert list(ecomax_sensors) == [0]
+    (data,) = ecomax_sensors[0]
+    assert data[CONF_KEY] == "custom_sensor"
+    assert data["native_unit_of_measurement"] == "°C"
+    assert callable(data["filter_fn"])
+    assert CONF_SOURCE_DEVICE not in data
+
+    mixer_sensors = custom_entities.get(Platform.SENSOR, DeviceType.MIXER)
+    assert list(mixer_sensors) == [1]
+    assert mixer_sensors[1][0][CONF_KEY] == "mixer_sensor"
+
+    (data,) = custom_entities.get(Platform.NUMBER, "regdata")[0]
+    assert data["native_step"] == 0.5
+
+    # Test that compiled entities are immutable.
+    with pytest.raises(TypeError):
+        data[CONF_KEY] = "1793"  # type: ignore[index]
+
+
+def test_custom_entities_empty() -> None:
+    """Test compiling custom entities without options."""
+    custom_entities = CustomEntities.from_options({})
+    assert len(custom_entities) == 0
+    assert not custom_entities.get(Platform.SENSOR, DeviceType.ECOMAX)
@@ -0,0 +1,223 @@
+"""Test Plum ecoMAX burner cycle and equipment runtime analytics."""
+
+from typing import Any
+
+from freezegun import freeze_time
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pyplumio.const import DeviceState
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.plum_ecomax.cycles import (
+    BurnerCycles,
+    CyclePeriod,
+    RuntimeCounters,
+)
+
+STORAGE_KEY = "plum_ecomax.test.cycles"
+RUNTIMES_STORAGE_KEY = "plum_ecomax.test.runtimes"
+
+
+async def test_burner_cycles(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Test burner cycle tracker."""
+    cycles = BurnerCycles(hass, "test", save_delay=0)
+    await cycles.async_load()
+    updates: list[bool] = []
+    remove_listener = cycles.async_add_listener(lambda: updates.append(True))
+    with freeze_time("2012-12-12 12:00:00") as frozen_time:
+        for timestamp, state in (
+            ("12:00:00", DeviceState.OFF),
+            ("12:10:00", DeviceState.KINDLING),
+            ("12:15:00", DeviceState.WORKING),
+            ("13:15:00", DeviceState.SUPERVISION),
+            ("13:45:00", DeviceState.PAUSED),
+        ):
+            frozen_time.move_to(timestamp)
+            await cycles.async_handle_state(state)
+
+        frozen_time.move_to("14:00:00")
+        counters = cycles.statistics(CyclePeriod.DAILY)
+
+        # Test that state before the first change is not counted.
+        assert len(updates) == 4
+        assert counters.starts == 1
+        assert counters.runs == 1
+        assert counters.run_time == counters.mean_run_time == 5700
+        assert cycles.last_run_time == 5700
+        assert counters.states[DeviceState.OFF].count == 0
+        assert counters.states[DeviceState.KINDLING].count == 1
+        assert counters.duration(DeviceState.OFF) == 600
+        assert counters.duration(DeviceState.KINDLING) == 300
+        assert counters.duration(DeviceState.WORKING) == 3600
+        assert counters.duration(DeviceState.SUPERVISION) == 1800
+        assert counters.duration(DeviceState.PAUSED) == 900
+        assert counters.duration(DeviceState.ALERT) == 0
+
+        # Test that daily counters are reset after the local midnight.
+        frozen_time.move_to("2012-12-13 09:00:00")
+        counters = cycles.statistics(CyclePeriod.DAILY)
+        assert counters.starts == 0
+        assert counters.duration(DeviceState.PAUSED) == 3600
+        assert cycles.statistics(CyclePeriod.WEEKLY).starts == 1
+        assert cycles.statistics(CyclePeriod.LIFETIME).starts == 1
+
+        # Test unknown state.
+        await cycles.async_handle_state(99)
+        assert cycles.as_dict()["state"] == "other"
+
+    remove_listener()
+    await hass.async_block_till_done()
+    data = hass_storage[STORAGE_KEY]["data"]
+    assert data["last_run_time"] == 5700
+    assert data["periods"]["lifetime"]["states"]["working"] == {
+        "count": 1,
+        "duration": 3600,
+    }
+
+    # Test loading counters.
+    cycles2 = BurnerCycles(hass, "test")
+    await cycles2.async_load()
+    assert cycles2.last_run_time == 5700
+    assert cycles2.periods[CyclePeriod.LIFETIME].starts == 1
+    assert cycles2.as_dict()["state"] is None
+
+    # Test removing the storage.
+    await cycles2.async_remove()
+    assert STORAGE_KEY not in hass_storage
+
+
+async def test_burner_cycles_refresh(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test that time spent in the current state is refreshed."""
+    cycles = BurnerCycles(hass, "test")
+    updates: list[bool] = []
+    remove_listener = cycles.async_add_listener(lambda: updates.append(True))
+    with freeze_time("2012-12-12 12:00:00") as frozen_time:
+        await cycles.async_handle_state(DeviceState.WORKING)
+        frozen_time.move_to("12:01:00")
+        async_fire_time_changed(hass, dt_util.utcnow())
+        await hass.async_block_till_done()
+
+    assert len(updates) == 1
+    assert cycles.periods[CyclePeriod.LIFETIME].duration(DeviceState.WORKING) == 60
+
+    # Test that counters are written on stop.
+    remove_listener()
+    await cycles.async_stop()
+    data = hass_storage[STORAGE_KEY]["data"]
+    assert data["periods"]["lifetime"]["states"]["working"]["duration"] == 60
+
+
+async def test_burner_cycles_delayed_save(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test that periodic refresh doesn't postpone the delayed write."""
+    cycles = BurnerCycles(hass, "test")
+    with freeze_time("2012-12-12 12:00:00") as frozen_time:
+        remove_listener = cycles.async_add_listener(lambda: None)
+        await cycles.async_handle_state(DeviceState.OFF)
+        frozen_time.move_to("12:00:20")
+        await cycles.async_handle_state(DeviceState.WORKING)
+        frozen_time.move_to("12:01:00")
+        async_fire_time_changed(hass, dt_util.utcnow())
+        await hass.async_block_till_done()
+        assert STORAGE_KEY not in hass_storage
+
+        frozen_time.move_to("12:01:30")
+        async_fire_time_changed(hass, dt_util.utcnow())
+        await hass.async_block_till_done()
+
+    data = hass_storage[STORAGE_KEY]["data"]
+    assert data["periods"]["lifetime"]["starts"] == 1
+    assert data["periods"]["lifetime"]["states"]["working"]["duration"] == 40
+    remove_listener()
+
+
+async def test_burner_cycles_malformed(
+    hass: HomeAssistant, hass_storage: dict[str, Any], caplog
+) -> None:
+    """Test burner cycle tracker with malformed storage."""
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": STORAGE_KEY,
+        "data": {"periods": {"daily": {"starts": 1}}},
+    }
+    cycles = BurnerCycles(hass, "test")
+    await cycles.async_load()
+    assert f"Ignoring malformed counters in '{STORAGE_KEY}'" in caplog.text
+    assert cycles.periods[CyclePeriod.DAILY].starts == 0
+
+
+async def test_runtime_counters(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test equipment runtime counters."""
+    runtimes = RuntimeCounters(hass, "test", keys=("fan", "feeder"), save_delay=0)
+    updates: list[bool] = []
+    remove_listener = runtimes.async_add_listener(lambda: updates.append(True))
+    fan = runtimes.handler("fan")
+    with freeze_time("2012-12-12 12:00:00") as frozen_time:
+        # Test that state seen first is not counted as a start.
+        await fan(True)
+        frozen_time.move_to("12:30:00")
+        await fan(True)
+        await fan(False)
+        frozen_time.move_to("13:00:00")
+        await fan(True)
+        frozen_time.move_to("13:15:00")
+        assert runtimes.running
+        counter = runtimes.get("fan")
+        assert counter.starts == 1
+        assert counter.runtime == 2700
+        assert runtimes.get("feeder").starts == 0
+
+        # Test periodic refresh.
+        frozen_time.move_to("13:16:00")
+        async_fire_time_changed(hass, dt_util.utcnow())
+        await hass.async_block_till_done()
+        assert runtimes.counters["fan"].runtime == 2760
+
+    assert len(updates) == 3
+    remove_listener()
+    await hass.async_block_till_done()
+    assert hass_storage[RUNTIMES_STORAGE_KEY]["data"]["fan"] == {
+        "starts": 1,
+        "runtime": 2760,
+    }
+
+    # Test loading counters.
+    runtimes2 = RuntimeCounters(hass, "test")
+    await runtimes2.async_load()
+    assert runtimes2.counters["fan"].starts == 1
+    assert not runtimes2.running
+    await runtimes2.async_remove()
+    assert RUNTIMES_STORAGE_KEY not in hass_storage
+
+
+async def test_runtime_counters_delayed_save(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test that runtime of the running equipment is written."""
+    runtimes = RuntimeCounters(hass, "test", keys=("fan",))
+    fan = runtimes.handler("fan")
+    with freeze_time("2012-12-12 12:00:00") as frozen_time:
+        remove_listener = runtimes.async_add_listener(lambda: None)
+        await fan(False)
+        frozen_time.move_to("12:00:20")
+        await fan(True)
+        frozen_time.move_to("12:01:00")
+        async_fire_time_changed(hass, dt_util.utcnow())
+        await hass.async_block_till_done()
+        assert RUNTIMES_STORAGE_KEY not in hass_storage
+
+        frozen_time.move_to("12:01:30")
+        async_fire_time_changed(hass, dt_util.utcnow())
+        await hass.async_block_till_done()
+
+    assert hass_storage[RUNTIMES_STORAGE_KEY]["data"]["fan"] == {
+        "starts": 1,
+        "runtime": 40,
+    }
+    remove_listener()
@@ -28,6 +28,10 @@ from custom_components.plum_ecomax.const import (
     CONNECTION_TYPE_TCP,
 )
 from custom_components.plum_ecomax.diagnostics import async_get_config_entry_diagnostics
+from custom_components.plum_ecomax.economy import EconomyStatistics
+from custom_components.plum_ecomax.scheduler import FrameScheduler
+from custom_components.plum_ecomax.subscriptions import SubscriptionManager
+from custom_components.plum_ecomax.writes import WriteTracker
 
 
 @pytest.mark.usefixtures("ecomax_860p3_o", "mixers", "connection")
@@ -40,9 +44,37 @@ async def test_diagnostics(
     """Test config entry diagnostics."""
     mock_connection = AsyncMock(spec=EcomaxConnection)
     mock_connection.device = ecomax_p
+    mock_connection.economy_statistics = EconomyStatistics(
+        received_updates=10, suppressed_updates=4
+    )
+    mock_connection.scheduler = FrameScheduler()
+    mock_connection.subscriptions = SubscriptionManager()
+    mock_connection.writes = WriteTracker()
     config_entry.runtime_data = PlumEcomaxData(mock_connection)
     result = await async_get_config_entry_diagnostics(hass, config_entry)
     assert result["pyplumio"]["version"] == __version__
+    assert result["economy"] == {
+        "received_updates": 10,
+        "suppressed_updates": 4,
+        "savings": 40.0,
+        "suppressed_by_key": {},
+        "suppressed_writes": 0,
+    }
+    assert result["scheduler"]["background"] == {
+        "sent": 0,
+        "cancelled": 0,
+        "max_wait": 0.0,
+        "pending": 0,
+    }
+    assert result["subscriptions"] == 0
+    assert result["slow_callbacks"] == []
+    assert result["writes"] == {
+        "confirmed_writes": 0,
+        "failed_writes": 0,
+        "mean_latency": None,
+        "max_latency": 0.0,
+        "last_latency": None,
+    }
     assert result["entry"] == {
         "title": config_entry.title,
         "data": {
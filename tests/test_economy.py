@@ -0,0 +1,107 @@
+"""Test Plum ecoMAX economy profile."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+from freezegun import freeze_time
+import pytest
+
+from custom_components.plum_ecomax.const import (
+    ATTR_ECONOMY,
+    CONF_ENABLED,
+    CONF_TOLERANCE,
+    CONF_UPDATE_INTERVAL,
+)
+from custom_components.plum_ecomax.economy import (
+    EconomyProfile,
+    EconomyStatistics,
+    economy,
+)
+
+
+@pytest.fixture(name="frozen_time")
+def fixture_frozen_time():
+    """Get frozen time."""
+    with freeze_time("2012-12-12 12:00:00") as frozen_time:
+        yield frozen_time
+
+
+def test_economy_profile_from_options() -> None:
+    """Test creating economy profile from the config entry options."""
+    assert EconomyProfile.from_options({}) is None
+    assert EconomyProfile.from_options({ATTR_ECONOMY: {CONF_ENABLED: False}}) is None
+    assert EconomyProfile.from_options(
+        {
+            ATTR_ECONOMY: {
+                CONF_ENABLED: True,
+                CONF_TOLERANCE: 1,
+                CONF_UPDATE_INTERVAL: 30,
+            }
+        }
+    ) == EconomyProfile(tolerance=1.0, update_interval=30.0)
+
+
+async def test_economy_numeric(frozen_time) -> None:
+    """Test economy filter with numeric values."""
+    test_callback = AsyncMock()
+    statistics = EconomyStatistics()
+    wrapped_callback = economy(
+        test_callback,
+        key="sensor.heating_temperature",
+        profile=EconomyProfile(tolerance=0.5, update_interval=10),
+        statistics=statistics,
+    )
+    await wrapped_callback(60.0)
+    test_callback.assert_awaited_once_with(60.0)
+    test_callback.reset_mock()
+
+    # Test that value is throttled.
+    frozen_time.tick(timedelta(seconds=5))
+    await wrapped_callback(65.0)
+    test_callback.assert_not_awaited()
+
+    # Test that value is inside the deadband.
+    frozen_time.tick(timedelta(seconds=10))
+    await wrapped_callback(60.3)
+    test_callback.assert_not_awaited()
+
+    frozen_time.tick(timedelta(seconds=1))
+    await wrapped_callback(61.0)
+    test_callback.assert_awaited_once_with(61.0)
+
+    assert statistics.received_updates == 4
+    assert statistics.suppressed_updates == 2
+    assert statistics.savings == 50.0
+    assert statistics.as_dict()["suppressed_by_key"] == {
+        "sensor.heating_temperature": 2
+    }
+
+
+async def test_economy_non_numeric(frozen_time) -> None:
+    """Test economy filter with non-numeric values."""
+    test_callback = AsyncMock()
+    statistics = EconomyStatistics()
+    wrapped_callback = economy(
+        test_callback,
+        key="binary_sensor.fan",
+        profile=EconomyProfile(tolerance=0.5, update_interval=10),
+        statistics=statistics,
+    )
+    await wrapped_callback(True)
+    test_callback.assert_awaited_once_with(True)
+    test_callback.reset_mock()
+
+    # Test that changed value is passed within the update interval.
+    frozen_time.tick(timedelta(seconds=1))
+    await wrapped_callback(False)
+    test_callback.assert_awaited_once_with(False)
+    test_callback.reset_mock()
+
+    # Test that unchanged value is suppressed.
+    frozen_time.tick(timedelta(seconds=10))
+    await wrapped_callback(False)
+    test_callback.assert_not_awaited()
+
+    await wrapped_callback(True)
+    test_callback.assert_awaited_once_with(True)
+    assert statistics.suppressed_by_key["binary_sensor.fan"] == 1
@@ -0,0 +1,108 @@
+"""Test the local ecoMAX emulator."""
+
+import asyncio
+from typing import Any
+
+import pyplumio
+from pyplumio.const import DeviceState, FrameType
+from pyplumio.data_types import BitArray, Float, UnsignedShort
+import pytest
+
+from tests.emulator import EcomaxEmulator, EmulatorConfig, pack_regdata
+
+SETUP_TIMEOUT = 30
+
+
+@pytest.fixture(autouse=True)
+def bypass_pyplumio_events():
+    """Use the pyplumio event system."""
+    yield
+
+
+async def test_emulator(ecomax_emulator: EcomaxEmulator) -> None:
+    """Test setting up the device through the emulator."""
+    connection = pyplumio.TcpConnection(ecomax_emulator.host, ecomax_emulator.port)
+    await connection.connect()
+    try:
+        async with connection.device("ecomax", timeout=SETUP_TIMEOUT) as device:
+            await device.wait_for("setup", timeout=SETUP_TIMEOUT)
+            assert device.data["product"].model == "ecoMAX 350P2-ZF"
+            assert device.data["mixers_connected"] == 1
+            assert device.data["thermostats_connected"] == 1
+            assert len(await device.get("regdata", timeout=SETUP_TIMEOUT)) == 32
+            assert "frame_errors" not in device.data
+
+            # Test changing the parameter.
+            assert await device.set("heating_target_temp", 70)
+            assert device.data["heating_target_temp"].value == 70
+
+            # Test turning the controller off.
+            assert await device.turn_off()
+            async with asyncio.timeout(SETUP_TIMEOUT):
+                while device.data["state"] != DeviceState.OFF:
+                    await asyncio.sleep(0.1)
+    finally:
+        await connection.close()
+
+    assert ecomax_emulator.statistics.requests[FrameType.REQUEST_UID] == 1
+    assert ecomax_emulator.statistics.frames_dropped == 0
+
+
+@pytest.mark.parametrize(
+    "emulator_config",
+    [
+        EmulatorConfig(
+            port=0,
+            mixers=0,
+            thermostats=0,
+            frame_rate=20,
+            packet_loss=0.2,
+            latency=0.01,
+            seed=1,
+        )
+    ],
+)
+async def test_emulator_packet_loss(ecomax_emulator: EcomaxEmulator) -> None:
+    """Test that device is set up regardless of the packet loss."""
+    connection = pyplumio.TcpConnection(ecomax_emulator.host, ecomax_emulator.port)
+    await connection.connect()
+    try:
+        async with connection.device("ecomax", timeout=SETUP_TIMEOUT) as device:
+            await device.wait_for("setup", timeout=SETUP_TIMEOUT)
+            assert device.data["mixers_connected"] == 0
+            assert "thermostats_connected" not in device.data
+    finally:
+        await connection.close()
+
+    assert ecomax_emulator.statistics.frames_dropped > 0
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"mixers": 11},
+        {"thermostats": -1},
+        {"regdata_size": 1000},
+        {"frame_rate": 0},
+        {"packet_loss": 1},
+        {"latency": -1},
+    ],
+)
+def test_emulator_config_validation(kwargs: dict[str, Any]) -> None:
+    """Test emulator config validation."""
+    with pytest.raises(ValueError):
+        EmulatorConfig(**kwargs)
+
+
+def test_pack_regdata() -> None:
+    """Test packing the regulator data."""
+    assert pack_regdata(
+        [
+            (UnsignedShort, 1),
+            (BitArray, 1),
+            (BitArray, 0),
+            (BitArray, 1),
+            (Float, 0),
+            *((BitArray, 1) for _ in range(9)),
+        ]
+    ) == bytes.fromhex("0100 05 00000000 ff 01")
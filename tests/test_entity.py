@@ -1,9 +1,10 @@
 """Test Plum ecoMAX base entity."""
 
 import asyncio
-from unittest.mock import AsyncMock, Mock, call, patch
+from unittest.mock import ANY, AsyncMock, Mock, patch
 
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo, Entity
 from pyplumio.devices.ecomax import EcoMAX
 from pyplumio.filters import Filter
 import pytest
@@ -11,19 +12,25 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.plum_ecomax.connection import EcomaxConnection
 from custom_components.plum_ecomax.const import DOMAIN, ModuleType
+from custom_components.plum_ecomax.economy import EconomyStatistics
 from custom_components.plum_ecomax.entity import (
     MANUFACTURER,
     EcomaxEntity,
     EcomaxEntityDescription,
 )
+from custom_components.plum_ecomax.subscriptions import SubscriptionManager
 
 
-async def test_base_entity(ecomax_p: EcoMAX, config_entry: MockConfigEntry) -> None:
+async def test_base_entity(
+    hass: HomeAssistant, ecomax_p: EcoMAX, config_entry: MockConfigEntry
+) -> None:
     """Test base entity."""
     mock_connection = Mock(spec=EcomaxConnection)
     mock_connection.device = ecomax_p
     mock_connection.entry = config_entry
     mock_connection.software = {ModuleType.A: "6.10.32.K1"}
+    mock_connection.economy_filter.side_effect = lambda callback, **kwargs: callback
+    mock_connection.subscriptions = SubscriptionManager()
     mock_filter = AsyncMock(spec=Filter)
     entity = EcomaxEntity(
         connection=mock_connection,
@@ -35,6 +42,8 @@ async def test_base_entity(ecomax_p: EcoMAX, config_entry: MockConfigEntry) -> N
         ),
     )
 
+    entity.hass = hass
+
     # Test adding entity to hass.
     with patch.object(
         mock_connection.device, "subscribe", create=True
@@ -42,16 +51,21 @@ async def test_base_entity(ecomax_p: EcoMAX, config_entry: MockConfigEntry) -> N
         await entity.async_added_to_hass()
 
     mock_filter.assert_called_once()
-    mock_subscribe.assert_has_calls([call("heating_temp", mock_filter)])
+    mock_subscribe.assert_called_once_with("heating_temp", ANY)
+    assert mock_connection.subscriptions.count(entity) == 1
+
+    # Test that subscribed callback calls the filter.
+    mock_filter.reset_mock()
+    handler = mock_subscribe.call_args.args[1]
+    await handler(65)
+    mock_filter.assert_awaited_once_with(65)
 
     # Test removing entity from the hass.
-    with (
-        patch.object(EcomaxEntity, "async_update") as mock_async_update,
-        patch.object(mock_connection.device, "unsubscribe") as mock_unsubscribe,
-    ):
+    with patch.object(mock_connection.device, "unsubscribe") as mock_unsubscribe:
         await entity.async_will_remove_from_hass()
 
-    mock_unsubscribe.assert_called_once_with("heating_temp", mock_async_update)
+    mock_unsubscribe.assert_called_once_with("heating_temp", handler)
+    assert len(mock_connection.subscriptions) == 0
 
     # Test device property.
     assert entity.device == mock_connection.device
@@ -110,7 +124,45 @@ async def test_base_entity(ecomax_p: EcoMAX, config_entry: MockConfigEntry) -> N
             filter_fn=Mock(return_value=mock_filter),
         ),
     )
+    entity2.hass = hass
     with patch.object(mock_connection.device, "subscribe_once") as mock_subscribe_once:
         await entity2.async_added_to_hass()
 
     mock_subscribe_once.assert_called_once()
+
+
+async def test_write_ha_state_if_changed(
+    hass: HomeAssistant, ecomax_p: EcoMAX, config_entry: MockConfigEntry
+) -> None:
+    """Test that identical state writes are suppressed."""
+    mock_connection = Mock(spec=EcomaxConnection)
+    mock_connection.device = ecomax_p
+    mock_connection.economy_statistics = EconomyStatistics()
+    entity = EcomaxEntity(
+        connection=mock_connection,
+        description=EcomaxEntityDescription(
+            key="heating_temp", name="Heating temperature", always_available=True
+        ),
+    )
+    entity.hass = hass
+    entity._attr_extra_state_attributes = {"value": 65}
+
+    with patch.object(Entity, "async_write_ha_state") as mock_write_ha_state:
+        entity.async_write_ha_state_if_changed()
+        entity.async_write_ha_state_if_changed()
+        mock_write_ha_state.assert_called_once()
+        assert mock_connection.economy_statistics.suppressed_writes == 1
+
+        # Test that changed attributes are written.
+        mock_write_ha_state.reset_mock()
+        entity._attr_extra_state_attributes = {"value": 70}
+        entity.async_write_ha_state_if_changed()
+        mock_write_ha_state.assert_called_once()
+
+        # Test that unconditional write resets the fingerprint.
+        mock_write_ha_state.reset_mock()
+        entity.async_write_ha_state()
+        entity.async_write_ha_state_if_changed()
+        assert mock_write_ha_state.call_count == 2
+
+    assert mock_connection.economy_statistics.suppressed_writes == 1
@@ -0,0 +1,49 @@
+"""Test Plum ecoMAX fuel depletion forecast."""
+
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.plum_ecomax.forecast import FuelForecaster
+
+
+def test_fuel_forecaster() -> None:
+    """Test fuel depletion estimator."""
+    forecaster = FuelForecaster(time_constant=12)
+    assert forecaster.forecast() is None
+
+    # Test steady consumption of 2% per hour.
+    for minutes in range(0, 24 * 60, 10):
+        forecaster.append(minutes * 60, 80 - minutes / 30)
+
+    forecast = forecaster.forecast()
+    assert forecast
+    assert forecast.rate == pytest.approx(-2)
+    assert forecast.level == pytest.approx(32.33, abs=0.01)
+    assert forecast.hours_left == pytest.approx(16.17, abs=0.01)
+    assert forecast.confidence == pytest.approx(1)
+
+    # Test that fit is reset when the hopper is refilled.
+    forecaster.append(24 * 3600, 95)
+    assert len(forecaster) == 1
+    assert forecaster.forecast() is None
+
+    # Test forecast without consumption.
+    for hours in range(1, 4):
+        forecaster.append(24 * 3600 + hours * 3600, 95)
+
+    forecast = forecaster.forecast()
+    assert forecast
+    assert forecast.hours_left is None
+    assert forecast.confidence == pytest.approx(0.25)
+
+
+async def test_fuel_forecaster_handler() -> None:
+    """Test fuel depletion estimator event callback."""
+    forecaster = FuelForecaster()
+    handler = forecaster.handler()
+    for timestamp, value in ((0, 50), (3600, None), (3600, True), (7200, 49)):
+        with patch("time.monotonic", return_value=timestamp):
+            await handler(value)
+
+    assert len(forecaster) == 1
@@ -16,7 +16,8 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.util import dt as dt_util
-from pyplumio.const import AlertType
+from pyplumio.const import AlertType, ProductType
+from pyplumio.devices.ecomax import EcoMAX
 from pyplumio.structures.alerts import ATTR_ALERTS, Alert
 from pyplumio.structures.network_info import NetworkInfo
 import pytest
@@ -29,13 +30,15 @@ from custom_components.plum_ecomax import (
     async_setup_events,
     async_unload_entry,
 )
-from custom_components.plum_ecomax.connection import EcomaxConnection
+from custom_components.plum_ecomax.connection import DEFAULT_TIMEOUT, EcomaxConnection
 from custom_components.plum_ecomax.const import (
     ATTR_FROM,
     ATTR_TO,
     CONF_CAPABILITIES,
     CONF_HOST,
+    CONF_MIGRATED,
     CONF_PRODUCT_ID,
+    CONF_PRODUCT_TYPE,
     CONF_SOFTWARE,
     CONF_SUB_DEVICES,
     CONNECTION_TYPE_SERIAL,
@@ -317,6 +320,50 @@ async def test_migrate_entry_v7_to_v8(
     assert "Migration to version 8 successful" in caplog.text
 
 
+async def test_migrate_entry_resume(
+    hass: HomeAssistant, config_entry: ConfigEntry, ecomax_p: EcoMAX, caplog
+) -> None:
+    """Test resuming the failed entry migration."""
+    data = dict(config_entry.data)
+    for key in (CONF_PRODUCT_ID, CONF_PRODUCT_TYPE, CONF_SOFTWARE, CONF_SUB_DEVICES):
+        del data[key]
+
+    hass.config_entries.async_update_entry(config_entry, data=data, version=1)
+    get = ecomax_p.get
+
+    async def _get_without_modules(name: str, *args, **kwargs):
+        """Time out waiting for the connected modules."""
+        if name == "modules":
+            raise TimeoutError
+
+        return await get(name, *args, **kwargs)
+
+    # Fail with connected modules timeout.
+    with patch.object(ecomax_p, "get", side_effect=_get_without_modules) as mock_get:
+        assert not await async_migrate_entry(hass, config_entry)
+
+    assert [x.args[0] for x in mock_get.await_args_list].count("product") == 1
+    assert config_entry.version == 1
+    assert config_entry.data[CONF_PRODUCT_TYPE] == ProductType.ECOMAX_P
+    assert config_entry.data[CONF_PRODUCT_ID] == 4
+    assert CONF_SUB_DEVICES in config_entry.data
+    assert CONF_SOFTWARE not in config_entry.data
+    assert sorted(config_entry.data[CONF_MIGRATED]) == sorted(
+        (CONF_PRODUCT_ID, CONF_PRODUCT_TYPE, CONF_SUB_DEVICES)
+    )
+    assert "Fetched 3 of 4 values" in caplog.text
+
+    # Retry and fetch only the missing connected modules.
+    with patch.object(ecomax_p, "get", wraps=get) as mock_get:
+        assert await async_migrate_entry(hass, config_entry)
+
+    mock_get.assert_awaited_once_with("modules", timeout=DEFAULT_TIMEOUT)
+    assert config_entry.version == 8
+    assert CONF_MIGRATED not in config_entry.data
+    assert CONF_SOFTWARE in config_entry.data
+    assert "Migration to version 8 successful" in caplog.text
+
+
 async def test_migrate_entry_with_timeout(
     hass: HomeAssistant, config_entry: ConfigEntry, caplog
 ) -> None:
@@ -0,0 +1,213 @@
+"""Test Plum ecoMAX memory footprint on large installations."""
+
+from dataclasses import dataclass
+import gc
+import os
+import tracemalloc
+from typing import Any, Final
+from unittest.mock import patch
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.plum_ecomax.const import (
+    ATTR_ENTITIES,
+    ATTR_MIXERS,
+    ATTR_REGDATA,
+    ATTR_THERMOSTATS,
+    CONF_CONNECTION_TYPE,
+    CONF_HOST,
+    CONF_MODEL,
+    CONF_PORT,
+    CONF_PRODUCT_ID,
+    CONF_SUB_DEVICES,
+    CONF_UID,
+    CONNECTION_TYPE_TCP,
+    DOMAIN,
+)
+from tests.conftest import TITLE
+from tests.emulator import (
+    PRODUCT_ID,
+    PRODUCT_MODEL,
+    REGDATA_FIRST_ID,
+    EcomaxEmulator,
+    EmulatorConfig,
+)
+
+# Budgets can be overridden through the environment to tighten them
+# on the reference machine.
+BYTES_PER_ENTITY_BUDGET: Final = int(
+    os.environ.get("PLUM_ECOMAX_BYTES_PER_ENTITY_BUDGET", "49152")
+)
+BYTES_PER_SUB_DEVICE_BUDGET: Final = int(
+    os.environ.get("PLUM_ECOMAX_BYTES_PER_SUB_DEVICE_BUDGET", "1048576")
+)
+
+REGDATA_ENTITIES: Final = 60
+
+# Number of mixers and thermostats, in increasing order.
+INSTALLATION_SIZES: Final = ((0, 0), (2, 1), (5, 3))
+
+
+@dataclass(frozen=True, slots=True)
+class Footprint:
+    """Represents memory footprint of the set up config entry."""
+
+    size: int
+    entities: int
+    sub_devices: int
+
+    @property
+    def bytes_per_entity(self) -> float:
+        """Return number of bytes per entity."""
+        return self.size / self.entities
+
+
+@pytest.fixture(autouse=True)
+def bypass_pyplumio_events():
+    """Use the pyplumio event system."""
+    yield
+
+
+@pytest.fixture(autouse=True)
+def bypass_async_migrate_entry():
+    """Bypass async migrate entry."""
+    with patch("custom_components.plum_ecomax.async_migrate_entry", return_value=True):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def bypass_async_resolve_host_name():
+    """Bypass host name resolution for the network info."""
+    with patch(
+        "custom_components.plum_ecomax.async_resolve_host_name",
+        return_value="127.0.0.1",
+    ):
+        yield
+
+
+def _regdata_entities(count: int) -> dict[str, dict[str, Any]]:
+    """Return custom regulator data sensors."""
+    return {
+        str(key): {
+            "name": f"Regdata {key}",
+            "key": str(key),
+            "source_device": ATTR_REGDATA,
+        }
+        for key in range(REGDATA_FIRST_ID, REGDATA_FIRST_ID + count)
+    }
+
+
+async def _async_measure_footprint(
+    hass: HomeAssistant,
+    config_data: dict[str, Any],
+    uid: str,
+    mixers: int,
+    thermostats: int,
+) -> Footprint:
+    """Set up the config entry against the emulator and measure it."""
+    emulator_config = EmulatorConfig(
+        port=0,
+        mixers=mixers,
+        thermostats=thermostats,
+        regdata_size=REGDATA_ENTITIES,
+        frame_rate=20,
+    )
+    async with EcomaxEmulator(emulator_config) as emulator:
+        sub_devices = [
+            name
+            for name, count in ((ATTR_MIXERS, mixers), (ATTR_THERMOSTATS, thermostats))
+            if count
+        ]
+        config_entry = MockConfigEntry(
+            domain=DOMAIN,
+            data=config_data
+            | {
+                CONF_CONNECTION_TYPE: CONNECTION_TYPE_TCP,
+                CONF_HOST: emulator.host,
+                CONF_PORT: emulator.port,
+                CONF_MODEL: PRODUCT_MODEL,
+                CONF_PRODUCT_ID: PRODUCT_ID,
+                CONF_SUB_DEVICES: sub_devices,
+                CONF_UID: uid,
+            },
+            options={
+                ATTR_ENTITIES: {Platform.SENSOR: _regdata_entities(REGDATA_ENTITIES)}
+            },
+            title=TITLE,
+            entry_id=uid,
+        )
+        config_entry.add_to_hass(hass)
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            assert await hass.config_entries.async_setup(config_entry.entry_id)
+            await hass.async_block_till_done()
+            gc.collect()
+            size, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        entity_registry = er.async_get(hass)
+        entities = [
+            entry
+            for entry in er.async_entries_for_config_entry(
+                entity_registry, config_entry.entry_id
+            )
+            if not entry.disabled
+        ]
+
+        await hass.config_entries.async_remove(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    return Footprint(size, len(entities), mixers + thermostats)
+
+
+@pytest.mark.usefixtures("socket_enabled")
+async def test_memory_footprint(
+    hass: HomeAssistant, config_data: dict[str, Any], record_property
+) -> None:
+    """Test memory footprint against installations of increasing size."""
+    # Import platforms and warm up the caches, so they're not accounted
+    # for the smallest installation.
+    await _async_measure_footprint(hass, config_data, "WARMUP", 0, 0)
+
+    footprints = [
+        await _async_measure_footprint(
+            hass, config_data, f"TEST{index}", mixers, thermostats
+        )
+        for index, (mixers, thermostats) in enumerate(INSTALLATION_SIZES)
+    ]
+
+    baseline = footprints[0]
+    for footprint in footprints:
+        assert footprint.entities >= REGDATA_ENTITIES
+        record_property(
+            f"bytes_per_entity_{footprint.sub_devices}",
+            round(footprint.bytes_per_entity),
+        )
+        assert footprint.bytes_per_entity <= BYTES_PER_ENTITY_BUDGET, (
+            f"{footprint.bytes_per_entity:.0f} bytes per entity with "
+            f"{footprint.sub_devices} sub-device(s) exceeds the budget of "
+            f"{BYTES_PER_ENTITY_BUDGET} bytes"
+        )
+        if not footprint.sub_devices:
+            continue
+
+        # Sub-device cost includes the device data and its entities.
+        bytes_per_sub_device = (footprint.size - baseline.size) / (
+            footprint.sub_devices - baseline.sub_devices
+        )
+        record_property(
+            f"bytes_per_sub_device_{footprint.sub_devices}",
+            round(bytes_per_sub_device),
+        )
+        assert bytes_per_sub_device <= BYTES_PER_SUB_DEVICE_BUDGET, (
+            f"{bytes_per_sub_device:.0f} bytes per sub-device with "
+            f"{footprint.sub_devices} sub-device(s) exceeds the budget of "
+            f"{BYTES_PER_SUB_DEVICE_BUDGET} bytes"
+        )
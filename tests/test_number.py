@@ -25,10 +25,12 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 from homeassistant.core import HomeAssistant, State
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
 from pyplumio.parameters import ParameterValues
 from pyplumio.parameters.ecomax import EcomaxNumber, EcomaxNumberDescription
 import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.plum_ecomax.connection import EcomaxConnection
 from custom_components.plum_ecomax.const import ATTR_ENTITIES
@@ -112,14 +114,91 @@ async def test_target_heating_temperature_number(
     assert state.attributes[ATTR_MAX] == 80
 
     # Set new state.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_set_value(hass, target_heating_temperature_entity_id, 70)
 
-    mock_set_nowait.assert_called_once_with(target_heating_temperature_key, 70)
+    mock_set.assert_awaited_once_with(target_heating_temperature_key, 70)
     assert isinstance(state, State)
     assert state.state == "70.0"
 
 
+@pytest.mark.usefixtures("ecomax_p")
+async def test_number_write_not_confirmed(
+    hass: HomeAssistant,
+    connection: EcomaxConnection,
+    config_entry: MockConfigEntry,
+    setup_config_entry,
+    async_set_value,
+) -> None:
+    """Test that number state is rolled back if write is not confirmed."""
+    await setup_config_entry()
+    target_heating_temperature_entity_id = "number.ecomax_target_heating_temperature"
+    target_heating_temperature_key = "heating_target_temp"
+    await dispatch_value(
+        connection.device,
+        target_heating_temperature_key,
+        EcomaxNumber(
+            device=connection.device,
+            values=ParameterValues(value=65, min_value=30, max_value=80),
+            description=EcomaxNumberDescription(target_heating_temperature_key),
+        ),
+    )
+
+    with (
+        patch("pyplumio.devices.Device.set", return_value=False) as mock_set,
+        pytest.raises(HomeAssistantError) as exc_info,
+    ):
+        await async_set_value(hass, target_heating_temperature_entity_id, 70)
+
+    mock_set.assert_awaited_once_with(target_heating_temperature_key, 70)
+    assert exc_info.value.translation_key == "write_not_confirmed"
+    state = hass.states.get(target_heating_temperature_entity_id)
+    assert isinstance(state, State)
+    assert state.state == "65.0"
+    writes = config_entry.runtime_data.connection.writes
+    assert writes.statistics.failed_writes == 1
+
+
+@pytest.mark.usefixtures("ecomax_p")
+async def test_number_write_failed(
+    hass: HomeAssistant,
+    connection: EcomaxConnection,
+    config_entry: MockConfigEntry,
+    setup_config_entry,
+    async_set_value,
+) -> None:
+    """Test that number state is rolled back if write fails."""
+    await setup_config_entry()
+    target_heating_temperature_entity_id = "number.ecomax_target_heating_temperature"
+    target_heating_temperature_key = "heating_target_temp"
+    await dispatch_value(
+        connection.device,
+        target_heating_temperature_key,
+        EcomaxNumber(
+            device=connection.device,
+            values=ParameterValues(value=65, min_value=30, max_value=80),
+            description=EcomaxNumberDescription(target_heating_temperature_key),
+        ),
+    )
+
+    with (
+        patch(
+            "pyplumio.devices.Device.set", side_effect=ValueError("Invalid value")
+        ) as mock_set,
+        pytest.raises(HomeAssistantError) as exc_info,
+    ):
+        await async_set_value(hass, target_heating_temperature_entity_id, 70)
+
+    mock_set.assert_awaited_once_with(target_heating_temperature_key, 70)
+    assert exc_info.value.translation_key == "write_failed"
+    assert isinstance(exc_info.value.__cause__, ValueError)
+    state = hass.states.get(target_heating_temperature_entity_id)
+    assert isinstance(state, State)
+    assert state.state == "65.0"
+    writes = config_entry.runtime_data.connection.writes
+    assert writes.statistics.failed_writes == 1
+
+
 @pytest.mark.usefixtures("ecomax_p")
 async def test_minimum_heating_temperature_number(
     hass: HomeAssistant,
@@ -167,10 +246,10 @@ async def test_minimum_heating_temperature_number(
     assert state.attributes[ATTR_MAX] == 40
 
     # Set new state.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_set_value(hass, minimum_heating_temperature_entity_id, 40)
 
-    mock_set_nowait.assert_called_once_with(minimum_heating_temperature_key, 40)
+    mock_set.assert_awaited_once_with(minimum_heating_temperature_key, 40)
     assert isinstance(state, State)
     assert state.state == "40.0"
 
@@ -222,10 +301,10 @@ async def test_maximum_heating_temperature_number(
     assert state.attributes[ATTR_MAX] == 90
 
     # Set new state.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_set_value(hass, maximum_heating_temperature_entity_id, 70)
 
-    mock_set_nowait.assert_called_once_with(maximum_heating_temperature_key, 70)
+    mock_set.assert_awaited_once_with(maximum_heating_temperature_key, 70)
     assert isinstance(state, State)
     assert state.state == "70.0"
 
@@ -277,10 +356,10 @@ async def test_grate_mode_temperature_number(
     assert state.attributes[ATTR_MAX] == 80
 
     # Set new state.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_set_value(hass, grate_mode_temperature_entity_id, 70)
 
-    mock_set_nowait.assert_called_once_with(grate_mode_temperature_key, 70)
+    mock_set.assert_awaited_once_with(grate_mode_temperature_key, 70)
     assert isinstance(state, State)
     assert state.state == "70.0"
 
@@ -331,10 +410,10 @@ async def test_fuzzy_logic_minimum_power_number(
     assert state.attributes[ATTR_MAX] == 50
 
     # Set new state.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_set_value(hass, fuzzy_logic_minimum_power_entity_id, 10)
 
-    mock_set_nowait.assert_called_once_with(fuzzy_logic_minimum_power_key, 10)
+    mock_set.assert_awaited_once_with(fuzzy_logic_minimum_power_key, 10)
     assert isinstance(state, State)
     assert state.state == "10.0"
 
@@ -385,10 +464,10 @@ async def test_fuzzy_logic_maximum_power_number(
     assert state.attributes[ATTR_MAX] == 100
 
     # Set new state.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_set_value(hass, fuzzy_logic_maximum_power_entity_id, 45)
 
-    mock_set_nowait.assert_called_once_with(fuzzy_logic_maximum_power_key, 45)
+    mock_set.assert_awaited_once_with(fuzzy_logic_maximum_power_key, 45)
     assert isinstance(state, State)
     assert state.state == "45.0"
 
@@ -439,10 +518,10 @@ async def test_fuel_calorific_value_number(
     assert isclose(state.attributes[ATTR_MAX], 5.0, rel_tol=FLOAT_TOLERANCE)
 
     # Set new state.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_set_value(hass, fuel_calorific_value_entity_id, 4.8)
 
-    mock_set_nowait.assert_called_once_with(fuel_calorific_value_key, 4.8)
+    mock_set.assert_awaited_once_with(fuel_calorific_value_key, 4.8)
     assert isinstance(state, State)
     assert state.state == "4.8"
 
@@ -498,10 +577,10 @@ async def test_mixer_target_mixer_temperature_number(
     assert state.attributes[ATTR_MAX] == 80
 
     # Set new state.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_set_value(hass, target_mixer_temperature_entity_id, 70)
 
-    mock_set_nowait.assert_called_once_with(target_mixer_temperature_key, 70)
+    mock_set.assert_awaited_once_with(target_mixer_temperature_key, 70)
     assert isinstance(state, State)
     assert state.state == "70.0"
 
@@ -557,10 +636,10 @@ async def test_mixer_minimum_mixer_temperature_number(
     assert state.attributes[ATTR_MAX] == 40
 
     # Set new state.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_set_value(hass, minimum_mixer_temperature_entity_id, 40)
 
-    mock_set_nowait.assert_called_once_with(minimum_mixer_temperature_key, 40)
+    mock_set.assert_awaited_once_with(minimum_mixer_temperature_key, 40)
     assert isinstance(state, State)
     assert state.state == "40.0"
 
@@ -616,10 +695,10 @@ async def test_mixer_maximum_mixer_temperature_number(
     assert state.attributes[ATTR_MAX] == 90
 
     # Set new state.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_set_value(hass, maximum_mixer_temperature_entity_id, 70)
 
-    mock_set_nowait.assert_called_once_with(maximum_mixer_temperature_key, 70)
+    mock_set.assert_awaited_once_with(maximum_mixer_temperature_key, 70)
     assert isinstance(state, State)
     assert state.state == "70.0"
 
@@ -675,10 +754,10 @@ async def test_circuit_target_circuit_temperature_number(
     assert state.attributes[ATTR_MAX] == 80
 
     # Set new state.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_set_value(hass, target_circuit_temperature_entity_id, 70)
 
-    mock_set_nowait.assert_called_once_with(target_circuit_temperature_key, 70)
+    mock_set.assert_awaited_once_with(target_circuit_temperature_key, 70)
     assert isinstance(state, State)
     assert state.state == "70.0"
 
@@ -734,10 +813,10 @@ async def test_circuit_minimum_circuit_temperature_number(
     assert state.attributes[ATTR_MAX] == 40
 
     # Set new state.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_set_value(hass, minimum_circuit_temperature_entity_id, 40)
 
-    mock_set_nowait.assert_called_once_with(minimum_circuit_temperature_key, 40)
+    mock_set.assert_awaited_once_with(minimum_circuit_temperature_key, 40)
     assert isinstance(state, State)
     assert state.state == "40.0"
 
@@ -793,10 +872,10 @@ async def test_circuit_maximum_circuit_temperature_number(
     assert state.attributes[ATTR_MAX] == 90
 
     # Set new state.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_set_value(hass, maximum_circuit_temperature_entity_id, 70)
 
-    mock_set_nowait.assert_called_once_with(maximum_circuit_temperature_key, 70)
+    mock_set.assert_awaited_once_with(maximum_circuit_temperature_key, 70)
     assert isinstance(state, State)
     assert state.state == "70.0"
 
@@ -852,12 +931,12 @@ async def test_circuit_day_target_circuit_temperature_number(
     assert state.attributes[ATTR_MAX] == 80
 
     # Set new state.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_set_value(
             hass, day_target_circuit_temperature_entity_id, 70
         )
 
-    mock_set_nowait.assert_called_once_with(day_target_circuit_temperature_key, 70)
+    mock_set.assert_awaited_once_with(day_target_circuit_temperature_key, 70)
     assert isinstance(state, State)
     assert state.state == "70.0"
 
@@ -913,12 +992,12 @@ async def test_circuit_night_target_circuit_temperature_number(
     assert state.attributes[ATTR_MAX] == 80
 
     # Set new state.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_set_value(
             hass, night_target_circuit_temperature_entity_id, 70
         )
 
-    mock_set_nowait.assert_called_once_with(night_target_circuit_temperature_key, 70)
+    mock_set.assert_awaited_once_with(night_target_circuit_temperature_key, 70)
     assert isinstance(state, State)
     assert state.state == "70.0"
 
@@ -1040,9 +1119,9 @@ async def test_custom_numbers(
     assert state.attributes[ATTR_MAX] == 80
 
     # Set new state.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_set_value(hass, entity_id, 40)
 
-    mock_set_nowait.assert_called_once_with(custom_number_key, 40)
+    mock_set.assert_awaited_once_with(custom_number_key, 40)
     assert isinstance(state, State)
     assert state.state == "40.0"
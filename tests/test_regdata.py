@@ -0,0 +1,40 @@
+"""Test Plum ecoMAX regulator data view."""
+
+from unittest.mock import AsyncMock
+
+from custom_components.plum_ecomax.regdata import RegdataView
+
+
+async def test_regdata_view(caplog) -> None:
+    """Test regulator data view."""
+    view = RegdataView()
+    slot = view.slot(9001)
+    assert view.slot(9001) == slot
+    assert view.slot(9000) == slot + 1
+    assert len(view) == 2
+    assert view.name(slot) == "9001"
+    assert not view.has_value(slot)
+    assert view.value(slot, default=0) == 0
+
+    # Test that only subscribed slots are dispatched.
+    callback = AsyncMock()
+    view.subscribe("9001", callback)
+    await view.async_update({9000: True, 9002: 1})
+    callback.assert_not_awaited()
+    assert view.value(slot + 1) is True
+
+    await view.async_update({9001: 45.0, 9000: False})
+    callback.assert_awaited_once_with(45.0)
+    assert view.has_value(slot)
+    assert view.value(slot) == 45.0
+
+    # Test that value is kept, when key is missing from the frame.
+    await view.async_update({})
+    assert view.value(slot) == 45.0
+    assert not view.data
+
+    # Test that listener errors are logged.
+    callback.side_effect = ValueError
+    await view.async_update({9001: 40.0})
+    assert "Error in regulator data listener" in caplog.text
+    assert view.value(slot) == 40.0
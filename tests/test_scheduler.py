@@ -0,0 +1,82 @@
+"""Test Plum ecoMAX outgoing frame scheduler."""
+
+from unittest.mock import Mock
+
+from pyplumio.const import DeviceType
+from pyplumio.frames import requests
+from pyplumio.protocol import AsyncProtocol
+import pytest
+
+from custom_components.plum_ecomax.scheduler import (
+    FramePriority,
+    FrameScheduler,
+    create_protocol,
+    get_scheduler,
+)
+
+
+async def test_scheduler() -> None:
+    """Test that frames are sent by priority and fairly."""
+    scheduler = FrameScheduler()
+    frames = {
+        "a1": requests.MixerParametersRequest(recipient=DeviceType.ECOMAX),
+        "a2": requests.MixerParametersRequest(recipient=DeviceType.ECOMAX),
+        "b1": requests.ThermostatParametersRequest(recipient=DeviceType.ECOMAX),
+        "s1": requests.SetScheduleRequest(recipient=DeviceType.ECOMAX),
+        "i1": requests.SetEcomaxParameterRequest(recipient=DeviceType.ECOMAX),
+    }
+    for frame in frames.values():
+        scheduler.put_nowait(frame)
+
+    assert scheduler.qsize() == 5
+    assert scheduler.as_dict()["background"]["pending"] == 3
+
+    # Background frame types are sent round-robin.
+    sent = []
+    while not scheduler.empty():
+        sent.append(scheduler.get_nowait())
+        scheduler.task_done()
+
+    assert sent == [frames[x] for x in ("i1", "s1", "a1", "b1", "a2")]
+    statistics = scheduler.as_dict()
+    assert statistics["interactive"]["sent"] == 1
+    assert statistics["service"]["sent"] == 1
+    assert statistics["background"]["sent"] == 3
+    assert statistics["background"]["pending"] == 0
+
+
+async def test_scheduler_get() -> None:
+    """Test that waiting writer receives the frame."""
+    scheduler = FrameScheduler()
+    frame = requests.SetEcomaxParameterRequest(recipient=DeviceType.ECOMAX)
+    scheduler.put_nowait(frame)
+    assert await scheduler.get() is frame
+    scheduler.task_done()
+    await scheduler.join()
+
+
+async def test_scheduler_cancel() -> None:
+    """Test cancelling pending frames."""
+    scheduler = FrameScheduler()
+    for _ in range(2):
+        scheduler.put_nowait(
+            requests.MixerParametersRequest(recipient=DeviceType.ECOMAX)
+        )
+
+    assert scheduler.cancel() == 2
+    assert scheduler.empty()
+    assert scheduler.statistics[FramePriority.BACKGROUND].cancelled == 2
+    assert scheduler.cancel() == 0
+    await scheduler.join()
+
+    with pytest.raises(IndexError):
+        scheduler._queue.popleft()
+
+
+async def test_create_protocol() -> None:
+    """Test creating the protocol with the scheduler."""
+    protocol = create_protocol()
+    assert isinstance(protocol, AsyncProtocol)
+    connection = Mock(protocol=protocol)
+    assert isinstance(get_scheduler(connection), FrameScheduler)
+    assert get_scheduler(Mock(protocol=AsyncProtocol())) is None
@@ -100,10 +100,10 @@ async def test_summer_mode_select(
     assert state.state == STATE_AUTO
 
     # Select an option.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_select_option(hass, summer_mode_entity_id, STATE_SUMMER)
 
-    mock_set_nowait.assert_called_once_with(
+    mock_set.assert_awaited_once_with(
         summer_mode_select_key, options.index(STATE_SUMMER)
     )
     assert isinstance(state, State)
@@ -155,10 +155,10 @@ async def test_mixer_work_mode_select(
     assert state.state == STATE_OFF
 
     # Select an option.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_select_option(hass, work_mode_entity_id, STATE_HEATING)
 
-    mock_set_nowait.assert_called_once_with(
+    mock_set.assert_awaited_once_with(
         work_mode_select_key, options.index(STATE_HEATING)
     )
     assert isinstance(state, State)
@@ -209,10 +209,10 @@ async def test_circuit_work_mode_select(
     assert state.state == STATE_OFF
 
     # Select an option.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_select_option(hass, work_mode_entity_id, STATE_HEATING)
 
-    mock_set_nowait.assert_called_once_with(
+    mock_set.assert_awaited_once_with(
         work_mode_select_key, options.index(STATE_HEATING)
     )
     assert isinstance(state, State)
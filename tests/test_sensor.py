@@ -1,5 +1,7 @@
 """Test the sensor platform."""
 
+from dataclasses import replace
+from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
@@ -15,10 +17,12 @@ from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
     EVENT_HOMEASSISTANT_START,
     PERCENTAGE,
+    STATE_UNAVAILABLE,
     Platform,
     UnitOfMass,
     UnitOfPower,
     UnitOfTemperature,
+    UnitOfTime,
 )
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import entity_registry as er
@@ -30,6 +34,7 @@ from pyplumio.structures.sensor_data import (
     ATTR_BOILER_POWER,
     ATTR_CURRENT_TEMP,
     ATTR_EXHAUST_TEMP,
+    ATTR_FAN,
     ATTR_FAN_POWER,
     ATTR_FEEDER_TEMP,
     ATTR_FIREPLACE_TEMP,
@@ -53,20 +58,32 @@ from pyplumio.structures.sensor_data import (
     ConnectedModules,
 )
 import pytest
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    mock_restore_cache_with_extra_data,
+)
 
 from custom_components.plum_ecomax.connection import EcomaxConnection
 from custom_components.plum_ecomax.const import (
+    ATTR_ECONOMY,
     ATTR_ENTITIES,
     ATTR_REGDATA,
     ATTR_VALUE,
+    CONF_ENABLED,
     DOMAIN,
     ModuleType,
 )
 from custom_components.plum_ecomax.sensor import (
     ATTR_BURNED_SINCE_LAST_UPDATE,
+    ATTR_CONFIDENCE,
+    ATTR_CONSUMPTION_RATE,
+    ATTR_LAST_RUN_TIME,
+    ATTR_MEAN_RUN_TIME,
     ATTR_NUMERIC_STATE,
+    ATTR_SAMPLES,
+    ATTR_WINDOW,
     DEVICE_CLASS_METER,
+    WINDOW_SENSOR_TYPES,
 )
 from custom_components.plum_ecomax.services import (
     SERVICE_CALIBRATE_METER,
@@ -180,6 +197,53 @@ async def test_heating_temperature_sensor_disabled(
     assert state is None
 
 
+@pytest.mark.usefixtures("ecomax_p")
+async def test_heating_temperature_window_sensors(
+    hass: HomeAssistant,
+    connection: EcomaxConnection,
+    config_entry: MockConfigEntry,
+    setup_config_entry,
+    frozen_time,
+) -> None:
+    """Test heating temperature rolling window sensors."""
+    with patch(
+        "custom_components.plum_ecomax.sensor.WINDOW_SENSOR_TYPES",
+        tuple(
+            replace(description, entity_registry_enabled_default=True)
+            for description in WINDOW_SENSOR_TYPES
+        ),
+    ):
+        await setup_config_entry()
+
+    mean_entity_id = "sensor.ecomax_heating_temperature_mean"
+    slope_entity_id = "sensor.ecomax_heating_temperature_trend"
+
+    # Check that sensors are unavailable without samples.
+    state = hass.states.get(mean_entity_id)
+    assert isinstance(state, State)
+    assert state.state == STATE_UNAVAILABLE
+
+    # Dispatch new values.
+    windows = config_entry.runtime_data.connection.windows
+    for timestamp, value in (("12:00:00", 60), ("12:01:00", 62), ("12:02:00", 64)):
+        frozen_time.move_to(timestamp)
+        windows.append(ATTR_HEATING_TEMP, value)
+
+    await dispatch_value(connection.device, ATTR_HEATING_TEMP, 64)
+    state = hass.states.get(mean_entity_id)
+    assert isinstance(state, State)
+    assert state.state == "62.0"
+    assert state.attributes[ATTR_UNIT_OF_MEASUREMENT] == UnitOfTemperature.CELSIUS
+    assert state.attributes[ATTR_SAMPLES] == 3
+    assert state.attributes[ATTR_WINDOW] == 15
+    assert hass.states.get("sensor.ecomax_heating_temperature_minimum").state == "60.0"
+    assert hass.states.get("sensor.ecomax_heating_temperature_maximum").state == "64.0"
+    state = hass.states.get(slope_entity_id)
+    assert isinstance(state, State)
+    assert float(state.state) == pytest.approx(2)
+    assert state.attributes[ATTR_UNIT_OF_MEASUREMENT] == "°C/min"
+
+
 @pytest.mark.usefixtures("ecomax_p", "water_heater")
 async def test_water_heater_temperature_sensor(
     hass: HomeAssistant, connection: EcomaxConnection, setup_config_entry, frozen_time
@@ -364,6 +428,97 @@ async def test_state_sensor(
     assert state.state == "unknown"
 
 
+@pytest.mark.usefixtures("ecomax_p")
+async def test_burner_cycle_sensors(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    setup_config_entry,
+    frozen_time,
+) -> None:
+    """Test burner cycle sensors."""
+    await setup_config_entry()
+    burner_starts_entity_id = "sensor.ecomax_burner_starts_today"
+    heating_time_entity_id = "sensor.ecomax_heating_time_today"
+
+    # Check entry.
+    entity_registry = er.async_get(hass)
+    entry = entity_registry.async_get(burner_starts_entity_id)
+    assert entry
+    assert entry.translation_key == "burner_starts_daily"
+    entry = entity_registry.async_get("sensor.ecomax_burner_starts_this_week")
+    assert isinstance(entry, RegistryEntry)
+    assert entry.disabled_by == er.RegistryEntryDisabler.INTEGRATION
+
+    # Get initial value.
+    state = hass.states.get(burner_starts_entity_id)
+    assert isinstance(state, State)
+    assert state.state == "0"
+    assert state.attributes[ATTR_FRIENDLY_NAME] == "ecoMAX Burner starts today"
+    assert state.attributes[ATTR_STATE_CLASS] == SensorStateClass.TOTAL_INCREASING
+    assert state.attributes[ATTR_MEAN_RUN_TIME] is None
+
+    # Track burner run.
+    cycles = config_entry.runtime_data.connection.cycles
+    await cycles.async_handle_state(DeviceState.OFF)
+    await cycles.async_handle_state(DeviceState.WORKING)
+    frozen_time.move_to("13:30:00")
+    await cycles.async_handle_state(DeviceState.OFF)
+    state = hass.states.get(burner_starts_entity_id)
+    assert isinstance(state, State)
+    assert state.state == "1"
+    assert state.attributes[ATTR_LAST_RUN_TIME] == 5400
+    assert state.attributes[ATTR_MEAN_RUN_TIME] == 5400
+    state = hass.states.get(heating_time_entity_id)
+    assert isinstance(state, State)
+    assert state.state == "1.5"
+    assert state.attributes[ATTR_UNIT_OF_MEASUREMENT] == UnitOfTime.HOURS
+    assert state.attributes[ATTR_DEVICE_CLASS] == SensorDeviceClass.DURATION
+    assert hass.states.get("sensor.ecomax_heating_time_total").state == "1.5"
+
+
+@pytest.mark.usefixtures("ecomax_p")
+async def test_fan_runtime_sensors(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    setup_config_entry,
+    frozen_time,
+) -> None:
+    """Test fan runtime sensors."""
+    await setup_config_entry()
+    fan_runtime_entity_id = "sensor.ecomax_fan_runtime"
+    fan_starts_entity_id = "sensor.ecomax_fan_starts"
+
+    # Check entry.
+    entity_registry = er.async_get(hass)
+    entry = entity_registry.async_get(fan_runtime_entity_id)
+    assert entry
+    assert entry.translation_key == "fan_runtime"
+    assert entry.disabled_by is None
+
+    # Get initial value.
+    state = hass.states.get(fan_runtime_entity_id)
+    assert isinstance(state, State)
+    assert state.state == "0.0"
+    assert state.attributes[ATTR_FRIENDLY_NAME] == "ecoMAX Fan runtime"
+    assert state.attributes[ATTR_UNIT_OF_MEASUREMENT] == UnitOfTime.HOURS
+    assert state.attributes[ATTR_DEVICE_CLASS] == SensorDeviceClass.DURATION
+    assert state.attributes[ATTR_STATE_CLASS] == SensorStateClass.TOTAL_INCREASING
+
+    # Dispatch fan events.
+    handler = config_entry.runtime_data.connection.runtimes.handler(ATTR_FAN)
+    await handler(False)
+    await handler(True)
+    frozen_time.move_to("12:30:00")
+    await handler(False)
+    state = hass.states.get(fan_runtime_entity_id)
+    assert isinstance(state, State)
+    assert state.state == "0.5"
+    state = hass.states.get(fan_starts_entity_id)
+    assert isinstance(state, State)
+    assert state.state == "1"
+    assert state.attributes[ATTR_FRIENDLY_NAME] == "ecoMAX Fan starts"
+
+
 @pytest.mark.usefixtures("ecomax_p")
 async def test_service_password_sensor(
     hass: HomeAssistant, connection: EcomaxConnection, setup_config_entry
@@ -533,6 +688,44 @@ async def test_fuel_level_sensor(
     assert state.state == "20"
 
 
+@pytest.mark.usefixtures("ecomax_p")
+async def test_fuel_depletion_sensor(
+    hass: HomeAssistant,
+    connection: EcomaxConnection,
+    config_entry: MockConfigEntry,
+    setup_config_entry,
+) -> None:
+    """Test fuel depletion forecast sensor."""
+    await setup_config_entry()
+    fuel_depletion_entity_id = "sensor.ecomax_time_until_fuel_runs_out"
+
+    # Check entry.
+    entity_registry = er.async_get(hass)
+    entry = entity_registry.async_get(fuel_depletion_entity_id)
+    assert entry
+    assert entry.translation_key == "fuel_depletion"
+
+    # Check that sensor is unavailable without samples.
+    state = hass.states.get(fuel_depletion_entity_id)
+    assert isinstance(state, State)
+    assert state.state == STATE_UNAVAILABLE
+
+    # Dispatch new value.
+    fuel_forecast = config_entry.runtime_data.connection.fuel_forecast
+    for hours in range(13):
+        fuel_forecast.append(hours * 3600, 50 - hours)
+
+    await dispatch_value(connection.device, ATTR_FUEL_LEVEL, 38)
+    state = hass.states.get(fuel_depletion_entity_id)
+    assert isinstance(state, State)
+    assert float(state.state) == pytest.approx(38)
+    assert state.attributes[ATTR_FRIENDLY_NAME] == "ecoMAX Time until fuel runs out"
+    assert state.attributes[ATTR_UNIT_OF_MEASUREMENT] == UnitOfTime.HOURS
+    assert state.attributes[ATTR_DEVICE_CLASS] == SensorDeviceClass.DURATION
+    assert state.attributes[ATTR_CONFIDENCE] == 100
+    assert state.attributes[ATTR_CONSUMPTION_RATE] == 1
+
+
 @pytest.mark.usefixtures("ecomax_p")
 async def test_fuel_consumption_sensor(
     hass: HomeAssistant, connection: EcomaxConnection, setup_config_entry, frozen_time
@@ -1114,6 +1307,80 @@ async def test_total_fuel_burned_sensor(
     assert state.state == "0.0"
 
 
+@pytest.mark.usefixtures("ecomax_p")
+async def test_total_fuel_burned_sensor_economy(
+    hass: HomeAssistant,
+    connection: EcomaxConnection,
+    config_entry: MockConfigEntry,
+    setup_config_entry,
+    frozen_time,
+) -> None:
+    """Test that total fuel burned sensor ignores the economy profile."""
+    await setup_config_entry({ATTR_ECONOMY: {CONF_ENABLED: True}})
+    fuel_burned_entity_id = "sensor.ecomax_total_fuel_burned"
+
+    # Dispatch small fuel deltas within the economy update interval.
+    await dispatch_value(connection.device, ATTR_FUEL_BURNED, 0.1)
+    frozen_time.move_to("12:00:30")
+    await dispatch_value(connection.device, ATTR_FUEL_BURNED, 0.2)
+    frozen_time.move_to("12:01:00")
+    await dispatch_value(connection.device, ATTR_FUEL_BURNED, 0.1)
+    state = hass.states.get(fuel_burned_entity_id)
+    assert isinstance(state, State)
+    assert state.state == "0.4"
+    suppressed_by_key = (
+        config_entry.runtime_data.connection.economy_statistics.suppressed_by_key
+    )
+    assert fuel_burned_entity_id not in suppressed_by_key
+
+
+@pytest.mark.parametrize(
+    ("checkpoint_last_updated", "expected_state"),
+    (
+        ("2012-12-12T12:00:01+00:00", "1.5"),
+        ("2012-12-12T11:59:59+00:00", "1.0"),
+    ),
+)
+@pytest.mark.usefixtures("ecomax_p", "connection", "frozen_time")
+async def test_total_fuel_burned_sensor_checkpoint(
+    checkpoint_last_updated: str,
+    expected_state: str,
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    setup_config_entry,
+) -> None:
+    """Test that total fuel burned sensor is restored from newer source."""
+    fuel_burned_entity_id = "sensor.ecomax_total_fuel_burned"
+    hass_storage["plum_ecomax.test.meters"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": "plum_ecomax.test.meters",
+        "data": {
+            "fuel_burned": {
+                "value": 1_500_000,
+                "last_updated": checkpoint_last_updated,
+            }
+        },
+    }
+    mock_restore_cache_with_extra_data(
+        hass,
+        (
+            (
+                State(fuel_burned_entity_id, "1.0"),
+                {
+                    "native_value": 1.0,
+                    "native_unit_of_measurement": UnitOfMass.KILOGRAMS,
+                },
+            ),
+        ),
+    )
+    await setup_config_entry()
+
+    state = hass.states.get(fuel_burned_entity_id)
+    assert isinstance(state, State)
+    assert state.state == expected_state
+
+
 @pytest.mark.parametrize(
     (
         "source_device",
@@ -1270,6 +1537,59 @@ async def test_custom_sensors_update_interval(
     assert state.state == "45.0"
 
 
+@pytest.mark.usefixtures("ecomax_p", "custom_fields")
+async def test_custom_sensors_hot_reload(
+    hass: HomeAssistant, config_entry: MockConfigEntry, setup_config_entry
+) -> None:
+    """Test applying custom sensor changes without reconnecting."""
+    await setup_config_entry()
+    connection = config_entry.runtime_data.connection
+    entity_id = "sensor.ecomax_test_custom_sensor"
+    assert hass.states.get(entity_id) is None
+
+    with patch(
+        "homeassistant.config_entries.ConfigEntries.async_schedule_reload"
+    ) as mock_async_schedule_reload:
+        # Test adding the custom sensor.
+        hass.config_entries.async_update_entry(
+            config_entry,
+            options={
+                ATTR_ENTITIES: {
+                    Platform.SENSOR: {
+                        "custom_sensor": {
+                            "name": "Test custom sensor",
+                            "key": "custom_sensor",
+                            "source_device": "ecomax",
+                        }
+                    }
+                }
+            },
+        )
+        await hass.async_block_till_done()
+        state = hass.states.get(entity_id)
+        assert isinstance(state, State)
+        assert state.state == "50.0"
+        assert er.async_get(hass).async_get(entity_id)
+
+        # Test removing the custom sensor.
+        hass.config_entries.async_update_entry(
+            config_entry, options={ATTR_ENTITIES: {Platform.SENSOR: {}}}
+        )
+        await hass.async_block_till_done()
+        assert hass.states.get(entity_id) is None
+        assert er.async_get(hass).async_get(entity_id) is None
+        mock_async_schedule_reload.assert_not_called()
+        assert config_entry.runtime_data.connection is connection
+
+        # Test that other options still reload the config entry.
+        hass.config_entries.async_update_entry(
+            config_entry,
+            options={ATTR_ENTITIES: {Platform.SENSOR: {}}, ATTR_ECONOMY: {}},
+        )
+        await hass.async_block_till_done()
+        mock_async_schedule_reload.assert_called_once_with(config_entry.entry_id)
+
+
 @pytest.mark.usefixtures("ecomax_p", "ecomax_860p3_o", "custom_fields")
 async def test_custom_regdata_sensors(
     hass: HomeAssistant, connection: EcomaxConnection, setup_config_entry
@@ -1,12 +1,15 @@
 """Test Plum ecoMAX services."""
 
+import logging
 from typing import Final, Literal
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import ANY, AsyncMock, Mock, patch
 
+from freezegun import freeze_time
 from homeassistant.const import ATTR_DEVICE_ID, ATTR_NAME
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
+from pyplumio.const import DeviceState
 from pyplumio.devices.ecomax import EcoMAX
 from pyplumio.devices.mixer import Mixer
 from pyplumio.parameters import Parameter
@@ -17,16 +20,21 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 from custom_components.plum_ecomax.connection import EcomaxConnection
 from custom_components.plum_ecomax.const import ATTR_VALUE, DOMAIN, WEEKDAYS
 from custom_components.plum_ecomax.services import (
+    ATTR_CLEAR,
     ATTR_END,
     ATTR_PRESET,
     ATTR_START,
     ATTR_TYPE,
     ATTR_WEEKDAYS,
+    ATTR_WINDOW,
     PRESET_DAY,
     PRESET_NIGHT,
     SCHEDULES,
+    SERVICE_GET_BURNER_CYCLES,
     SERVICE_GET_PARAMETER,
     SERVICE_GET_SCHEDULE,
+    SERVICE_GET_SLOW_CALLBACKS,
+    SERVICE_GET_WINDOW_STATISTICS,
     SERVICE_SET_PARAMETER,
     SERVICE_SET_SCHEDULE,
     DeviceId,
@@ -38,6 +46,10 @@ from custom_components.plum_ecomax.services import (
     async_suggest_device_parameter_name,
     async_validate_device_parameter,
 )
+from custom_components.plum_ecomax.watchdog import (
+    SLOW_CALLBACK_THRESHOLD,
+    async_get_watchdog,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -636,3 +648,152 @@ async def test_set_schedule_service(
         "schedule": "water_heater",
         "device": "mutableecomax",
     }
+
+
+@pytest.mark.usefixtures("ecomax_p", "connection")
+async def test_get_slow_callbacks_service(
+    hass: HomeAssistant, setup_config_entry, get_device_entries, caplog
+) -> None:
+    """Test get slow callbacks service."""
+    caplog.set_level(logging.DEBUG, logger="custom_components.plum_ecomax")
+    await setup_config_entry()
+    device_entries = get_device_entries()
+    watchdog = async_get_watchdog(hass)
+
+    # Test that service calls are measured.
+    with patch.object(watchdog, "record") as mock_record:
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_GET_PARAMETER,
+            {
+                ATTR_DEVICE_ID: device_entries[0].id,
+                ATTR_NAME: "heating_target_temp",
+            },
+            blocking=True,
+            return_response=True,
+        )
+
+    mock_record.assert_called_once_with(
+        f"{DOMAIN}.{SERVICE_GET_PARAMETER}", "heating_target_temp", ANY
+    )
+
+    # Test getting slow callbacks.
+    watchdog.record("sensor.ecomax_heating_temperature", "heating_temp", 0.25)
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_SLOW_CALLBACKS,
+        {ATTR_CLEAR: True},
+        blocking=True,
+        return_response=True,
+    )
+    assert response is not None
+    assert response["enabled"]
+    assert response["threshold"] == SLOW_CALLBACK_THRESHOLD
+    assert response["slow_callbacks"] == [
+        {
+            "name": "sensor.ecomax_heating_temperature",
+            "key": "heating_temp",
+            "duration": 0.25,
+            "timestamp": ANY,
+        }
+    ]
+    assert len(watchdog) == 0
+
+
+@pytest.mark.usefixtures("ecomax_p", "connection")
+async def test_get_window_statistics_service(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    setup_config_entry,
+    get_device_entries,
+) -> None:
+    """Test get window statistics service."""
+    await setup_config_entry()
+    device_entries = get_device_entries()
+
+    # Test getting statistics without samples.
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_WINDOW_STATISTICS,
+        {ATTR_DEVICE_ID: device_entries[0].id, ATTR_NAME: "heating_temp"},
+        blocking=True,
+        return_response=True,
+    )
+    assert response == {
+        "name": "heating_temp",
+        "window": 15,
+        "count": 0,
+        "min": None,
+        "max": None,
+        "mean": None,
+        "slope": None,
+    }
+
+    # Test getting statistics.
+    windows = config_entry.runtime_data.connection.windows
+    windows.append("heating_temp", 60)
+    windows.append("heating_temp", 64)
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_WINDOW_STATISTICS,
+        {
+            ATTR_DEVICE_ID: device_entries[0].id,
+            ATTR_NAME: "heating_temp",
+            ATTR_WINDOW: 5,
+        },
+        blocking=True,
+        return_response=True,
+    )
+    assert response
+    assert response["window"] == 5
+    assert response["count"] == 2
+    assert response["min"] == 60
+    assert response["max"] == 64
+    assert response["mean"] == 62
+
+    # Test getting statistics for an untracked sensor.
+    with pytest.raises(ServiceValidationError) as exc_info:
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_GET_WINDOW_STATISTICS,
+            {ATTR_DEVICE_ID: device_entries[0].id, ATTR_NAME: "fuel_level"},
+            blocking=True,
+            return_response=True,
+        )
+
+    assert exc_info.value.translation_key == "window_not_found"
+    assert exc_info.value.translation_placeholders["name"] == "fuel_level"
+
+
+@pytest.mark.usefixtures("ecomax_p", "connection")
+async def test_get_burner_cycles_service(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    setup_config_entry,
+    get_device_entries,
+) -> None:
+    """Test get burner cycles service."""
+    await setup_config_entry()
+    device_entries = get_device_entries()
+    cycles = config_entry.runtime_data.connection.cycles
+    with freeze_time("2012-12-12 12:00:00") as frozen_time:
+        await cycles.async_handle_state(DeviceState.OFF)
+        await cycles.async_handle_state(DeviceState.KINDLING)
+        frozen_time.move_to("12:05:00")
+        response = await hass.services.async_call(
+            DOMAIN,
+            SERVICE_GET_BURNER_CYCLES,
+            {ATTR_DEVICE_ID: device_entries[0].id},
+            blocking=True,
+            return_response=True,
+        )
+
+    assert response
+    assert response["state"] == "kindling"
+    assert response["last_run_time"] is None
+    periods = response["periods"]
+    assert isinstance(periods, dict)
+    assert set(periods) == {"daily", "weekly", "lifetime"}
+    assert periods["daily"]["starts"] == 1
+    assert periods["daily"]["mean_run_time"] is None
+    assert periods["lifetime"]["states"]["kindling"] == {"count": 1, "duration": 300}
@@ -0,0 +1,118 @@
+"""Test Plum ecoMAX storage."""
+
+from typing import Any
+from unittest.mock import patch
+
+from freezegun import freeze_time
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pyplumio.data_types import BitArray, UnsignedShort
+
+from custom_components.plum_ecomax.storage import (
+    MeterCheckpoint,
+    MeterStore,
+    RegdataSchemaStore,
+)
+
+STORAGE_KEY = "plum_ecomax.test.meters"
+
+
+async def test_meter_store(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Test meter store."""
+    store = MeterStore(hass, "test", save_delay=60, save_threshold=10_000)
+    await store.async_load()
+    assert store.get("fuel_burned") is None
+
+    # Test that small change is not written right away.
+    with freeze_time("2012-12-12 12:00:00"):
+        store.async_checkpoint("fuel_burned", 5_000)
+
+    await hass.async_block_till_done()
+    assert STORAGE_KEY not in hass_storage
+    assert store.get("fuel_burned") == MeterCheckpoint(
+        5_000, dt_util.parse_datetime("2012-12-12T12:00:00+00:00")
+    )
+
+    # Test that change over the threshold is written right away.
+    store.async_checkpoint("fuel_burned", 12_000)
+    await hass.async_block_till_done()
+    assert hass_storage[STORAGE_KEY]["data"]["fuel_burned"]["value"] == 12_000
+
+    # Test that forced checkpoint is written right away.
+    store.async_checkpoint("fuel_burned", 12_001, force=True)
+    await hass.async_block_till_done()
+    assert hass_storage[STORAGE_KEY]["data"]["fuel_burned"]["value"] == 12_001
+
+    # Test that pending delayed save is not rescheduled.
+    with patch.object(
+        store._store, "async_delay_save", wraps=store._store.async_delay_save
+    ) as mock_delay_save:
+        store.async_checkpoint("fuel_burned", 12_002)
+        store.async_checkpoint("fuel_burned", 12_003)
+
+    mock_delay_save.assert_called_once_with(store._data_to_save, 60)
+    await store.async_save()
+    assert hass_storage[STORAGE_KEY]["data"]["fuel_burned"]["value"] == 12_003
+
+    # Test loading checkpoints.
+    store2 = MeterStore(hass, "test")
+    await store2.async_load()
+    checkpoint = store2.get("fuel_burned")
+    assert checkpoint
+    assert checkpoint.value == 12_003
+
+    # Test removing the storage.
+    await store2.async_remove()
+    assert STORAGE_KEY not in hass_storage
+
+
+async def test_meter_store_malformed_checkpoint(
+    hass: HomeAssistant, hass_storage: dict[str, Any], caplog
+) -> None:
+    """Test meter store with malformed checkpoint."""
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": STORAGE_KEY,
+        "data": {"fuel_burned": {"value": 1, "last_updated": "invalid"}},
+    }
+    store = MeterStore(hass, "test")
+    await store.async_load()
+    assert store.get("fuel_burned") is None
+    assert "Ignoring malformed checkpoint for meter 'fuel_burned'" in caplog.text
+
+
+async def test_regdata_schema_store(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test regulator data schema store."""
+    store = RegdataSchemaStore(hass, "test")
+    assert await store.async_load("1-module_a:6.10.32.K1") is None
+
+    # Test saving the schema.
+    schema = [(1792, UnsignedShort()), (1024, BitArray()), (1025, BitArray())]
+    assert await store.async_save("1-module_a:6.10.32.K1", schema)
+    assert not await store.async_save("1-module_a:6.10.32.K1", schema)
+    assert hass_storage["plum_ecomax.test.regdata_schema"]["data"] == {
+        "key": "1-module_a:6.10.32.K1",
+        "schema": [[1792, 5], [1024, 10], [1025, 10]],
+    }
+
+    # Test loading the schema.
+    store2 = RegdataSchemaStore(hass, "test")
+    assert await store2.async_load("1-module_a:6.10.32.K1") == schema
+    assert await store2.async_load("1-module_a:7.0.0") is None
+
+    # Test loading malformed schema.
+    hass_storage["plum_ecomax.test.regdata_schema"]["data"]["schema"] = [[1, 255]]
+    assert (
+        await RegdataSchemaStore(hass, "test").async_load("1-module_a:6.10.32.K1")
+        is None
+    )
+
+    # Test loading schema without the key.
+    hass_storage["plum_ecomax.test.regdata_schema"]["data"] = {"schema": []}
+    assert (
+        await RegdataSchemaStore(hass, "test").async_load("1-module_a:6.10.32.K1")
+        is None
+    )
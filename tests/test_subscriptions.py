@@ -0,0 +1,41 @@
+"""Test Plum ecoMAX subscriptions."""
+
+from unittest.mock import AsyncMock
+
+from pyplumio.devices.ecomax import EcoMAX
+
+from custom_components.plum_ecomax.subscriptions import SubscriptionManager
+
+
+async def test_subscription_manager(ecomax_p: EcoMAX) -> None:
+    """Test subscription manager."""
+    manager = SubscriptionManager()
+    test_callback = AsyncMock(return_value=None)
+    test_callback2 = AsyncMock(return_value=None)
+    subscription = manager.subscribe("owner", ecomax_p, "test_event", test_callback)
+    manager.subscribe("owner", ecomax_p, "test_event", test_callback2, once=True)
+    manager.subscribe("owner2", ecomax_p, "test_event2", test_callback2, once=True)
+    assert len(manager) == 3
+    assert manager.count("owner") == 2
+
+    # Test that one-time subscription is discarded after the event.
+    await ecomax_p.dispatch("test_event", 1)
+    test_callback.assert_awaited_once_with(1)
+    test_callback2.assert_awaited_once_with(1)
+    assert manager.count("owner") == 1
+
+    # Test releasing the subscription by the handle.
+    assert subscription.release()
+    assert not subscription.active
+    assert not subscription.release()
+    await ecomax_p.dispatch("test_event", 2)
+    test_callback.assert_awaited_once_with(1)
+    assert manager.count("owner") == 0
+
+    # Test releasing all subscriptions of the owner, including
+    # one-time subscriptions that were never fired.
+    assert manager.release_all("owner2") == 1
+    assert manager.release_all("owner2") == 0
+    await ecomax_p.dispatch("test_event2", 3)
+    test_callback2.assert_awaited_once_with(1)
+    assert len(manager) == 0
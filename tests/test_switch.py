@@ -122,19 +122,19 @@ async def test_ecomax_control_switch(
     assert state.state == STATE_ON
 
     # Turn off.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_off(hass, controller_switch_entity_id)
 
     assert isinstance(state, State)
-    mock_set_nowait.assert_called_once_with(ATTR_ECOMAX_CONTROL, STATE_OFF)
+    mock_set.assert_awaited_once_with(ATTR_ECOMAX_CONTROL, STATE_OFF)
     assert state.state == STATE_OFF
 
     # Turn on.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_on(hass, controller_switch_entity_id)
 
     assert isinstance(state, State)
-    mock_set_nowait.assert_called_once_with(ATTR_ECOMAX_CONTROL, STATE_ON)
+    mock_set.assert_awaited_once_with(ATTR_ECOMAX_CONTROL, STATE_ON)
     assert state.state == STATE_ON
 
 
@@ -183,22 +183,18 @@ async def test_water_heater_disinfection_switch(
     assert state.state == STATE_ON
 
     # Turn off.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_off(hass, water_heater_disinfection_switch_entity_id)
 
-    mock_set_nowait.assert_called_once_with(
-        water_heater_disinfection_switch_key, STATE_OFF
-    )
+    mock_set.assert_awaited_once_with(water_heater_disinfection_switch_key, STATE_OFF)
     assert isinstance(state, State)
     assert state.state == STATE_OFF
 
     # Turn on.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_on(hass, water_heater_disinfection_switch_entity_id)
 
-    mock_set_nowait.assert_called_once_with(
-        water_heater_disinfection_switch_key, STATE_ON
-    )
+    mock_set.assert_awaited_once_with(water_heater_disinfection_switch_key, STATE_ON)
     assert isinstance(state, State)
     assert state.state == STATE_ON
 
@@ -243,18 +239,18 @@ async def test_water_heater_pump_switch(
     assert state.state == STATE_ON
 
     # Turn off.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_off(hass, water_heater_pump_switch_entity_id)
 
-    mock_set_nowait.assert_called_once_with(water_heater_pump_switch_key, 0)
+    mock_set.assert_awaited_once_with(water_heater_pump_switch_key, 0)
     assert isinstance(state, State)
     assert state.state == STATE_OFF
 
     # Turn on.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_on(hass, water_heater_pump_switch_entity_id)
 
-    mock_set_nowait.assert_called_once_with(water_heater_pump_switch_key, 2)
+    mock_set.assert_awaited_once_with(water_heater_pump_switch_key, 2)
     assert isinstance(state, State)
     assert state.state == STATE_ON
 
@@ -299,18 +295,18 @@ async def test_weather_control_switch(
     assert state.state == STATE_ON
 
     # Turn off.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_off(hass, weather_control_switch_entity_id)
 
-    mock_set_nowait.assert_called_once_with(weather_control_switch_key, STATE_OFF)
+    mock_set.assert_awaited_once_with(weather_control_switch_key, STATE_OFF)
     assert isinstance(state, State)
     assert state.state == STATE_OFF
 
     # Turn on.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_on(hass, weather_control_switch_entity_id)
 
-    mock_set_nowait.assert_called_once_with(weather_control_switch_key, STATE_ON)
+    mock_set.assert_awaited_once_with(weather_control_switch_key, STATE_ON)
     assert isinstance(state, State)
     assert state.state == STATE_ON
 
@@ -355,18 +351,18 @@ async def test_fuzzy_logic_switch(
     assert state.state == STATE_ON
 
     # Turn off.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_off(hass, fuzzy_logic_switch_entity_id)
 
-    mock_set_nowait.assert_called_once_with(fuzzy_logic_switch_key, STATE_OFF)
+    mock_set.assert_awaited_once_with(fuzzy_logic_switch_key, STATE_OFF)
     assert isinstance(state, State)
     assert state.state == STATE_OFF
 
     # Turn on.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_on(hass, fuzzy_logic_switch_entity_id)
 
-    mock_set_nowait.assert_called_once_with(fuzzy_logic_switch_key, STATE_ON)
+    mock_set.assert_awaited_once_with(fuzzy_logic_switch_key, STATE_ON)
     assert isinstance(state, State)
     assert state.state == STATE_ON
 
@@ -411,18 +407,18 @@ async def test_heating_schedule_switch(
     assert state.state == STATE_ON
 
     # Turn off.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_off(hass, heating_schedule_switch_entity_id)
 
-    mock_set_nowait.assert_called_once_with(heating_schedule_switch_key, STATE_OFF)
+    mock_set.assert_awaited_once_with(heating_schedule_switch_key, STATE_OFF)
     assert isinstance(state, State)
     assert state.state == STATE_OFF
 
     # Turn on.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_on(hass, heating_schedule_switch_entity_id)
 
-    mock_set_nowait.assert_called_once_with(heating_schedule_switch_key, STATE_ON)
+    mock_set.assert_awaited_once_with(heating_schedule_switch_key, STATE_ON)
     assert isinstance(state, State)
     assert state.state == STATE_ON
 
@@ -469,18 +465,18 @@ async def test_water_heater_schedule_switch(
     assert state.state == STATE_ON
 
     # Turn off.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_off(hass, water_heater_schedule_switch_entity_id)
 
-    mock_set_nowait.assert_called_once_with(water_heater_schedule_switch_key, STATE_OFF)
+    mock_set.assert_awaited_once_with(water_heater_schedule_switch_key, STATE_OFF)
     assert isinstance(state, State)
     assert state.state == STATE_OFF
 
     # Turn on.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_on(hass, water_heater_schedule_switch_entity_id)
 
-    mock_set_nowait.assert_called_once_with(water_heater_schedule_switch_key, STATE_ON)
+    mock_set.assert_awaited_once_with(water_heater_schedule_switch_key, STATE_ON)
     assert isinstance(state, State)
     assert state.state == STATE_ON
 
@@ -527,18 +523,18 @@ async def test_mixer_enable_in_summer_mode_switch(
     assert state.state == STATE_ON
 
     # Turn off.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_off(hass, enable_in_summer_mode_entity_id)
 
-    mock_set_nowait.assert_called_once_with(enable_in_summer_mode_key, STATE_OFF)
+    mock_set.assert_awaited_once_with(enable_in_summer_mode_key, STATE_OFF)
     assert isinstance(state, State)
     assert state.state == STATE_OFF
 
     # Turn on.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_on(hass, enable_in_summer_mode_entity_id)
 
-    mock_set_nowait.assert_called_once_with(enable_in_summer_mode_key, STATE_ON)
+    mock_set.assert_awaited_once_with(enable_in_summer_mode_key, STATE_ON)
     assert isinstance(state, State)
     assert state.state == STATE_ON
 
@@ -585,18 +581,18 @@ async def test_circuit_enable_in_summer_mode_switch(
     assert state.state == STATE_ON
 
     # Turn off.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_off(hass, enable_in_summer_mode_entity_id)
 
-    mock_set_nowait.assert_called_once_with(enable_in_summer_mode_key, STATE_OFF)
+    mock_set.assert_awaited_once_with(enable_in_summer_mode_key, STATE_OFF)
     assert isinstance(state, State)
     assert state.state == STATE_OFF
 
     # Turn on.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_on(hass, enable_in_summer_mode_entity_id)
 
-    mock_set_nowait.assert_called_once_with(enable_in_summer_mode_key, STATE_ON)
+    mock_set.assert_awaited_once_with(enable_in_summer_mode_key, STATE_ON)
     assert isinstance(state, State)
     assert state.state == STATE_ON
 
@@ -644,18 +640,18 @@ async def test_mixer_weather_control_switch(
     assert state.state == STATE_ON
 
     # Turn off.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_off(hass, mixer_weather_control_switch_entity_id)
 
-    mock_set_nowait.assert_called_once_with(mixer_weather_control_switch_key, STATE_OFF)
+    mock_set.assert_awaited_once_with(mixer_weather_control_switch_key, STATE_OFF)
     assert isinstance(state, State)
     assert state.state == STATE_OFF
 
     # Turn on.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_on(hass, mixer_weather_control_switch_entity_id)
 
-    mock_set_nowait.assert_called_once_with(mixer_weather_control_switch_key, STATE_ON)
+    mock_set.assert_awaited_once_with(mixer_weather_control_switch_key, STATE_ON)
     assert isinstance(state, State)
     assert state.state == STATE_ON
 
@@ -705,18 +701,18 @@ async def test_mixer_disable_pump_on_thermostat_switch(
     assert state.state == STATE_ON
 
     # Turn off.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_off(hass, disable_pump_on_thermostat_entity_id)
 
-    mock_set_nowait.assert_called_once_with(disable_pump_on_thermostat_key, STATE_OFF)
+    mock_set.assert_awaited_once_with(disable_pump_on_thermostat_key, STATE_OFF)
     assert isinstance(state, State)
     assert state.state == STATE_OFF
 
     # Turn on.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_on(hass, disable_pump_on_thermostat_entity_id)
 
-    mock_set_nowait.assert_called_once_with(disable_pump_on_thermostat_key, STATE_ON)
+    mock_set.assert_awaited_once_with(disable_pump_on_thermostat_key, STATE_ON)
     assert isinstance(state, State)
     assert state.state == STATE_ON
 
@@ -761,18 +757,18 @@ async def test_circuit_enable_circuit_switch(
     assert state.state == STATE_ON
 
     # Turn off.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_off(hass, enable_circuit_entity_id)
 
-    mock_set_nowait.assert_called_once_with(enable_circuit_key, 0)
+    mock_set.assert_awaited_once_with(enable_circuit_key, 0)
     assert isinstance(state, State)
     assert state.state == STATE_OFF
 
     # Turn on.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_on(hass, enable_circuit_entity_id)
 
-    mock_set_nowait.assert_called_once_with(enable_circuit_key, 1)
+    mock_set.assert_awaited_once_with(enable_circuit_key, 1)
     assert isinstance(state, State)
     assert state.state == STATE_ON
 
@@ -868,17 +864,17 @@ async def test_custom_switches(
     assert state.state == STATE_ON
 
     # Turn off.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_off(hass, entity_id)
 
-    mock_set_nowait.assert_called_once_with(custom_switch_key, STATE_OFF)
+    mock_set.assert_awaited_once_with(custom_switch_key, STATE_OFF)
     assert isinstance(state, State)
     assert state.state == STATE_OFF
 
     # Turn on.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_turn_on(hass, entity_id)
 
-    mock_set_nowait.assert_called_once_with(custom_switch_key, STATE_ON)
+    mock_set.assert_awaited_once_with(custom_switch_key, STATE_ON)
     assert isinstance(state, State)
     assert state.state == STATE_ON
@@ -107,11 +107,14 @@ async def test_system_health(
     ):
         info = await get_system_health_info(hass, DOMAIN)
 
+    assert info.pop("active_subscriptions") > 0
     assert info == (
         data
         | {
             "pyplumio_version": pyplumio_version,
             "failure_rate": expected_failure_rate,
             "custom_entities": 3,
+            "suppressed_updates": 0,
+            "suppressed_writes": 0,
         }
     )
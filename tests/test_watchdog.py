@@ -0,0 +1,137 @@
+"""Test Plum ecoMAX slow callback watchdog."""
+
+import asyncio
+import logging
+import time
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
+
+from homeassistant.core import HomeAssistant, ServiceCall
+import pytest
+
+from custom_components.plum_ecomax.const import DOMAIN
+from custom_components.plum_ecomax.watchdog import (
+    SlowCallbackWatchdog,
+    async_get_watchdog,
+)
+
+
+@pytest.fixture(name="debug_logging")
+def fixture_debug_logging(caplog) -> None:
+    """Enable debug logging for the integration."""
+    caplog.set_level(logging.DEBUG, logger="custom_components.plum_ecomax")
+
+
+@pytest.mark.usefixtures("debug_logging")
+async def test_watchdog() -> None:
+    """Test slow callback watchdog."""
+    watchdog = SlowCallbackWatchdog(threshold=0.1, history=2)
+    assert watchdog.enabled
+    assert not watchdog.record("sensor.test", "test", 0.05)
+    assert watchdog.record("sensor.test", "test1", 0.1)
+    assert watchdog.record("sensor.test", "test2", 0.2)
+    assert watchdog.record("sensor.test", "test3", 0.3)
+    records = watchdog.as_list()
+    assert len(watchdog) == 2
+    assert [(x["key"], x["duration"]) for x in records] == [
+        ("test2", 0.2),
+        ("test3", 0.3),
+    ]
+
+    watchdog.clear()
+    assert len(watchdog) == 0
+
+
+@pytest.mark.usefixtures("debug_logging")
+async def test_watchdog_wrap() -> None:
+    """Test wrapping the event callback."""
+    watchdog = SlowCallbackWatchdog()
+    handler = AsyncMock(return_value=True)
+    wrapped = watchdog.wrap("sensor.test", "heating_temp", handler)
+    with (
+        patch("time.perf_counter", side_effect=(1.0, 1.5)),
+        patch.object(watchdog, "record", wraps=watchdog.record) as mock_record,
+    ):
+        assert await wrapped(65)
+
+    handler.assert_awaited_once_with(65)
+    mock_record.assert_called_once_with("sensor.test", "heating_temp", 0.5)
+    assert watchdog.as_list()[0]["name"] == "sensor.test"
+
+    # Test that failed callbacks are still measured.
+    handler.side_effect = ValueError
+    with (
+        patch("time.perf_counter", side_effect=(2.0, 2.25)),
+        pytest.raises(ValueError),
+    ):
+        await wrapped(70)
+
+    assert len(watchdog) == 2
+
+
+@pytest.mark.usefixtures("debug_logging")
+async def test_watchdog_excludes_awaited_time() -> None:
+    """Test that only time spent holding the event loop is measured."""
+    watchdog = SlowCallbackWatchdog(threshold=0.1)
+
+    async def _async_wait_for_device(value: Any) -> Any:
+        """Pretend to wait for the device."""
+        await asyncio.sleep(0.2)
+        return value
+
+    async def _async_block(value: Any) -> Any:
+        """Block the event loop."""
+        time.sleep(0.15)
+        await asyncio.sleep(0)
+        return value
+
+    assert await watchdog.wrap("sensor.test", "io", _async_wait_for_device)(65) == 65
+    assert len(watchdog) == 0
+    assert await watchdog.wrap("sensor.test", "block", _async_block)(70) == 70
+    assert [x["key"] for x in watchdog.as_list()] == ["block"]
+
+    # Test that cancellation is passed to the callback.
+    task = asyncio.create_task(
+        watchdog.wrap("sensor.test", "io", _async_wait_for_device)(75)
+    )
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.usefixtures("debug_logging")
+async def test_watchdog_wrap_service() -> None:
+    """Test wrapping the service handler."""
+    watchdog = SlowCallbackWatchdog()
+    handler = AsyncMock(return_value={"value": 65})
+    wrapped = watchdog.wrap_service(handler, key="type")
+    service_call = Mock(spec=ServiceCall)
+    service_call.domain = DOMAIN
+    service_call.service = "get_schedule"
+    service_call.data = {"type": "heating"}
+    with patch("time.perf_counter", side_effect=(1.0, 1.2)):
+        assert await wrapped(service_call) == {"value": 65}
+
+    record = watchdog.as_list()[0]
+    assert record["name"] == f"{DOMAIN}.get_schedule"
+    assert record["key"] == "heating"
+
+
+async def test_watchdog_disabled(caplog) -> None:
+    """Test that watchdog does not measure without debug logging."""
+    caplog.set_level(logging.INFO, logger="custom_components.plum_ecomax")
+    watchdog = SlowCallbackWatchdog()
+    assert not watchdog.enabled
+    wrapped = watchdog.wrap("sensor.test", "heating_temp", AsyncMock())
+    with patch("time.perf_counter") as mock_perf_counter:
+        await wrapped(65)
+
+    mock_perf_counter.assert_not_called()
+    assert len(watchdog) == 0
+
+
+async def test_async_get_watchdog(hass: HomeAssistant) -> None:
+    """Test getting the watchdog."""
+    watchdog = async_get_watchdog(hass)
+    assert async_get_watchdog(hass) is watchdog
@@ -20,14 +20,24 @@ from homeassistant.components.water_heater import (
     STATE_PERFORMANCE,
     WaterHeaterEntityFeature,
 )
-from homeassistant.const import ATTR_ENTITY_ID, ATTR_FRIENDLY_NAME, STATE_OFF
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    ATTR_FRIENDLY_NAME,
+    EVENT_STATE_CHANGED,
+    STATE_OFF,
+)
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_registry import RegistryEntry
+from pyplumio.const import ATTR_SENSORS
 from pyplumio.parameters import ParameterValues
 from pyplumio.parameters.ecomax import EcomaxNumber, EcomaxNumberDescription
+from pyplumio.structures.ecomax_parameters import ATTR_ECOMAX_PARAMETERS
 import pytest
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+)
 
 from custom_components.plum_ecomax.connection import EcomaxConnection
 from custom_components.plum_ecomax.water_heater import HA_TO_EM_STATE
@@ -140,7 +150,9 @@ async def test_indirect_water_heater(
 
     # Dispatch new water heater temperature.
     frozen_time.move_to("12:00:10")
-    await connection.device.dispatch(water_heater_current_temperature_key, 51)
+    await connection.device.dispatch(
+        ATTR_SENSORS, {water_heater_current_temperature_key: 51}
+    )
     state = hass.states.get(indirect_water_heater_entity_id)
     assert isinstance(state, State)
     assert state.attributes[ATTR_CURRENT_TEMPERATURE] == 51
@@ -155,6 +167,7 @@ async def test_indirect_water_heater(
             description=EcomaxNumberDescription(water_heater_target_temperature_key),
         ),
     )
+    await connection.device.dispatch(ATTR_ECOMAX_PARAMETERS, [])
     state = hass.states.get(indirect_water_heater_entity_id)
     assert isinstance(state, State)
     assert state.attributes[ATTR_TARGET_TEMP_HIGH] == 55
@@ -169,6 +182,7 @@ async def test_indirect_water_heater(
             description=EcomaxNumberDescription(water_heater_operation_mode_key),
         ),
     )
+    await connection.device.dispatch(ATTR_ECOMAX_PARAMETERS, [])
     state = hass.states.get(indirect_water_heater_entity_id)
     assert isinstance(state, State)
     assert state.state == STATE_PERFORMANCE
@@ -183,27 +197,66 @@ async def test_indirect_water_heater(
             description=EcomaxNumberDescription(water_heater_hysteresis_key),
         ),
     )
+    await connection.device.dispatch(ATTR_ECOMAX_PARAMETERS, [])
     state = hass.states.get(indirect_water_heater_entity_id)
     assert isinstance(state, State)
     assert state.attributes[ATTR_TARGET_TEMP_LOW] == 45
 
+    # Test that parameters frame is written once.
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    await connection.device.load(
+        {
+            water_heater_target_temperature_key: EcomaxNumber(
+                device=connection.device,
+                values=ParameterValues(value=60, min_value=10, max_value=80),
+                description=EcomaxNumberDescription(
+                    water_heater_target_temperature_key
+                ),
+            ),
+            water_heater_operation_mode_key: EcomaxNumber(
+                device=connection.device,
+                values=ParameterValues(value=2, min_value=0, max_value=2),
+                description=EcomaxNumberDescription(water_heater_operation_mode_key),
+            ),
+            water_heater_hysteresis_key: EcomaxNumber(
+                device=connection.device,
+                values=ParameterValues(value=5, min_value=0, max_value=15),
+                description=EcomaxNumberDescription(water_heater_hysteresis_key),
+            ),
+        }
+    )
+    await hass.async_block_till_done()
+    assert not events
+    await connection.device.dispatch(ATTR_ECOMAX_PARAMETERS, [])
+    await hass.async_block_till_done()
+    assert len(events) == 1
+    state = events[0].data["new_state"]
+    assert state.state == STATE_ECO
+    assert state.attributes[ATTR_TARGET_TEMP_HIGH] == 60
+    assert state.attributes[ATTR_TARGET_TEMP_LOW] == 55
+
+    # Test that unchanged frame is not written.
+    await connection.device.dispatch(ATTR_ECOMAX_PARAMETERS, [])
+    await hass.async_block_till_done()
+    assert len(events) == 1
+
     # Test that water heater operation mode can be set.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_set_operation_mode(
             hass, indirect_water_heater_entity_id, STATE_ECO
         )
 
-    mock_set_nowait.assert_called_once_with(
+    mock_set.assert_awaited_once_with(
         water_heater_operation_mode_key, HA_TO_EM_STATE[STATE_ECO]
     )
     assert isinstance(state, State)
     assert state.state == STATE_ECO
 
     # Test that water heater temperature can be set.
-    with patch("pyplumio.devices.Device.set_nowait") as mock_set_nowait:
+    with patch("pyplumio.devices.Device.set", return_value=True) as mock_set:
         state = await async_set_temperature(hass, indirect_water_heater_entity_id, 60)
 
-    mock_set_nowait.assert_called_once_with(water_heater_target_temperature_key, 60)
+    mock_set.assert_awaited_once_with(water_heater_target_temperature_key, 60)
     assert isinstance(state, State)
     assert state.state == STATE_ECO
 
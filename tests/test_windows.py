@@ -0,0 +1,70 @@
+"""Test Plum ecoMAX rolling windows."""
+
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.plum_ecomax.windows import RollingWindow, RollingWindows
+
+
+def test_rolling_window() -> None:
+    """Test rolling window."""
+    window = RollingWindow(capacity=4)
+    assert window.statistics(now=0, duration=60) is None
+    for timestamp, value in ((0, 10), (60, 12), (120, 14)):
+        window.append(timestamp, value)
+
+    assert len(window) == 3
+    statistics = window.statistics(now=120, duration=300)
+    assert statistics
+    assert statistics.as_dict() == {
+        "count": 3,
+        "min": 10,
+        "max": 14,
+        "mean": 12,
+        "slope": 2,
+    }
+
+    # Test that only values within the duration are included.
+    statistics = window.statistics(now=120, duration=60)
+    assert statistics
+    assert statistics.count == 2
+    assert statistics.minimum == 12
+
+    # Test that oldest values are overwritten.
+    for timestamp, value in ((180, 20), (240, 22)):
+        window.append(timestamp, value)
+
+    assert len(window) == 4
+    statistics = window.statistics(now=240, duration=600)
+    assert statistics
+    assert statistics.count == 4
+    assert statistics.minimum == 12
+    assert statistics.maximum == 22
+
+    # Test a single value.
+    window = RollingWindow(capacity=4)
+    window.append(0, 20.5)
+    statistics = window.statistics(now=0, duration=60)
+    assert statistics
+    assert statistics.mean == pytest.approx(20.5)
+    assert statistics.slope == 0
+
+
+async def test_rolling_windows() -> None:
+    """Test rolling windows."""
+    windows = RollingWindows(keys=("heating_temp",), capacity=10)
+    handler = windows.handler("heating_temp")
+    with patch("time.monotonic", return_value=100):
+        await handler(65)
+        await handler(None)
+        await handler(True)
+
+    assert len(windows) == 1
+    with patch("time.monotonic", return_value=160):
+        statistics = windows.statistics("heating_temp", minutes=15)
+        assert windows.statistics("exhaust_temp", minutes=15) is None
+
+    assert statistics
+    assert statistics.count == 1
+    assert statistics.mean == 65
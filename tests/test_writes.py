@@ -0,0 +1,61 @@
+"""Test Plum ecoMAX acknowledged parameter writes."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from custom_components.plum_ecomax.writes import WriteStatistics, WriteTracker
+
+
+def test_write_statistics() -> None:
+    """Test write statistics."""
+    statistics = WriteStatistics()
+    assert statistics.mean_latency is None
+    statistics.record(True, 0.2)
+    statistics.record(True, 0.4)
+    statistics.record(False, 5)
+    assert statistics.as_dict() == {
+        "confirmed_writes": 2,
+        "failed_writes": 1,
+        "mean_latency": 0.3,
+        "max_latency": 0.4,
+        "last_latency": 0.4,
+    }
+
+
+async def test_write_tracker() -> None:
+    """Test write tracker."""
+    tracker = WriteTracker()
+    mock_device = Mock()
+    mock_device.set = AsyncMock(return_value=True)
+    assert await tracker.async_set(mock_device, "heating_target_temp", 70)
+    mock_device.set.assert_awaited_once_with("heating_target_temp", 70)
+    assert tracker.statistics.confirmed_writes == 1
+
+    # Test write that was rejected by the device.
+    mock_device.set = AsyncMock(return_value=False)
+    assert not await tracker.async_set(mock_device, "heating_target_temp", 70)
+    assert tracker.statistics.failed_writes == 1
+
+    # Test write that raised an error.
+    mock_device.set = AsyncMock(side_effect=ValueError("Invalid value"))
+    with pytest.raises(ValueError):
+        await tracker.async_set(mock_device, "heating_target_temp", 150)
+
+    assert tracker.statistics.failed_writes == 2
+
+
+async def test_write_tracker_timeout() -> None:
+    """Test write tracker deadline."""
+    tracker = WriteTracker(timeout=0.01)
+
+    async def _async_set(name: str, value: int) -> bool:
+        await asyncio.sleep(1)
+        return True
+
+    mock_device = Mock()
+    mock_device.set = _async_set
+    assert not await tracker.async_set(mock_device, "heating_target_temp", 70)
+    assert tracker.statistics.as_dict()["failed_writes"] == 1
+    assert tracker.statistics.confirmed_writes == 0